@@ -0,0 +1,80 @@
+"""Compare per-cell annotations with trace-level labels for large heatmaps.
+
+Run from the repository root:
+
+    python benchmarks/bench_heatmaps.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from visualizations.performance_plots import create_latency_heatmap  # noqa: E402
+
+GRIDS = [(10, 10), (100, 50), (500, 200)]
+# add_annotation re-validates the whole layout on every call, so the legacy
+# builder is quadratic in the cell count and only practical on small grids
+MAX_LEGACY_CELLS = 100
+
+
+def latency_frame(providers, regions, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Provider": np.repeat([f"Provider {i}" for i in range(providers)], regions),
+            "Region": np.tile([f"Region {j}" for j in range(regions)], providers),
+            "Latency (ms)": rng.normal(50, 10, providers * regions).round(2),
+        }
+    )
+
+
+def legacy_latency_heatmap(performance_data):
+    """The original builder: px.imshow plus one layout annotation per cell."""
+    latency_pivot = performance_data.pivot(
+        index="Provider", columns="Region", values="Latency (ms)"
+    )
+    fig = px.imshow(latency_pivot, color_continuous_scale="RdYlGn_r")
+    for i in range(len(latency_pivot.index)):
+        for j in range(len(latency_pivot.columns)):
+            fig.add_annotation(
+                text=f"{latency_pivot.iloc[i, j]:.1f}",
+                x=j,
+                y=i,
+                showarrow=False,
+                font=dict(color="white"),
+            )
+    return fig
+
+
+def measure(builder, data):
+    start = time.perf_counter()
+    fig = builder(data)
+    build_ms = (time.perf_counter() - start) * 1000
+    return build_ms, len(fig.to_json())
+
+
+def main():
+    print(f"{'grid':>9} {'builder':>8} {'build (ms)':>11} {'payload (KB)':>13}")
+    for providers, regions in GRIDS:
+        data = latency_frame(providers, regions)
+        builders = [("trace", create_latency_heatmap.__wrapped__)]
+        if providers * regions <= MAX_LEGACY_CELLS:
+            builders.insert(0, ("legacy", legacy_latency_heatmap))
+        for label, builder in builders:
+            build_ms, payload = measure(builder, data)
+            print(
+                f"{providers:>4}x{regions:<4} {label:>8} {build_ms:>11.1f} "
+                f"{payload / 1024:>13.1f}"
+            )
+        if providers * regions > MAX_LEGACY_CELLS:
+            print(f"{providers:>4}x{regions:<4} {'legacy':>8} {'skipped':>11}")
+
+
+if __name__ == "__main__":
+    main()
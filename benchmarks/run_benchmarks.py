@@ -0,0 +1,607 @@
+"""Offline benchmark suite for the data loaders and figure builders.
+
+Every case times the undecorated function (bypassing the data and figure
+caches) at one or more synthetic data sizes and records wall time and peak
+traced memory. Results can be saved as a baseline and later runs compared
+against it; the run exits non-zero when a case regresses past the threshold.
+
+Run from the repository root:
+
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --threshold 0.25
+    python benchmarks/run_benchmarks.py --quick --filter tco
+
+Baselines are machine-specific and not committed. CI benchmarks the base
+branch of a pull request on the same runner and compares against that.
+"""
+
+import sys
+import json
+import shutil
+import atexit
+import inspect
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+# Differences smaller than this are treated as timer noise
+NOISE_FLOOR_SECONDS = 0.002
+
+CASES = []
+
+
+def benchmark(name, sizes=(None,)):
+    """Register a setup function ``setup(size) -> zero-argument callable``."""
+
+    def decorator(setup):
+        CASES.append({"name": name, "sizes": list(sizes), "setup": setup})
+        return setup
+
+    return decorator
+
+
+def unwrap(func):
+    """Return the function underneath the cache and snapshot decorators.
+
+    Stops at ``@compact_dtypes`` so loaders are timed with their dtype
+    compaction, as the ingestion worker runs them.
+    """
+    from data.schema import is_compacting
+
+    return inspect.unwrap(func, stop=is_compacting)
+
+
+# --- Synthetic inputs -----------------------------------------------------
+
+REGIONS = ["North America", "Asia Pacific", "Europe"]
+
+
+def market_frame(providers, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Provider": [f"Provider {i}" for i in range(providers)],
+            "Market Share (%)": rng.uniform(0.5, 30, providers).round(1),
+            "Region": rng.choice(REGIONS, providers),
+            "YoY Growth (%)": rng.integers(5, 30, providers),
+        }
+    )
+
+
+def growth_frame(periods, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {"Date": pd.date_range("2015-01-01", periods=periods, freq="D")}
+    for region in REGIONS:
+        data[region] = np.cumsum(rng.normal(1, 0.2, periods))
+    return pd.DataFrame(data)
+
+
+def compliance_frame(requirements, seed=0):
+    rng = np.random.default_rng(seed)
+    symbols = np.array(["✅", "⚠️", "❌"])
+    data = {"Requirement": [f"Framework {i}" for i in range(requirements)]}
+    for column in ["US Providers", "EU Providers", "China Providers"]:
+        data[column] = symbols[rng.integers(0, 3, requirements)]
+    return pd.DataFrame(data)
+
+
+def security_frame(providers, seed=0):
+    rng = np.random.default_rng(seed)
+    certs = ["ISO 27001", "SOC 2", "FedRAMP", "HIPAA"]
+    return pd.DataFrame(
+        {
+            "Provider": [f"Vendor {i}" for i in range(providers)],
+            "Certifications": [
+                certs[: rng.integers(1, len(certs) + 1)] for _ in range(providers)
+            ],
+            "Risk Score": rng.integers(60, 100, providers),
+            "Last Audit": [
+                datetime(2025, 1, 1) - timedelta(days=int(d))
+                for d in rng.integers(0, 365, providers)
+            ],
+        }
+    )
+
+
+def residency_catalog(regions, seed=0):
+    """A catalog of ``regions`` regions spread over six continents."""
+    from data.residency_index import ResidencyCatalog
+
+    rng = np.random.default_rng(seed)
+    providers = [f"Provider {p}" for p in range(40)]
+    frameworks = ["GDPR", "HIPAA", "FedRAMP", "SOC 2", "ISO 27001", "PCI DSS"]
+    catalog = ResidencyCatalog()
+    for r in range(regions):
+        catalog.add_region(
+            f"region-{r}",
+            f"Continent {r % 6}",
+            rng.choice(providers, rng.integers(1, 8), replace=False),
+            rng.choice(frameworks, rng.integers(1, 4), replace=False),
+            lat=rng.uniform(-60, 70),
+            lon=rng.uniform(-180, 180),
+        )
+    return catalog
+
+
+def service_frame(services, providers=("AWS", "Azure", "GCP", "Alibaba", "Tencent")):
+    rng = np.random.default_rng(0)
+    data = {"Service": [f"Service {i}" for i in range(services)]}
+    for provider in providers:
+        data[provider] = rng.uniform(0.01, 0.2, services).round(4)
+    return pd.DataFrame(data)
+
+
+def sla_frame(services):
+    frame = service_frame(services).rename(columns={"Service": "Service Type"})
+    for provider in frame.columns[1:]:
+        frame[provider] = 99.9 + frame[provider] / 2.5
+    return frame
+
+
+def decision_inputs(count, seed=0):
+    rng = np.random.default_rng(seed)
+    industries = ["Tech", "Finance", "Healthcare", "Manufacturing", "Government"]
+    compliance = ["GDPR", "HIPAA", "FedRAMP", "PCI", "SOX", "ISO"]
+    tech = ["AI/ML", "Serverless", "Edge Computing", "Containers", "IoT", "Blockchain"]
+    return [
+        {
+            "industry": industries[rng.integers(len(industries))],
+            "region": ["North America", "Europe", "Asia", "Global"][rng.integers(4)],
+            "budget_constraint": ["Low", "Medium", "High"][rng.integers(3)],
+            "data_sovereignty": [
+                "No specific requirements",
+                "Prefer local storage",
+                "Must stay in country",
+            ][rng.integers(3)],
+            "compliance_needs": {k: bool(rng.integers(2)) for k in compliance},
+            "tech_requirements": {k: bool(rng.integers(2)) for k in tech},
+        }
+        for _ in range(count)
+    ]
+
+
+# (providers, regions, timestamps); the last size is one million rows
+PERFORMANCE_SIZES = [(5, 4, None), (60, 40, None), (20, 10, 500), (20, 10, 5_000)]
+
+
+def performance_frame(size):
+    from data.performance_data import generate_performance_metrics
+
+    providers, regions, timestamps = size
+    return generate_performance_metrics(providers, regions, timestamps, seed=0)
+
+
+def compact_performance_frame(size):
+    from data.schema import compact_frame
+
+    return compact_frame(performance_frame(size))
+
+
+def size_label(size):
+    if size is None:
+        return "default"
+    if isinstance(size, tuple):
+        return "x".join("1" if part is None else str(part) for part in size)
+    return str(size)
+
+
+# --- Data loaders ---------------------------------------------------------
+
+
+def _register_loaders():
+    from data import market_data, compliance_data, performance_data
+
+    for loader in [
+        market_data.get_market_share_data,
+        market_data.get_growth_trends_data,
+        market_data.get_regional_metrics,
+        market_data.get_key_metrics,
+    ]:
+        benchmark(loader.__name__, sizes=["Executive", "Manager", "Analyst"])(
+            lambda role, loader=loader: (lambda: unwrap(loader)(role))
+        )
+    for loader in [
+        market_data.get_market_dataset,
+        compliance_data.get_compliance_matrix,
+        compliance_data.get_security_certifications,
+        compliance_data.get_data_residency_map,
+        performance_data.get_performance_metrics,
+        performance_data.get_sla_comparisons,
+        performance_data.get_cost_analysis,
+    ]:
+        benchmark(loader.__name__)(lambda size, loader=loader: unwrap(loader))
+
+
+_register_loaders()
+
+
+@benchmark("calculate_tco")
+def bench_calculate_tco(size):
+    from data.performance_data import calculate_tco
+
+    profile = {"compute": 2.0, "storage": 1.5, "network": 0.8, "support": 1.0}
+    return lambda: calculate_tco(profile)
+
+
+@benchmark("simulate_tco", sizes=[100_000, 1_000_000])
+def bench_simulate_tco(size):
+    from data.performance_data import simulate_tco
+
+    profile = {"compute": 2.0, "storage": 1.5, "network": 0.8, "support": 1.0}
+    return lambda: simulate_tco(profile, size, seed=0)
+
+
+@benchmark("calculate_tco_batch", sizes=[1_000, 100_000])
+def bench_calculate_tco_batch(size):
+    from data.performance_data import calculate_tco_batch
+
+    profiles = np.random.default_rng(0).uniform(0.5, 5, (size, 4))
+    return lambda: calculate_tco_batch(profiles)
+
+
+@benchmark("generate_performance_metrics", sizes=[None, 24 * 30, 24 * 365])
+def bench_generate_performance_metrics(size):
+    from data.performance_data import generate_performance_metrics
+
+    return lambda: generate_performance_metrics(timestamps=size, seed=0)
+
+
+@benchmark("PerformanceStore.summarize", sizes=[24 * 30, 24 * 365 * 5])
+def bench_store_summarize(size):
+    from data.performance_data import iter_performance_metrics
+    from data.timeseries_store import build_store
+
+    workdir = tempfile.mkdtemp(prefix="bench-store-")
+    atexit.register(shutil.rmtree, workdir, True)
+    path = Path(workdir) / "perf"
+    store = build_store(str(path), iter_performance_metrics(timestamps=size, seed=0))
+    return lambda: store.summarize()
+
+
+@benchmark("calculate_recommendation_score", sizes=[100, 10_000])
+def bench_recommendation_score(size):
+    from components.decision_helper import calculate_recommendation_score
+
+    inputs = decision_inputs(size)
+    return lambda: [calculate_recommendation_score(i) for i in inputs]
+
+
+@benchmark("score_profiles", sizes=[10_000, 100_000])
+def bench_score_profiles(size):
+    from components.decision_helper import score_profiles
+
+    profiles = pd.json_normalize(decision_inputs(size))
+    profiles.columns = [c.split(".")[-1] for c in profiles.columns]
+    return lambda: score_profiles(profiles)
+
+
+@benchmark("ComplianceMatrix.satisfies", sizes=[1_000, 10_000])
+def bench_compliance_satisfies(size):
+    from data.compliance_index import ComplianceMatrix
+
+    rng = np.random.default_rng(0)
+    frameworks = [f"Framework {j}" for j in range(64)]
+    matrix = ComplianceMatrix(
+        [f"Vendor {i}" for i in range(size)],
+        frameworks,
+        rng.integers(0, 3, (size, len(frameworks))),
+    )
+    return lambda: [matrix.satisfies(frameworks[j : j + 3]) for j in range(0, 60, 3)]
+
+
+@benchmark("ResidencyCatalog.regions_for", sizes=[1_000, 10_000])
+def bench_residency_queries(size):
+    catalog = residency_catalog(size)
+    queries = [
+        dict(providers="Provider 1"),
+        dict(frameworks=["GDPR", "SOC 2"]),
+        dict(providers=["Provider 2", "Provider 3"], frameworks="HIPAA"),
+        dict(frameworks="FedRAMP", continents=["Continent 0", "Continent 1"]),
+    ]
+    return lambda: [catalog.regions_for(**query) for query in queries]
+
+
+@benchmark("DataCollector.collect", sizes=[100, 1_000])
+def bench_collector_round(size):
+    import asyncio
+
+    from data.collectors import DataCollector, StubMetricsServer
+
+    providers = [f"Provider {i}" for i in range(5)]
+    regions = [f"Region {i}" for i in range(size // len(providers))]
+
+    async def round_trip():
+        async with StubMetricsServer() as server:
+            collector = DataCollector(server.clients(providers, regions))
+            return await collector.collect()
+
+    return lambda: asyncio.run(round_trip())
+
+
+@benchmark("DatasetAPI.handle", sizes=["build", "cached", "304"])
+def bench_api_requests(size):
+    from data.api import DatasetAPI
+
+    api = DatasetAPI()
+    targets = [
+        "/api/v1/datasets/audit_history",
+        "/api/v1/datasets/cost_analysis?provider=AWS,GCP",
+        "/api/v1/datasets/market_share?role=Analyst&region=Europe",
+        "/api/v1/tco?compute=2",
+    ]
+    headers = {"Accept-Encoding": "gzip"}
+    etags = {t: api.handle("GET", t, headers)[1]["ETag"] for t in targets}
+    if size == "build":
+        return lambda: [DatasetAPI().handle("GET", t, headers) for t in targets]
+    if size == "304":
+        return lambda: [
+            api.handle("GET", t, {"If-None-Match": etags[t]}) for t in targets
+        ]
+    return lambda: [api.handle("GET", t, headers) for t in targets]
+
+
+# --- Figure builders ------------------------------------------------------
+
+
+def _builder(name, module, make_input, sizes):
+    def setup(size):
+        import importlib
+
+        func = unwrap(getattr(importlib.import_module(module), name))
+        data = make_input(size)
+        return lambda: func(data)
+
+    benchmark(name, sizes)(setup)
+
+
+_builder("create_market_share_treemap", "visualizations.plots", market_frame, [10, 500])
+_builder(
+    "create_growth_trends_line",
+    "visualizations.plots",
+    growth_frame,
+    [12, 3650, 36_500],
+)
+_builder(
+    "create_provider_comparison_radar", "visualizations.plots", market_frame, [10, 500]
+)
+_builder(
+    "create_compliance_heatmap",
+    "visualizations.compliance_plots",
+    compliance_frame,
+    [8, 200],
+)
+_builder(
+    "create_security_score_gauge",
+    "visualizations.compliance_plots",
+    security_frame,
+    [5, 500],
+)
+_builder(
+    "create_data_residency_map",
+    "visualizations.compliance_plots",
+    residency_catalog,
+    [9, 2_000, 20_000],
+)
+_builder(
+    "create_certification_timeline",
+    "visualizations.compliance_plots",
+    security_frame,
+    [5, 500],
+)
+
+
+@benchmark("create_certification_timeline+history", sizes=[50, 500])
+def bench_certification_history(size):
+    from visualizations.compliance_plots import create_certification_timeline
+
+    security = security_frame(size)
+    audits = 20
+    history = pd.DataFrame(
+        {
+            "Provider": np.repeat(security["Provider"].to_numpy(), audits),
+            "Audit Date": np.repeat(security["Last Audit"].to_numpy(), audits)
+            - np.tile(np.arange(audits), size) * np.timedelta64(91, "D"),
+            "Risk Score": np.repeat(security["Risk Score"].to_numpy(), audits),
+        }
+    )
+    builder = unwrap(create_certification_timeline)
+    return lambda: builder(security, history)
+
+
+_builder(
+    "create_performance_radar",
+    "visualizations.performance_plots",
+    performance_frame,
+    PERFORMANCE_SIZES,
+)
+_builder(
+    "create_latency_heatmap",
+    "visualizations.performance_plots",
+    performance_frame,
+    PERFORMANCE_SIZES,
+)
+
+
+def _compact_builder(name):
+    @benchmark(f"{name}+compact", sizes=PERFORMANCE_SIZES)
+    def setup(size):
+        from visualizations import performance_plots
+
+        func = unwrap(getattr(performance_plots, name))
+        data = compact_performance_frame(size)
+        return lambda: func(data)
+
+
+_compact_builder("create_performance_radar")
+_compact_builder("create_latency_heatmap")
+_builder(
+    "create_sla_comparison", "visualizations.performance_plots", sla_frame, [6, 200]
+)
+_builder(
+    "create_cost_comparison",
+    "visualizations.performance_plots",
+    service_frame,
+    [5, 200],
+)
+
+
+@benchmark("create_tco_analysis")
+def bench_create_tco_analysis(size):
+    from data.performance_data import calculate_tco
+    from visualizations.performance_plots import create_tco_analysis
+
+    tco = calculate_tco({"compute": 1, "storage": 1, "network": 1, "support": 1})
+    return lambda: unwrap(create_tco_analysis)(tco)
+
+
+# --- Runner ---------------------------------------------------------------
+
+
+def time_call(func, min_time=0.2, max_repeats=50):
+    """Return (median, min) seconds over repeated calls after one warm-up."""
+    func()
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < max_repeats and (
+        len(samples) < 3 or time.perf_counter() - started < min_time
+    ):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)), float(min(samples)), len(samples)
+
+
+def peak_memory(func):
+    """Return the peak traced allocation in bytes for a single call."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(name_filter=None, quick=False, verbose=True):
+    """Run the registered cases and return a results document."""
+    results = {}
+    for case in CASES:
+        if name_filter and name_filter not in case["name"]:
+            continue
+        sizes = case["sizes"][:1] if quick else case["sizes"]
+        for size in sizes:
+            key = f"{case['name']}[{size_label(size)}]"
+            func = case["setup"](size)
+            median, fastest, repeats = time_call(func)
+            results[key] = {
+                "seconds": median,
+                "min_seconds": fastest,
+                "repeats": repeats,
+                "peak_bytes": peak_memory(func),
+            }
+            if verbose:
+                print(
+                    f"{key:<60} {median * 1000:>10.2f} ms "
+                    f"{results[key]['peak_bytes'] / 1024:>10.1f} KB"
+                )
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=0.25, memory_threshold=0.5):
+    """Return a list of regression descriptions versus a baseline document."""
+    regressions = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        # The fastest run is far less sensitive to a busy machine than the median
+        now = result.get("min_seconds", result["seconds"])
+        before = base.get("min_seconds", base["seconds"])
+        if now > before * (1 + threshold) and now - before > NOISE_FLOOR_SECONDS:
+            regressions.append(
+                f"{key}: {before * 1000:.2f} ms -> {now * 1000:.2f} ms "
+                f"(+{now / before - 1:.0%})"
+            )
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + memory_threshold) and (
+            result["peak_bytes"] - base["peak_bytes"] > 64 * 1024
+        ):
+            regressions.append(
+                f"{key}: peak memory {base['peak_bytes'] / 1024:.0f} KB -> "
+                f"{result['peak_bytes'] / 1024:.0f} KB"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="write results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown before failing (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.5,
+        help="allowed peak-memory growth before failing",
+    )
+    parser.add_argument(
+        "--require-baseline",
+        action="store_true",
+        help="fail instead of passing when the baseline file is missing",
+    )
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument(
+        "--quick", action="store_true", help="only the smallest size of each case"
+    )
+    parser.add_argument("--output", type=Path, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    current = run(args.filter, args.quick)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2))
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 2 if args.require_baseline else 0
+
+    regressions = compare(
+        current,
+        json.loads(args.baseline.read_text()),
+        args.threshold,
+        args.memory_threshold,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        return 1
+    print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""Serve the dashboard datasets over HTTP as JSON or Arrow.
+
+Run from the repository root:
+
+    python scripts/api_server.py --port 8502
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from data.api import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Refresh dashboard datasets on a schedule and publish snapshots.
+
+Run from the repository root:
+
+    python scripts/ingest_worker.py --interval 300
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from data.ingest import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
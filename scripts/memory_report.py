@@ -0,0 +1,16 @@
+"""Report dataset memory before and after dtype compaction.
+
+Run from the repository root:
+
+    python scripts/memory_report.py --performance-hours 50000
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from data.schema import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
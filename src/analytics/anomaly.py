@@ -0,0 +1,284 @@
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Points each detector learns from before it may flag: a year of monthly
+# periods, so a handful of noisy points cannot pass for a stable baseline
+DEFAULT_WARMUP = 12
+# Spread floor relative to the series level, so near-constant series are not
+# scored against a numerically zero deviation
+RELATIVE_MIN_STD = 1e-3
+
+
+def _std_floor(mean, min_std, relative_min_std):
+    return np.maximum(min_std, relative_min_std * np.abs(mean))
+
+
+class EWMADetector:
+    """Flag points far from an exponentially weighted mean and variance.
+
+    State is one mean, variance and count per series, so each update is O(1)
+    per series regardless of how much history has been seen.
+    """
+
+    name = "EWMA"
+
+    def __init__(
+        self,
+        n_series,
+        alpha=0.15,
+        threshold=3.0,
+        warmup=DEFAULT_WARMUP,
+        min_std=1e-6,
+        relative_min_std=RELATIVE_MIN_STD,
+    ):
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_std = min_std
+        self.relative_min_std = relative_min_std
+        self.mean = np.zeros(n_series)
+        self.var = np.zeros(n_series)
+        self.count = np.zeros(n_series, dtype=np.int64)
+
+    def update(self, x):
+        """Score one value per series; returns ``(scores, flags)``."""
+        valid = np.isfinite(x)
+        first = valid & (self.count == 0)
+        self.mean[first] = x[first]
+
+        diff = np.where(valid, x - self.mean, 0.0)
+        floor = _std_floor(self.mean, self.min_std, self.relative_min_std)
+        scores = diff / np.maximum(np.sqrt(self.var), floor)
+        flags = valid & (self.count >= self.warmup) & (np.abs(scores) > self.threshold)
+
+        step = np.where(valid & ~first, self.alpha * diff, 0.0)
+        self.mean += step
+        self.var = np.where(
+            valid & ~first, (1 - self.alpha) * (self.var + diff * step), self.var
+        )
+        self.count += valid
+        return scores, flags
+
+
+class RollingZScoreDetector:
+    """Flag points more than ``threshold`` deviations from a rolling window.
+
+    Keeps a ring buffer of ``window`` values plus running sums, so an update
+    costs O(1) per series and memory is fixed by the window size.
+    """
+
+    name = "Rolling z-score"
+
+    def __init__(
+        self,
+        n_series,
+        window=DEFAULT_WARMUP,
+        threshold=3.0,
+        warmup=None,
+        min_std=1e-6,
+        relative_min_std=RELATIVE_MIN_STD,
+    ):
+        self.window = window
+        self.threshold = threshold
+        # Score only against a full window by default
+        self.warmup = window if warmup is None else warmup
+        self.min_std = min_std
+        self.relative_min_std = relative_min_std
+        self.buffer = np.zeros((window, n_series))
+        self.position = np.zeros(n_series, dtype=np.int64)
+        self.count = np.zeros(n_series, dtype=np.int64)
+        self.sums = np.zeros(n_series)
+        self.sumsq = np.zeros(n_series)
+        self._columns = np.arange(n_series)
+
+    def update(self, x):
+        """Score one value per series; returns ``(scores, flags)``."""
+        valid = np.isfinite(x)
+        n = np.minimum(self.count, self.window)
+        mean = np.divide(self.sums, n, out=np.zeros_like(self.sums), where=n > 0)
+        var = np.divide(self.sumsq, n, out=np.zeros_like(self.sums), where=n > 0)
+        floor = _std_floor(mean, self.min_std, self.relative_min_std)
+        std = np.maximum(np.sqrt(np.maximum(var - mean**2, 0.0)), floor)
+        diff = np.where(valid & (n > 0), x - mean, 0.0)
+        scores = diff / std
+        flags = valid & (n >= self.warmup) & (np.abs(scores) > self.threshold)
+
+        cols = self._columns[valid]
+        pos = self.position[valid]
+        old = np.where(self.count[valid] >= self.window, self.buffer[pos, cols], 0.0)
+        self.sums[valid] += x[valid] - old
+        self.sumsq[valid] += x[valid] ** 2 - old**2
+        self.buffer[pos, cols] = x[valid]
+        self.position[valid] = (pos + 1) % self.window
+        self.count += valid
+        return scores, flags
+
+
+class CUSUMDetector:
+    """Two-sided CUSUM for sustained shifts away from the running mean.
+
+    Deviations are standardized with a running (Welford) mean and variance;
+    ``drift`` and ``threshold`` are in standard deviations. Sums reset after
+    an alarm.
+    """
+
+    name = "CUSUM"
+
+    def __init__(
+        self,
+        n_series,
+        drift=0.5,
+        threshold=4.0,
+        warmup=DEFAULT_WARMUP,
+        min_std=1e-6,
+        relative_min_std=RELATIVE_MIN_STD,
+    ):
+        self.drift = drift
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_std = min_std
+        self.relative_min_std = relative_min_std
+        self.mean = np.zeros(n_series)
+        self.m2 = np.zeros(n_series)
+        self.count = np.zeros(n_series, dtype=np.int64)
+        self.upper = np.zeros(n_series)
+        self.lower = np.zeros(n_series)
+
+    def update(self, x):
+        """Score one value per series; returns ``(scores, flags)``."""
+        valid = np.isfinite(x)
+        ready = valid & (self.count >= self.warmup)
+        var = np.divide(
+            self.m2, self.count - 1, out=np.zeros_like(self.m2), where=self.count > 1
+        )
+        std = np.maximum(
+            np.sqrt(var), _std_floor(self.mean, self.min_std, self.relative_min_std)
+        )
+        z = np.where(ready, (x - self.mean) / std, 0.0)
+        self.upper = np.where(ready, np.maximum(0.0, self.upper + z - self.drift), 0.0)
+        self.lower = np.where(ready, np.maximum(0.0, self.lower - z - self.drift), 0.0)
+        scores = np.where(self.upper >= self.lower, self.upper, -self.lower)
+        flags = ready & (np.abs(scores) > self.threshold)
+        self.upper[flags] = 0.0
+        self.lower[flags] = 0.0
+
+        # Welford update of the reference mean and variance
+        self.count += valid
+        delta = np.where(valid, x - self.mean, 0.0)
+        self.mean += np.divide(delta, self.count, out=np.zeros_like(delta), where=valid)
+        self.m2 += np.where(valid, delta * (x - self.mean), 0.0)
+        return scores, flags
+
+
+def default_detectors(n_series):
+    """EWMA, rolling z-score and CUSUM detectors with dashboard defaults."""
+    return [
+        EWMADetector(n_series),
+        RollingZScoreDetector(n_series),
+        CUSUMDetector(n_series),
+    ]
+
+
+class StreamingAnomalyMonitor:
+    """Run several incremental detectors across a set of series at once.
+
+    Each call to ``update`` takes one new value per series. With
+    ``difference=True`` detectors see the period-over-period change, which
+    suits cumulative series such as market growth. Events are dicts with
+    detector, series, timestamp, value, change, score, direction and
+    message keys; the most recent ``max_events`` are kept in ``events``.
+    """
+
+    def __init__(self, series, detectors=None, difference=True, max_events=200):
+        self.series = list(series)
+        self.detectors = (
+            detectors if detectors is not None else default_detectors(len(self.series))
+        )
+        self.difference = difference
+        self.previous = None
+        self.last_timestamp = None
+        self.points = 0
+        self.events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+
+    def update(self, values, timestamp=None):
+        """Feed one value per series and return any new anomaly events."""
+        values = np.asarray(values, dtype=np.float64)
+        self.points += 1
+        self.last_timestamp = timestamp
+        if self.difference:
+            previous, self.previous = self.previous, values
+            if previous is None:
+                return []
+            signal = values - previous
+        else:
+            signal = values
+
+        new_events = []
+        for detector in self.detectors:
+            scores, flags = detector.update(signal)
+            for i in np.flatnonzero(flags):
+                new_events.append(
+                    self._event(detector, i, timestamp, values[i], signal[i], scores[i])
+                )
+        self.events.extend(new_events)
+        return new_events
+
+    def _event(self, detector, i, timestamp, value, change, score):
+        direction = "spike" if score > 0 else "drop"
+        when = (
+            f" on {pd.Timestamp(timestamp):%Y-%m-%d}" if timestamp is not None else ""
+        )
+        quantity = "change" if self.difference else "value"
+        return {
+            "detector": detector.name,
+            "series": self.series[i],
+            "timestamp": timestamp,
+            "value": float(value),
+            "change": float(change),
+            "score": float(score),
+            "direction": direction,
+            "message": (
+                f"{detector.name}: {direction} in {self.series[i]}{when} "
+                f"({quantity} {change if self.difference else value:+.2f}, "
+                f"score {score:+.1f})"
+            ),
+        }
+
+    def consume(self, frame, time_column="Date"):
+        """Feed only the rows of a time-sorted frame newer than the last update."""
+        with self._lock:
+            times = frame[time_column]
+            start = 0
+            if self.last_timestamp is not None:
+                start = int(times.searchsorted(self.last_timestamp, side="right"))
+            new_rows = frame.iloc[start:]
+            values = new_rows[self.series].to_numpy(dtype=np.float64)
+            events = []
+            for timestamp, row in zip(new_rows[time_column], values):
+                events.extend(self.update(row, timestamp))
+            return events
+
+    def recent_events(self, limit=5):
+        """Return the latest events, newest first."""
+        return list(self.events)[::-1][:limit]
+
+
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def monitor_for(key, series, **kwargs):
+    """Return the process-wide monitor for ``key``, creating it if needed.
+
+    A monitor whose series no longer match is replaced.
+    """
+    with _monitors_lock:
+        monitor = _monitors.get(key)
+        if monitor is None or monitor.series != list(series):
+            monitor = StreamingAnomalyMonitor(series, **kwargs)
+            _monitors[key] = monitor
+        return monitor
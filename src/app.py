@@ -1,53 +1,14 @@
+import os
+import sys
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import streamlit as st
-from datetime import datetime
-import numpy as np
-
-# Import custom modules
-from data.market_data import (
-    get_market_share_data,
-    get_growth_trends_data,
-    get_regional_metrics,
-    get_key_metrics,
-)
-from data.compliance_data import (
-    get_compliance_matrix,
-    get_security_certifications,
-    get_data_residency_map,
-)
-from data.performance_data import (
-    get_performance_metrics,
-    get_sla_comparisons,
-    get_cost_analysis,
-    calculate_tco,
-)
-from visualizations.plots import (
-    create_market_share_treemap,
-    create_growth_trends_line,
-    create_provider_comparison_radar,
-)
-from visualizations.compliance_plots import (
-    create_compliance_heatmap,
-    create_security_score_gauge,
-    create_data_residency_map,
-    create_certification_timeline,
-)
-from visualizations.performance_plots import (
-    create_performance_radar,
-    create_latency_heatmap,
-    create_sla_comparison,
-    create_cost_comparison,
-    create_tco_analysis,
-)
-from components.metrics import (
-    display_key_metrics,
-    display_regional_metrics,
-    display_sidebar_navigation,
-)
-from components.decision_helper import display_decision_helper
-from components.platform_comparisons import display_platform_comparisons
-from components.learning_resources import display_learning_resources
-from components.future_trends import display_future_trends
-from utils.helpers import filter_data_by_regions, get_time_range_dates
+
+from page_registry import registry
+from components.metrics import display_sidebar_navigation
+from utils.instrumentation import instrument_module, metrics, write_metrics_file
 
 # Set up Streamlit page configuration
 st.set_page_config(
@@ -57,287 +18,597 @@ st.set_page_config(
 )
 
 
-def main():
-    # User Role Selector
-    st.sidebar.markdown("## User Role")
-    user_role = st.sidebar.selectbox(
-        "Select your role:",
-        ["Executive", "Manager", "Analyst"],
-        index=0,
-        help="Choose a role to customize the dashboard view.",
+def plotly_chart(figure, **kwargs):
+    """``st.plotly_chart``, timed separately from building the figure."""
+    with metrics.timer("st.plotly_chart", kind="render"):
+        return st.plotly_chart(figure, **kwargs)
+
+
+def display_export_button(label, frame, file_stem, key, index=False):
+    """Offer a download of ``frame`` that is only serialized when clicked."""
+    from data.exports import EXPORT_FORMATS, export_filename, lazy_export
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox(
+            "Export format",
+            list(EXPORT_FORMATS),
+            format_func=lambda f: EXPORT_FORMATS[f]["label"],
+            key=f"{key}_format",
+            label_visibility="collapsed",
+        )
+    with col2:
+        st.download_button(
+            label,
+            lazy_export(frame, fmt, index=index),
+            file_name=export_filename(file_stem, fmt),
+            mime=EXPORT_FORMATS[fmt]["mime"],
+            key=key,
+        )
+
+
+# Each page imports its data, visualization and component modules on first
+# open (see page_registry), so startup only pays for Streamlit and the sidebar.
+
+
+@registry.page(
+    "Home", modules=["data.market_data", "components.metrics", "analytics.anomaly"]
+)
+def render_home(user_role, selected_regions, time_range, selected_provider):
+    """Render the Home page with role-based KPIs and AI insights."""
+    import numpy as np
+    from data.market_data import (
+        get_market_share_data,
+        get_growth_trends_data,
+        get_regional_metrics,
+        get_key_metrics,
     )
+    from components.metrics import display_key_metrics, display_regional_metrics
+    from analytics.anomaly import monitor_for
+
+    st.title("🌐 Global AI & Cloud Intelligence Dashboard")
+    key_metrics = get_key_metrics(user_role)
+    regional_metrics = get_regional_metrics(user_role)
+    display_key_metrics(key_metrics["data"])
+    display_regional_metrics(regional_metrics["data"])
+    market_share = get_market_share_data(user_role)
+    # Show role-based insights
+    if user_role == "Executive":
+        st.info(key_metrics.get("kpi_summary", ""))
+        st.success(market_share.get("top_opportunity", ""))
+        st.warning(market_share.get("key_risk", ""))
+    elif user_role == "Manager":
+        st.info(key_metrics.get("kpi_alert", ""))
+        st.info(market_share.get("regional_alert", ""))
+        st.write(
+            "**Provider Comparison:**",
+            market_share.get("provider_comparison", {}),
+        )
+    elif user_role == "Analyst":
+        st.info(key_metrics.get("advanced_insights", ""))
+        st.write(market_share.get("advanced_insights", ""))
+        display_export_button(
+            "Download Market Data", market_share["data"], "market_data", "home_market"
+        )
 
-    # Get navigation and filter selections (now includes provider)
-    page, selected_regions, time_range, selected_provider = display_sidebar_navigation()
+    st.markdown("""
+    ## Strategic Intelligence Platform for Government & Enterprise
+
+    This dashboard provides comprehensive insights into the global AI and cloud computing landscape, 
+    enabling data-driven decision making for government agencies and enterprises.
+
+    ### Key Features:
+    - 📊 **Real-time Market Intelligence**: Track global market movements and competitive dynamics
+    - 🛡️ **Security & Compliance**: Monitor regulatory compliance and security standards
+    - 💰 **Cost Analysis**: Compare pricing and calculate TCO across providers
+    - ⚡ **Performance Metrics**: Track real-time performance and reliability metrics
+    - 🤖 **Decision Support**: AI-powered recommendations for strategic planning
+    """)
+
+    # --- AI Insights Panel ---
+    st.markdown("---")
+    st.subheader("🤖 AI Insights")
+    st.info(
+        "Automated trends, anomalies, and predictive analytics for enterprise decision-making."
+    )
 
-    # Home Page
-    if page == "Home":
-        st.title("🌐 Global AI & Cloud Intelligence Dashboard")
-        key_metrics = get_key_metrics(user_role)
-        regional_metrics = get_regional_metrics(user_role)
-        display_key_metrics(key_metrics["data"])
-        display_regional_metrics(regional_metrics["data"])
+    # Example: Trend detection on market growth
+    try:
+        growth_trends = get_growth_trends_data(user_role)
+        growth_data = growth_trends["data"]
+        st.caption(growth_trends.get("trend_summary", ""))
+        # Simple trend: compare last and first value
+        if len(growth_data) > 1:
+            first = growth_data.iloc[0][1:].mean()
+            last = growth_data.iloc[-1][1:].mean()
+            trend = "increasing" if last > first else "decreasing"
+            st.write(
+                f"**Market growth trend:** {trend.title()} ({first:.2f}% → {last:.2f}%)"
+            )
+        # Incremental anomaly detection: only rows newer than the last
+        # render are fed to the detectors
+        series = list(growth_data.select_dtypes(include=[np.number]).columns)
+        monitor = monitor_for(("growth_trends", user_role), series)
+        monitor.consume(growth_data, time_column="Date")
+        events = monitor.recent_events(limit=5)
+        for event in events:
+            st.warning(event["message"])
+        if not events:
+            st.success(
+                f"No anomalies detected across {len(series)} regions "
+                f"({monitor.points} periods monitored)."
+            )
+    except Exception as e:
+        st.write("AI Insights unavailable: ", e)
+
+
+@registry.page(
+    "Market Intelligence",
+    modules=[
+        "data.market_data",
+        "visualizations.plots",
+        "components.metrics",
+        "utils.helpers",
+    ],
+)
+def render_market_intelligence(
+    user_role, selected_regions, time_range, selected_provider
+):
+    """Render market share, growth trends and regional analysis."""
+    from data.market_data import (
+        get_market_share_data,
+        get_growth_trends_data,
+        get_regional_metrics,
+    )
+    from visualizations.plots import (
+        create_market_share_treemap,
+        create_growth_trends_line,
+        create_provider_comparison_radar,
+    )
+    from components.metrics import display_provider_drilldown, display_regional_metrics
+    from utils.helpers import filter_data_by_regions
+
+    st.title("📊 Global Market Intelligence")
+    tab1, tab2, tab3 = st.tabs(["Market Share", "Growth Trends", "Regional Analysis"])
+    # Get and filter data based on selections
+    market_data_dict = get_market_share_data(user_role)
+    market_data = filter_data_by_regions(market_data_dict["data"], selected_regions)
+    growth_data_dict = get_growth_trends_data(user_role)
+    growth_data = growth_data_dict["data"]
+    # Provider drill-down
+    if selected_provider != "All Providers":
+        market_data = market_data[market_data["Provider"] == selected_provider]
+        growth_data = growth_data  # (implement provider filter if needed)
+    with tab1:
+        plotly_chart(create_market_share_treemap(market_data), use_container_width=True)
+        display_provider_drilldown(market_data, selected_provider)
         # Show role-based insights
         if user_role == "Executive":
-            st.info(key_metrics.get("kpi_summary", ""))
-            st.success(get_market_share_data(user_role).get("top_opportunity", ""))
-            st.warning(get_market_share_data(user_role).get("key_risk", ""))
+            st.success(market_data_dict.get("top_opportunity", ""))
+            st.warning(market_data_dict.get("key_risk", ""))
         elif user_role == "Manager":
-            st.info(key_metrics.get("kpi_alert", ""))
-            st.info(get_market_share_data(user_role).get("regional_alert", ""))
+            st.info(market_data_dict.get("regional_alert", ""))
             st.write(
                 "**Provider Comparison:**",
-                get_market_share_data(user_role).get("provider_comparison", {}),
+                market_data_dict.get("provider_comparison", {}),
             )
         elif user_role == "Analyst":
-            st.info(key_metrics.get("advanced_insights", ""))
-            st.write(get_market_share_data(user_role).get("advanced_insights", ""))
-            st.download_button(
-                "Download Market Data (CSV)",
-                get_market_share_data(user_role).get("raw_data_export", ""),
-                file_name="market_data.csv",
+            st.write(market_data_dict.get("advanced_insights", ""))
+            display_export_button(
+                "Download Market Data",
+                market_data_dict["data"],
+                "market_data",
+                "market_share",
+            )
+    with tab2:
+        plotly_chart(create_growth_trends_line(growth_data), use_container_width=True)
+        st.caption(growth_data_dict.get("trend_summary", ""))
+        if user_role == "Analyst":
+            st.write(growth_data_dict.get("advanced_insights", ""))
+            display_export_button(
+                "Download Growth Data",
+                growth_data_dict["data"],
+                "growth_data",
+                "growth_trends",
             )
+    with tab3:
+        if user_role in ["Manager", "Analyst"]:
+            display_regional_metrics(get_regional_metrics(user_role)["data"])
+        plotly_chart(
+            create_provider_comparison_radar(market_data), use_container_width=True
+        )
 
-        st.markdown(
-            """
-        ## Strategic Intelligence Platform for Government & Enterprise
-        
-        This dashboard provides comprehensive insights into the global AI and cloud computing landscape, 
-        enabling data-driven decision making for government agencies and enterprises.
-
-        ### Key Features:
-        - 📊 **Real-time Market Intelligence**: Track global market movements and competitive dynamics
-        - 🛡️ **Security & Compliance**: Monitor regulatory compliance and security standards
-        - 💰 **Cost Analysis**: Compare pricing and calculate TCO across providers
-        - ⚡ **Performance Metrics**: Track real-time performance and reliability metrics
-        - 🤖 **Decision Support**: AI-powered recommendations for strategic planning
-        """
+
+@registry.page(
+    "Security & Compliance",
+    modules=["data.compliance_data", "visualizations.compliance_plots"],
+)
+def render_security_compliance(
+    user_role, selected_regions, time_range, selected_provider
+):
+    """Render security scores, compliance coverage and data residency."""
+    from data.compliance_data import (
+        get_audit_history,
+        get_compliance_index,
+        get_security_certifications,
+        get_residency_catalog,
+    )
+    from visualizations.compliance_plots import (
+        create_compliance_heatmap,
+        create_security_score_gauge,
+        create_data_residency_map,
+        create_certification_timeline,
+    )
+
+    st.title("🛡️ Security & Compliance Dashboard")
+
+    # Get compliance and security data
+    compliance_data = get_compliance_index()
+    security_data = get_security_certifications()
+    residency_data = get_residency_catalog()
+
+    # Security Score Overview
+    plotly_chart(create_security_score_gauge(security_data), use_container_width=True)
+
+    # Compliance Matrix
+    if user_role in ["Manager", "Analyst"]:
+        st.subheader("Compliance Requirements by Region")
+        plotly_chart(
+            create_compliance_heatmap(compliance_data), use_container_width=True
         )
 
-        # --- AI Insights Panel ---
-        st.markdown("---")
-        st.subheader("🤖 AI Insights")
-        st.info(
-            "Automated trends, anomalies, and predictive analytics for enterprise decision-making."
+    # Security Certifications Timeline
+    if user_role == "Analyst":
+        st.subheader("Security Certifications & Audit History")
+        audit_history = None
+        if st.checkbox("Show past audits", key="show_audit_history"):
+            audit_history = get_audit_history()
+        plotly_chart(
+            create_certification_timeline(security_data, audit_history),
+            use_container_width=True,
         )
 
-        # Example: Trend detection on market growth
-        try:
-            growth_trends = get_growth_trends_data(user_role)
-            growth_data = growth_trends["data"]
-            st.caption(growth_trends.get("trend_summary", ""))
-            # Simple trend: compare last and first value
-            if len(growth_data) > 1:
-                first = growth_data.iloc[0][1:].mean()
-                last = growth_data.iloc[-1][1:].mean()
-                trend = "increasing" if last > first else "decreasing"
-                st.write(
-                    f"**Market growth trend:** {trend.title()} ({first:.2f}% → {last:.2f}%)"
-                )
-            # Anomaly detection (simple: large jump)
-            numeric_growth_data = growth_data.select_dtypes(include=[np.number])
-            diffs = numeric_growth_data.iloc[-5:].diff().abs().mean().mean()
-            if diffs > 5:
-                st.warning(
-                    f"Significant recent volatility detected in market growth (avg. change: {diffs:.2f}%)"
-                )
-        except Exception as e:
-            st.write("AI Insights unavailable: ", e)
-
-    # Market Intelligence Page
-    elif page == "Market Intelligence":
-        st.title("📊 Global Market Intelligence")
-        tab1, tab2, tab3 = st.tabs(
-            ["Market Share", "Growth Trends", "Regional Analysis"]
+    # Data Residency Map
+    st.subheader("Global Data Residency")
+    col1, col2 = st.columns(2)
+    with col1:
+        residency_providers = st.multiselect(
+            "Hosted by all of", residency_data.providers, key="residency_providers"
         )
-        # Get and filter data based on selections
-        market_data_dict = get_market_share_data(user_role)
-        market_data = filter_data_by_regions(market_data_dict["data"], selected_regions)
-        growth_data_dict = get_growth_trends_data(user_role)
-        growth_data = growth_data_dict["data"]
-        # Provider drill-down
-        if selected_provider != "All Providers":
-            market_data = market_data[market_data["Provider"] == selected_provider]
-            growth_data = growth_data  # (implement provider filter if needed)
-        with tab1:
-            st.plotly_chart(
-                create_market_share_treemap(market_data), use_container_width=True
-            )
-            # Show role-based insights
-            if user_role == "Executive":
-                st.success(market_data_dict.get("top_opportunity", ""))
-                st.warning(market_data_dict.get("key_risk", ""))
-            elif user_role == "Manager":
-                st.info(market_data_dict.get("regional_alert", ""))
-                st.write(
-                    "**Provider Comparison:**",
-                    market_data_dict.get("provider_comparison", {}),
-                )
-            elif user_role == "Analyst":
-                st.write(market_data_dict.get("advanced_insights", ""))
-                st.download_button(
-                    "Download Market Data (CSV)",
-                    market_data_dict.get("raw_data_export", ""),
-                    file_name="market_data.csv",
-                )
-        with tab2:
-            st.plotly_chart(
-                create_growth_trends_line(growth_data), use_container_width=True
-            )
-            st.caption(growth_data_dict.get("trend_summary", ""))
-            if user_role == "Analyst":
-                st.write(growth_data_dict.get("advanced_insights", ""))
-                st.download_button(
-                    "Download Growth Data (CSV)",
-                    growth_data_dict.get("raw_data_export", ""),
-                    file_name="growth_data.csv",
-                )
-        with tab3:
-            if user_role in ["Manager", "Analyst"]:
-                display_regional_metrics(get_regional_metrics(user_role)["data"])
-            st.plotly_chart(
-                create_provider_comparison_radar(market_data), use_container_width=True
-            )
+    with col2:
+        residency_frameworks = st.multiselect(
+            "Certified for all of",
+            residency_data.frameworks,
+            key="residency_frameworks",
+        )
+    residency_regions = residency_data.grouped_coordinates(
+        providers=residency_providers, frameworks=residency_frameworks
+    )
+    if residency_regions:
+        plotly_chart(
+            create_data_residency_map(residency_regions), use_container_width=True
+        )
+    else:
+        st.info("No regions match the selected providers and frameworks.")
+
 
-    # Security & Compliance Page
-    elif page == "Security & Compliance":
-        st.title("🛡️ Security & Compliance Dashboard")
+@st.fragment
+def display_tco_calculator():
+    """TCO sliders and chart; moving a slider reruns only this fragment."""
+    from data.performance_data import DEFAULT_SCENARIOS, calculate_tco, simulate_tco
+    from visualizations.performance_plots import create_tco_analysis
 
-        # Get compliance and security data
-        compliance_data = get_compliance_matrix()
-        security_data = get_security_certifications()
-        residency_data = get_data_residency_map()
+    st.subheader("Total Cost of Ownership Calculator")
 
-        # Security Score Overview
-        st.plotly_chart(
-            create_security_score_gauge(security_data), use_container_width=True
+    # Workload profile inputs
+    col1, col2 = st.columns(2)
+    with col1:
+        compute_factor = st.slider(
+            "Compute Intensity", 0.5, 5.0, 1.0, key="tco_compute"
+        )
+        storage_factor = st.slider(
+            "Storage Requirements", 0.5, 5.0, 1.0, key="tco_storage"
+        )
+    with col2:
+        network_factor = st.slider("Network Usage", 0.5, 5.0, 1.0, key="tco_network")
+        support_factor = st.slider("Support Level", 0.5, 5.0, 1.0, key="tco_support")
+
+    workload_profile = {
+        "compute": compute_factor,
+        "storage": storage_factor,
+        "network": network_factor,
+        "support": support_factor,
+    }
+    tco_data = calculate_tco(workload_profile)
+    bands = None
+    if st.checkbox(
+        "Simulate price, usage and FX uncertainty",
+        key="tco_simulate",
+        help=f"Draws {DEFAULT_SCENARIOS:,} scenarios and shows P10-P90 bands.",
+    ):
+        # Fixed seed so the bands only move when the profile does
+        bands = simulate_tco(workload_profile, seed=0)
+    plotly_chart(create_tco_analysis(tco_data, bands), use_container_width=True)
+    if bands is not None:
+        cheapest = bands.loc[bands["Cheapest (%)"].idxmax()]
+        st.caption(
+            f"{cheapest['Provider']} has the lowest 3-year TCO in "
+            f"{cheapest['Cheapest (%)']:.1f}% of scenarios."
         )
+        st.dataframe(bands, hide_index=True)
 
-        # Compliance Matrix
-        if user_role in ["Manager", "Analyst"]:
-            st.subheader("Compliance Requirements by Region")
-            st.plotly_chart(
-                create_compliance_heatmap(compliance_data), use_container_width=True
-            )
 
-        # Security Certifications Timeline
-        if user_role == "Analyst":
-            st.subheader("Security Certifications & Audit History")
-            st.plotly_chart(
-                create_certification_timeline(security_data), use_container_width=True
-            )
+@registry.page(
+    "Cost Analysis",
+    modules=["data.performance_data", "visualizations.performance_plots"],
+)
+def render_cost_analysis(user_role, selected_regions, time_range, selected_provider):
+    """Render the TCO calculator and service cost comparison."""
+    from data.performance_data import get_cost_analysis
+    from visualizations.performance_plots import create_cost_comparison
 
-        # Data Residency Map
-        st.subheader("Global Data Residency")
-        st.plotly_chart(
-            create_data_residency_map(residency_data), use_container_width=True
-        )
+    st.title("💰 Cost Analysis Dashboard")
 
-    # Cost Analysis Page
-    elif page == "Cost Analysis":
-        st.title("💰 Cost Analysis Dashboard")
+    # Get cost data
+    cost_data = get_cost_analysis()
 
-        # Get cost data
-        cost_data = get_cost_analysis()
+    display_tco_calculator()
 
-        # TCO Calculator
-        st.subheader("Total Cost of Ownership Calculator")
+    # Service Cost Comparison
+    if user_role in ["Manager", "Analyst"]:
+        st.subheader("Service Cost Comparison")
+        plotly_chart(create_cost_comparison(cost_data), use_container_width=True)
 
-        # Workload profile inputs
-        col1, col2 = st.columns(2)
-        with col1:
-            compute_factor = st.slider("Compute Intensity", 0.5, 5.0, 1.0)
-            storage_factor = st.slider("Storage Requirements", 0.5, 5.0, 1.0)
-        with col2:
-            network_factor = st.slider("Network Usage", 0.5, 5.0, 1.0)
-            support_factor = st.slider("Support Level", 0.5, 5.0, 1.0)
-
-        # Calculate TCO
-        workload_profile = {
-            "compute": compute_factor,
-            "storage": storage_factor,
-            "network": network_factor,
-            "support": support_factor,
-        }
-        tco_data = calculate_tco(workload_profile)
-
-        # Display TCO Analysis
-        st.plotly_chart(create_tco_analysis(tco_data), use_container_width=True)
-
-        # Service Cost Comparison
-        if user_role in ["Manager", "Analyst"]:
-            st.subheader("Service Cost Comparison")
-            st.plotly_chart(create_cost_comparison(cost_data), use_container_width=True)
 
-    # Performance Metrics Page
-    elif page == "Performance Metrics":
-        st.title("⚡ Performance Metrics Dashboard")
+@registry.page(
+    "Performance Metrics",
+    modules=[
+        "data.performance_data",
+        "visualizations.performance_plots",
+        "utils.helpers",
+    ],
+)
+def render_performance_metrics(
+    user_role, selected_regions, time_range, selected_provider
+):
+    """Render performance, latency and SLA analytics."""
+    from data.performance_data import (
+        get_performance_metrics,
+        get_performance_history,
+        get_sla_comparisons,
+    )
+    from visualizations.performance_plots import (
+        create_performance_radar,
+        create_latency_heatmap,
+        create_sla_comparison,
+    )
+    from utils.helpers import get_time_range_dates
+
+    st.title("⚡ Performance Metrics Dashboard")
+    # Average the stored history over the sidebar Time Range window
+    start_date, end_date = get_time_range_dates(time_range)
+    performance_data = get_performance_history(start_date, end_date)
+    if performance_data.empty:
+        st.caption("Performance history is being prepared; showing current metrics.")
         performance_data = get_performance_metrics()
-        sla_data = get_sla_comparisons()
-        # Performance Overview
-        st.plotly_chart(
-            create_performance_radar(performance_data), use_container_width=True
+    else:
+        st.caption(
+            f"Averaged over {performance_data['Samples'].sum():,} samples "
+            f"from {start_date:%Y-%m-%d} to {end_date:%Y-%m-%d} ({time_range})."
         )
-        # Role-based insights and advanced analytics
-        if user_role == "Executive":
-            top_perf = performance_data.loc[performance_data["Uptime (%)"].idxmax()]
-            st.success(
-                f"Top Performer: {top_perf['Provider']} (Uptime: {top_perf['Uptime (%)']}%)"
-            )
-            st.info("Executive View: Focus on uptime and reliability KPIs.")
-        elif user_role == "Manager":
-            st.subheader("Global Latency Analysis")
-            st.plotly_chart(
-                create_latency_heatmap(performance_data), use_container_width=True
-            )
-            slowest = performance_data.loc[performance_data["Latency (ms)"].idxmax()]
-            st.warning(
-                f"Latency Alert: {slowest['Provider']} highest latency ({slowest['Latency (ms)']} ms)"
+        performance_data = performance_data.drop(columns="Samples")
+    sla_data = get_sla_comparisons()
+    # Performance Overview
+    plotly_chart(create_performance_radar(performance_data), use_container_width=True)
+    # Role-based insights and advanced analytics
+    if user_role == "Executive":
+        top_perf = performance_data.loc[performance_data["Uptime (%)"].idxmax()]
+        st.success(
+            f"Top Performer: {top_perf['Provider']} (Uptime: {top_perf['Uptime (%)']}%)"
+        )
+        st.info("Executive View: Focus on uptime and reliability KPIs.")
+    elif user_role == "Manager":
+        st.subheader("Global Latency Analysis")
+        plotly_chart(create_latency_heatmap(performance_data), use_container_width=True)
+        slowest = performance_data.loc[performance_data["Latency (ms)"].idxmax()]
+        st.warning(
+            f"Latency Alert: {slowest['Provider']} highest latency ({slowest['Latency (ms)']} ms)"
+        )
+        st.info("Manager View: Monitor latency and regional performance.")
+    elif user_role == "Analyst":
+        st.subheader("Global Latency Analysis")
+        plotly_chart(create_latency_heatmap(performance_data), use_container_width=True)
+        st.subheader("Service Level Agreements")
+        plotly_chart(create_sla_comparison(sla_data), use_container_width=True)
+        st.write("Advanced Analytics: Outlier Detection")
+        outlier = performance_data.loc[performance_data["Latency (ms)"].idxmax()]
+        st.write(
+            f"Provider with highest latency: {outlier['Provider']} ({outlier['Latency (ms)']} ms)"
+        )
+        display_export_button(
+            "Download Performance Data",
+            performance_data,
+            "performance_data",
+            "performance",
+        )
+
+
+@registry.page(
+    "Decision Helper",
+    modules=[
+        "components.decision_helper",
+        "components.recommendation_index",
+        "data.compliance_data",
+    ],
+)
+def render_decision_helper(user_role, selected_regions, time_range, selected_provider):
+    from components.decision_helper import display_decision_helper
+    from data.compliance_data import get_compliance_index
+
+    display_decision_helper(compliance_index=get_compliance_index())
+
+
+@registry.page("Platform Comparisons", modules=["components.platform_comparisons"])
+def render_platform_comparisons(
+    user_role, selected_regions, time_range, selected_provider
+):
+    from components.platform_comparisons import display_platform_comparisons
+
+    display_platform_comparisons()
+
+
+@registry.page("Learning Resources", modules=["components.learning_resources"])
+def render_learning_resources(
+    user_role, selected_regions, time_range, selected_provider
+):
+    from components.learning_resources import display_learning_resources
+
+    display_learning_resources()
+
+
+@registry.page("Future Trends", modules=["components.future_trends"])
+def render_future_trends(user_role, selected_regions, time_range, selected_provider):
+    from components.future_trends import display_future_trends
+
+    display_future_trends()
+
+
+registry.record_startup("app imports", time.perf_counter() - _IMPORT_STARTED)
+
+
+_snapshot_state = {"version": None}
+
+
+def sync_data_snapshot():
+    """Drop cached loader results when the ingest worker publishes a new snapshot.
+
+    Returns the current snapshot, or None when data is computed inline.
+    """
+    from data.snapshots import latest_snapshot
+
+    snapshot = latest_snapshot()
+    version = snapshot.version if snapshot is not None else None
+    if version != _snapshot_state["version"]:
+        from data.cache import invalidate
+
+        invalidate()
+        _snapshot_state["version"] = version
+    return snapshot
+
+
+def display_load_report(snapshot=None):
+    """Show startup and per-page import costs in a collapsed sidebar panel."""
+    with st.sidebar.expander("⏱️ Load Report"):
+        st.dataframe(registry.report(), hide_index=True)
+        if snapshot is not None:
+            st.caption(
+                f"Data snapshot {snapshot.version} "
+                f"({len(snapshot.keys)} datasets, published {snapshot.manifest['created']})"
             )
-            st.info("Manager View: Monitor latency and regional performance.")
-        elif user_role == "Analyst":
-            st.subheader("Global Latency Analysis")
-            st.plotly_chart(
-                create_latency_heatmap(performance_data), use_container_width=True
+        else:
+            st.caption("No data snapshot published; datasets are computed in-app.")
+
+
+def instrument_page(name):
+    """Time the loaders, builders and sections of a page's modules."""
+    for module in registry.load(name).modules:
+        instrument_module(sys.modules[module])
+
+
+def debug_panel_enabled():
+    """The timing panel shows with ``DASHBOARD_DEBUG=1`` or a ``?debug=1`` URL."""
+    return (
+        os.environ.get("DASHBOARD_DEBUG") == "1" or st.query_params.get("debug") == "1"
+    )
+
+
+def display_debug_panel():
+    """Show the last rerun's timing breakdown and the running totals."""
+    with st.sidebar.expander("🐞 Debug Timings"):
+        run = metrics.runs[-1] if metrics.runs else None
+        if run is not None:
+            st.caption(f"Last rerun ({run['label']}): {run['seconds'] * 1000:.0f} ms")
+            st.dataframe(
+                metrics.run_breakdown(run),
+                hide_index=True,
+                column_config={
+                    "Total (ms)": st.column_config.NumberColumn(
+                        help="Including nested instrumented calls"
+                    ),
+                    "Self (ms)": st.column_config.NumberColumn(
+                        help="Excluding nested instrumented calls"
+                    ),
+                    "Share of run": st.column_config.ProgressColumn(
+                        help="Self time as a share of the rerun",
+                        format="percent",
+                        min_value=0,
+                        max_value=1,
+                    ),
+                },
             )
-            st.subheader("Service Level Agreements")
-            st.plotly_chart(create_sla_comparison(sla_data), use_container_width=True)
-            st.write("Advanced Analytics: Outlier Detection")
-            outlier = performance_data.loc[performance_data["Latency (ms)"].idxmax()]
-            st.write(
-                f"Provider with highest latency: {outlier['Provider']} ({outlier['Latency (ms)']} ms)"
+        st.caption("Since the server started")
+        st.dataframe(metrics.summary(), hide_index=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Prometheus",
+                metrics.to_prometheus,
+                file_name="dashboard_metrics.prom",
+                mime="text/plain",
+                key="debug_metrics_prometheus",
             )
+        with col2:
             st.download_button(
-                "Download Performance Data (CSV)",
-                performance_data.to_csv(index=False),
-                file_name="performance_data.csv",
+                "JSON",
+                metrics.to_json,
+                file_name="dashboard_metrics.json",
+                mime="application/json",
+                key="debug_metrics_json",
             )
 
-    # Decision Helper Page
-    elif page == "Decision Helper":
-        display_decision_helper()
-
-    # Platform Comparisons Page
-    elif page == "Platform Comparisons":
-        display_platform_comparisons()
-
-    # Learning Resources Page
-    elif page == "Learning Resources":
-        display_learning_resources()
-
-    # Future Trends Page
-    elif page == "Future Trends":
-        display_future_trends()
-
-    # Data Privacy & Export section in sidebar
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Data Privacy & Export")
-    st.sidebar.markdown("View our [Privacy Policy](docs/security.md)")
-    if st.sidebar.button("Export My Data"):
-        st.sidebar.success(
-            "Your data export request has been received. (Feature coming soon)"
+
+def main():
+    run = metrics.begin_run()
+    page = None
+    try:
+        # User Role Selector
+        st.sidebar.markdown("## User Role")
+        user_role = st.sidebar.selectbox(
+            "Select your role:",
+            ["Executive", "Manager", "Analyst"],
+            index=0,
+            help="Choose a role to customize the dashboard view.",
         )
 
+        # Get navigation and filter selections (now includes provider)
+        with metrics.timer("sidebar navigation"):
+            page, selected_regions, time_range, selected_provider = (
+                display_sidebar_navigation()
+            )
+
+        with metrics.timer("sync_data_snapshot"):
+            snapshot = sync_data_snapshot()
+        instrument_page(page)
+        with metrics.timer(page, kind="page"):
+            registry.render(
+                page, user_role, selected_regions, time_range, selected_provider
+            )
+
+        # Data Privacy & Export section in sidebar
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("Data Privacy & Export")
+        st.sidebar.markdown("View our [Privacy Policy](docs/security.md)")
+        if st.sidebar.button("Export My Data"):
+            st.sidebar.success(
+                "Your data export request has been received. (Feature coming soon)"
+            )
+        display_load_report(snapshot)
+    finally:
+        metrics.end_run(run, label=page)
+        write_metrics_file()
+    if debug_panel_enabled():
+        display_debug_panel()
+
 
 if __name__ == "__main__":
     main()
@@ -1,78 +1,205 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 
+RECOMMENDATION_GROUPS = ["US Providers", "EU Providers", "China Providers"]
 
-def calculate_recommendation_score(inputs):
-    """Calculate recommendation scores based on user inputs."""
-    scores = {"US Providers": 0, "EU Providers": 0, "China Providers": 0}
-
-    # Industry-specific scoring
-    industry_weights = {
-        "Tech": {"US": 1.0, "EU": 0.9, "China": 0.8},
-        "Finance": {"US": 1.0, "EU": 1.0, "China": 0.6},
-        "Healthcare": {"US": 1.0, "EU": 0.9, "China": 0.5},
-        "Manufacturing": {"US": 0.9, "EU": 0.8, "China": 1.0},
-        "AI Research": {"US": 1.0, "EU": 0.9, "China": 0.9},
-        "Government": {"US": 1.0, "EU": 0.8, "China": 0.4},
-        "Other": {"US": 1.0, "EU": 0.9, "China": 0.7},
-    }
+INDUSTRIES = [
+    "Tech",
+    "Finance",
+    "Healthcare",
+    "Manufacturing",
+    "AI Research",
+    "Government",
+    "Other",
+]
+REGIONS = ["North America", "Europe", "Asia", "Global"]
+BUDGET_LEVELS = ["Low", "Medium", "High"]
+SOVEREIGNTY_OPTIONS = [
+    "No specific requirements",
+    "Prefer local storage",
+    "Must stay in country",
+]
+COMPLIANCE_FLAGS = ["GDPR", "HIPAA", "FedRAMP", "PCI", "SOX", "ISO"]
+TECH_FLAGS = [
+    "AI/ML",
+    "Serverless",
+    "Edge Computing",
+    "Containers",
+    "IoT",
+    "Blockchain",
+]
+# Compliance checkbox names as they appear in the compliance matrix
+COMPLIANCE_REQUIREMENT_NAMES = {"PCI": "PCI DSS", "ISO": "ISO 27001"}
+PROFILE_COLUMNS = (
+    [
+        "industry",
+        "region",
+        "budget_constraint",
+        "data_sovereignty",
+    ]
+    + COMPLIANCE_FLAGS
+    + TECH_FLAGS
+)
+
+# Score model: every row below is a (US, EU, China) adjustment and a
+# profile's score is the sum of the rows it selects.
+INDUSTRY_WEIGHTS = {
+    "Tech": (1.0, 0.9, 0.8),
+    "Finance": (1.0, 1.0, 0.6),
+    "Healthcare": (1.0, 0.9, 0.5),
+    "Manufacturing": (0.9, 0.8, 1.0),
+    "AI Research": (1.0, 0.9, 0.9),
+    "Government": (1.0, 0.8, 0.4),
+    "Other": (1.0, 0.9, 0.7),
+}
+BUDGET_ADJUSTMENTS = {"Low": (20, 0, 0), "Medium": (0, 0, 0), "High": (0, 10, 20)}
+SOVEREIGNTY_ADJUSTMENTS = {
+    "No specific requirements": (0, 0, 0),
+    "Prefer local storage": (0, 0, 0),
+    "Must stay in country": (-20, 0, -40),
+}
+# Extra adjustment when data must stay in country and the organization
+# operates in the given region
+IN_COUNTRY_REGION_ADJUSTMENTS = {"Europe": (0, 30, 0)}
+COMPLIANCE_ADJUSTMENTS = {
+    "GDPR": (20, 30, -20),
+    "HIPAA": (30, 10, -20),
+    "FedRAMP": (40, -10, -30),
+    "PCI": (0, 0, 0),
+    "SOX": (0, 0, 0),
+    "ISO": (0, 0, 0),
+}
+TECH_ADJUSTMENTS = {
+    "AI/ML": (20, 0, 20),
+    "Serverless": (0, 0, 0),
+    "Edge Computing": (15, 15, 0),
+    "Containers": (0, 0, 0),
+    "IoT": (0, 15, 20),
+    "Blockchain": (0, 0, 0),
+}
+
+
+def _table(adjustments, keys):
+    return np.array([adjustments[key] for key in keys], dtype=float)
+
+
+_INDUSTRY_MATRIX = _table(INDUSTRY_WEIGHTS, INDUSTRIES) * 100
+# The trailing zero row/column catches unknown labels, whose code is -1
+_BUDGET_MATRIX = np.vstack([_table(BUDGET_ADJUSTMENTS, BUDGET_LEVELS), np.zeros(3)])
+# (sovereignty, region, group): the in-country adjustment depends on region
+_SOVEREIGNTY_MATRIX = np.zeros((len(SOVEREIGNTY_OPTIONS) + 1, len(REGIONS) + 1, 3))
+_SOVEREIGNTY_MATRIX[:-1] = _table(SOVEREIGNTY_ADJUSTMENTS, SOVEREIGNTY_OPTIONS)[
+    :, None, :
+]
+for _region, _adjustment in IN_COUNTRY_REGION_ADJUSTMENTS.items():
+    _SOVEREIGNTY_MATRIX[
+        SOVEREIGNTY_OPTIONS.index("Must stay in country"), REGIONS.index(_region)
+    ] += _adjustment
+_FLAG_MATRIX = np.vstack(
+    [
+        _table(COMPLIANCE_ADJUSTMENTS, COMPLIANCE_FLAGS),
+        _table(TECH_ADJUSTMENTS, TECH_FLAGS),
+    ]
+)
+
+
+def _codes(values, categories, default=None):
+    """Map labels to row numbers in ``categories``; unknowns map to ``default``."""
+    codes = pd.Index(categories).get_indexer(pd.Series(values).astype(object))
+    if default is not None:
+        codes[codes < 0] = categories.index(default)
+    return codes
 
-    weights = industry_weights.get(inputs["industry"], industry_weights["Other"])
-    scores["US Providers"] += weights["US"] * 100
-    scores["EU Providers"] += weights["EU"] * 100
-    scores["China Providers"] += weights["China"] * 100
-
-    # Budget considerations
-    if inputs["budget_constraint"] == "High":
-        scores["China Providers"] += 20
-        scores["EU Providers"] += 10
-    elif inputs["budget_constraint"] == "Low":
-        scores["US Providers"] += 20
-
-    # Data sovereignty requirements
-    if inputs["data_sovereignty"] == "Must stay in country":
-        scores["US Providers"] -= 20
-        scores["China Providers"] -= 40
-        if inputs["region"] == "Europe":
-            scores["EU Providers"] += 30
-
-    # Compliance requirements
-    if inputs["compliance_needs"]["GDPR"]:
-        scores["EU Providers"] += 30
-        scores["US Providers"] += 20
-        scores["China Providers"] -= 20
-    if inputs["compliance_needs"]["HIPAA"]:
-        scores["US Providers"] += 30
-        scores["EU Providers"] += 10
-        scores["China Providers"] -= 20
-    if inputs["compliance_needs"]["FedRAMP"]:
-        scores["US Providers"] += 40
-        scores["EU Providers"] -= 10
-        scores["China Providers"] -= 30
-
-    # Technical requirements
-    if inputs["tech_requirements"]["AI/ML"]:
-        scores["US Providers"] += 20
-        scores["China Providers"] += 20
-    if inputs["tech_requirements"]["Edge Computing"]:
-        scores["US Providers"] += 15
-        scores["EU Providers"] += 15
-    if inputs["tech_requirements"]["IoT"]:
-        scores["China Providers"] += 20
-        scores["EU Providers"] += 15
+
+def _score_matrix(industry, region, budget, sovereignty, flags):
+    """Evaluate the score model for coded profiles.
+
+    Each code array has one entry per profile and ``flags`` is an N x 12
+    boolean matrix of compliance then technical requirements. Returns an
+    N x 3 array of normalized scores.
+    """
+    scores = _INDUSTRY_MATRIX[industry] + _BUDGET_MATRIX[budget]
+    scores += _SOVEREIGNTY_MATRIX[sovereignty, region]
+    scores += flags.astype(float) @ _FLAG_MATRIX
 
     # Normalize scores between 0 and 100
-    max_score = max(scores.values())
-    if max_score > 100:
-        scores = {k: (v / max_score) * 100 for k, v in scores.items()}
+    max_score = scores.max(axis=1, keepdims=True)
+    return np.where(max_score > 100, scores / max_score * 100, scores)
+
+
+def _flag_values(frame, name):
+    if name not in frame:
+        return np.zeros(len(frame), dtype=bool)
+    column = frame[name]
+    if column.dtype == object or isinstance(column.dtype, pd.StringDtype):
+        text = column.astype(str).str.strip().str.lower()
+        return text.isin(["true", "yes", "y", "1"]).to_numpy()
+    return column.fillna(False).astype(bool).to_numpy()
+
+
+def score_profiles(profiles):
+    """Score a table of organization profiles in one vectorized pass.
+
+    ``profiles`` has ``industry``, ``region``, ``budget_constraint`` and
+    ``data_sovereignty`` columns plus one boolean column per compliance and
+    technical requirement (missing requirement columns count as False).
+    Returns a DataFrame with one score column per provider group, aligned
+    with ``profiles``.
+    """
+    missing = [c for c in PROFILE_COLUMNS[:4] if c not in profiles]
+    if missing:
+        raise ValueError(f"profiles are missing columns: {', '.join(missing)}")
+    flags = np.column_stack(
+        [_flag_values(profiles, name) for name in COMPLIANCE_FLAGS + TECH_FLAGS]
+    )
+    scores = _score_matrix(
+        _codes(profiles["industry"], INDUSTRIES, default="Other"),
+        _codes(profiles["region"], REGIONS),
+        _codes(profiles["budget_constraint"], BUDGET_LEVELS),
+        _codes(profiles["data_sovereignty"], SOVEREIGNTY_OPTIONS),
+        flags.reshape(len(profiles), -1),
+    )
+    return pd.DataFrame(scores, columns=RECOMMENDATION_GROUPS, index=profiles.index)
+
+
+def _single_code(value, categories, default=None):
+    if value in categories:
+        return categories.index(value)
+    return categories.index(default) if default is not None else -1
 
-    return scores
+
+def calculate_recommendation_score(inputs):
+    """Calculate recommendation scores based on user inputs."""
+    flags = [inputs["compliance_needs"].get(n, False) for n in COMPLIANCE_FLAGS]
+    flags += [inputs["tech_requirements"].get(n, False) for n in TECH_FLAGS]
+    scores = _score_matrix(
+        np.array([_single_code(inputs["industry"], INDUSTRIES, default="Other")]),
+        np.array([_single_code(inputs["region"], REGIONS)]),
+        np.array([_single_code(inputs["budget_constraint"], BUDGET_LEVELS)]),
+        np.array([_single_code(inputs["data_sovereignty"], SOVEREIGNTY_OPTIONS)]),
+        np.array([flags], dtype=bool),
+    )[0]
+    return {group: float(score) for group, score in zip(RECOMMENDATION_GROUPS, scores)}
 
 
-def display_decision_helper():
-    """Display the enhanced decision helper interface."""
+def display_decision_helper(compliance_index=None):
+    """Display the enhanced decision helper interface.
+
+    ``compliance_index`` is an optional ``ComplianceMatrix``; when given,
+    the selected compliance requirements are checked against it.
+    """
     st.title("🤖 AI & Cloud Decision Helper")
+    display_profile_scoring(compliance_index)
+    display_batch_scoring()
+
 
+@st.fragment
+def display_profile_scoring(compliance_index=None):
+    """Profile inputs and their recommendation scores.
+
+    A fragment: changing an input reruns only this section, not the page.
+    """
     # Basic Information
     st.subheader("Organization Profile")
     col1, col2 = st.columns(2)
@@ -159,7 +286,10 @@ def display_decision_helper():
         },
     }
 
-    scores = calculate_recommendation_score(inputs)
+    from .recommendation_index import recommendation_index
+
+    index = recommendation_index()
+    scores = index.lookup(inputs)
 
     # Display recommendations
     st.subheader("Recommendations")
@@ -170,6 +300,14 @@ def display_decision_helper():
         with cols[i]:
             st.metric(provider, f"{score:.1f}%")
 
+    wins = index.win_fractions(industry=industry, region=region)
+    st.caption(
+        f"Across every requirement combination for {industry} organizations in "
+        f"{region}: "
+        + ", ".join(f"{group} lead {share:.0%}" for group, share in wins.items())
+        + " of the time."
+    )
+
     # Detailed recommendations
     st.markdown("### Detailed Analysis")
 
@@ -184,6 +322,9 @@ def display_decision_helper():
         else:
             st.error(f"❌ **{provider}** ({score:.1f}%) - Not Recommended")
 
+    if compliance_index is not None:
+        display_compliance_coverage(compliance_index, inputs["compliance_needs"])
+
     # Additional considerations
     st.markdown("### Additional Considerations")
     considerations = []
@@ -207,6 +348,67 @@ def display_decision_helper():
         st.markdown(consideration)
 
 
+def display_compliance_coverage(compliance_index, compliance_needs):
+    """Show how each provider group covers the selected compliance needs."""
+    known = set(compliance_index.requirements)
+    selected = [
+        COMPLIANCE_REQUIREMENT_NAMES.get(flag, flag)
+        for flag, checked in compliance_needs.items()
+        if checked
+    ]
+    selected = [name for name in selected if name in known]
+    if not selected:
+        return
+    st.markdown("### Compliance Coverage")
+    labels = {2: "✅ Full", 1: "⚠️ Partial", 0: "❌ Gaps"}
+    coverage = compliance_index.coverage(selected)
+    st.caption("Selected: " + ", ".join(selected))
+    cols = st.columns(len(coverage))
+    for col, (group, level) in zip(cols, coverage.items()):
+        with col:
+            st.markdown(f"**{group}**: {labels[level]}")
+
+
+@st.fragment
+def display_batch_scoring():
+    """Score an uploaded table of organization profiles (a fragment)."""
+    st.markdown("### Batch Scoring")
+    with st.expander("Score a profile file"):
+        st.caption(
+            "Upload a CSV with columns: "
+            + ", ".join(f"`{c}`" for c in PROFILE_COLUMNS)
+            + ". Requirement columns are optional and accept true/false or 1/0."
+        )
+        uploaded = st.file_uploader(
+            "Organization profiles", type=["csv"], key="decision_profiles"
+        )
+        if uploaded is None:
+            return
+        try:
+            # Parser, empty-file and decoding errors are all ValueErrors
+            profiles = pd.read_csv(uploaded)
+            scores = score_profiles(profiles)
+        except ValueError as exc:
+            st.error(str(exc))
+            return
+
+        recommended = scores.idxmax(axis=1).value_counts()
+        cols = st.columns(len(RECOMMENDATION_GROUPS))
+        for col, group in zip(cols, RECOMMENDATION_GROUPS):
+            with col:
+                st.metric(f"Top pick: {group}", f"{int(recommended.get(group, 0)):,}")
+
+        scored = pd.concat([profiles, scores.round(1)], axis=1)
+        scored["Recommended"] = scores.idxmax(axis=1)
+        st.dataframe(scored.head(1000), use_container_width=True)
+        st.download_button(
+            "Download scores (CSV)",
+            data=lambda: scored.to_csv(index=False),
+            file_name="recommendation_scores.csv",
+            mime="text/csv",
+        )
+
+
 def display_recommendation_results(scores):
     """Display recommendation results with tooltips for clarity."""
     st.subheader("Provider Recommendation Scores")
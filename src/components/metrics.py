@@ -26,6 +26,30 @@ def display_regional_metrics(regional_data):
             st.metric("Market Share", data["share"], data["share_change"])
 
 
+@st.fragment
+def display_provider_drilldown(market_data, default_provider=None):
+    """Show one provider's share, growth and regional rank.
+
+    A fragment: picking another provider reruns only this panel.
+    """
+    providers = market_data["Provider"].tolist()
+    if not providers:
+        return
+    provider = st.selectbox(
+        "Drill down into provider",
+        providers,
+        index=providers.index(default_provider) if default_provider in providers else 0,
+        key="drilldown_provider",
+    )
+    row = market_data.loc[market_data["Provider"] == provider].iloc[0]
+    peers = market_data.loc[market_data["Region"] == row["Region"], "Market Share (%)"]
+    rank = int((peers > row["Market Share (%)"]).sum()) + 1
+    cols = st.columns(3)
+    cols[0].metric("Market Share", f"{row['Market Share (%)']}%")
+    cols[1].metric("YoY Growth", f"{row['YoY Growth (%)']}%")
+    cols[2].metric(f"Rank in {row['Region']}", f"#{rank} of {len(peers)}")
+
+
 def display_sidebar_navigation():
     """Display sidebar navigation with additional features and feedback widget."""
     st.sidebar.title("Navigation")
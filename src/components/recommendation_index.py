@@ -0,0 +1,154 @@
+import threading
+
+import numpy as np
+
+from .decision_helper import (
+    BUDGET_LEVELS,
+    COMPLIANCE_FLAGS,
+    INDUSTRIES,
+    RECOMMENDATION_GROUPS,
+    REGIONS,
+    SOVEREIGNTY_OPTIONS,
+    TECH_FLAGS,
+    _score_matrix,
+    calculate_recommendation_score,
+)
+
+# Key layout: the low 12 bits hold the requirement checkboxes (compliance
+# then technical, one bit each); the bits above hold the select boxes as a
+# mixed-radix number, so every key in [0, INDEX_SIZE) is a valid profile.
+FLAGS = COMPLIANCE_FLAGS + TECH_FLAGS
+FLAG_BITS = len(FLAGS)
+_RADICES = [
+    ("industry", INDUSTRIES),
+    ("region", REGIONS),
+    ("budget_constraint", BUDGET_LEVELS),
+    ("data_sovereignty", SOVEREIGNTY_OPTIONS),
+]
+INDEX_SIZE = int(np.prod([len(values) for _, values in _RADICES])) << FLAG_BITS
+
+
+def profile_key(inputs):
+    """Pack a Decision Helper ``inputs`` dict into its index key.
+
+    Raises ``KeyError`` for labels outside the Decision Helper's options.
+    """
+    prefix = 0
+    for field, values in _RADICES:
+        value = inputs[field]
+        if value not in values:
+            raise KeyError(f"{field} {value!r} is not an indexed option")
+        prefix = prefix * len(values) + values.index(value)
+    requirements = {**inputs["compliance_needs"], **inputs["tech_requirements"]}
+    flags = 0
+    for bit, name in enumerate(FLAGS):
+        if requirements.get(name, False):
+            flags |= 1 << bit
+    return (prefix << FLAG_BITS) | flags
+
+
+def decode_keys(keys):
+    """Unpack index keys into code arrays per select box and an N x 12 flag matrix."""
+    keys = np.asarray(keys, dtype=np.int64)
+    flags = (keys[:, None] >> np.arange(FLAG_BITS)) & 1
+    prefix = keys >> FLAG_BITS
+    codes = {}
+    for field, values in reversed(_RADICES):
+        prefix, codes[field] = np.divmod(prefix, len(values))
+    return codes, flags.astype(bool)
+
+
+class RecommendationIndex:
+    """Normalized recommendation scores for every Decision Helper input.
+
+    ``scores`` is an ``INDEX_SIZE`` x 3 float32 array addressed by
+    ``profile_key``, so answering a form change is a single row lookup.
+    ``winners`` holds the top-scoring group per key for aggregate queries.
+    """
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.winners = scores.argmax(axis=1).astype(np.uint8)
+
+    @classmethod
+    def build(cls, chunk_keys=1 << 16):
+        """Score every combination of Decision Helper inputs."""
+        scores = np.empty((INDEX_SIZE, len(RECOMMENDATION_GROUPS)), dtype=np.float32)
+        for start in range(0, INDEX_SIZE, chunk_keys):
+            keys = np.arange(start, min(start + chunk_keys, INDEX_SIZE))
+            codes, flags = decode_keys(keys)
+            scores[start : start + len(keys)] = _score_matrix(
+                codes["industry"],
+                codes["region"],
+                codes["budget_constraint"],
+                codes["data_sovereignty"],
+                flags,
+            )
+        return cls(scores)
+
+    @property
+    def nbytes(self):
+        return self.scores.nbytes + self.winners.nbytes
+
+    def lookup(self, inputs):
+        """Return the scores dict for ``inputs``, like ``calculate_recommendation_score``."""
+        try:
+            row = self.scores[profile_key(inputs)]
+        except KeyError:
+            # Labels outside the form's options fall back to the model
+            return calculate_recommendation_score(inputs)
+        return {group: float(score) for group, score in zip(RECOMMENDATION_GROUPS, row)}
+
+    def _winner_grid(self):
+        """View ``winners`` with one axis per select box and per checkbox."""
+        shape = [len(values) for _, values in _RADICES] + [2] * FLAG_BITS
+        return self.winners.reshape(shape)
+
+    def win_fractions(
+        self,
+        industry=None,
+        region=None,
+        budget_constraint=None,
+        data_sovereignty=None,
+        requirements=None,
+    ):
+        """Return the fraction of matching configurations each group wins.
+
+        Arguments left as ``None`` range over every option; ``requirements``
+        maps checkbox names to True/False to fix them.
+        """
+        fixed = {
+            "industry": industry,
+            "region": region,
+            "budget_constraint": budget_constraint,
+            "data_sovereignty": data_sovereignty,
+        }
+        selection = [
+            slice(None) if fixed[field] is None else values.index(fixed[field])
+            for field, values in _RADICES
+        ]
+        # The most significant flag bit is the first checkbox axis
+        checkboxes = [slice(None)] * FLAG_BITS
+        for name, required in (requirements or {}).items():
+            if required is not None:
+                checkboxes[FLAG_BITS - 1 - FLAGS.index(name)] = int(bool(required))
+        winners = self._winner_grid()[tuple(selection + checkboxes)]
+        counts = np.bincount(np.ravel(winners), minlength=len(RECOMMENDATION_GROUPS))
+        total = counts.sum()
+        return {
+            group: float(count / total) if total else 0.0
+            for group, count in zip(RECOMMENDATION_GROUPS, counts)
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def recommendation_index():
+    """Return the process-wide index, building it on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = RecommendationIndex.build()
+        return _index
@@ -0,0 +1,494 @@
+"""Headless HTTP API serving the dashboard datasets as JSON or Arrow.
+
+Run from the repository root with ``python scripts/api_server.py``.
+"""
+
+import io
+import gzip
+import json
+import time
+import hashlib
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from . import compliance_data, market_data, performance_data
+from .exports import EXPORT_FORMATS, write_export
+from .schema import to_float64
+from .snapshots import latest_snapshot
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+# Seconds a built response is reused before its loader is consulted again
+DEFAULT_TTL = 60
+MAX_ENTRIES = 256
+# Smaller bodies are sent uncompressed; gzip overhead outweighs the savings
+MIN_GZIP_BYTES = 1024
+ROLES = ["Executive", "Manager", "Analyst"]
+FORMATS = {
+    "json": "application/json",
+    "arrow": EXPORT_FORMATS["arrow"]["mime"],
+}
+
+
+class APIError(Exception):
+    """A client error reported as ``{"error": message}`` with ``status``."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Dataset:
+    """A loader exposed by the API.
+
+    ``params`` are loader keyword arguments accepted from the query string.
+    ``keys`` names the dimension ("region" or "provider") that dict results
+    are keyed by; ``region_columns``/``provider_columns`` list the columns
+    of wide frames holding one region or provider each. Long frames are
+    filtered on their ``Region`` and ``Provider`` columns.
+    """
+
+    def __init__(
+        self,
+        name,
+        loader,
+        params=(),
+        keys=None,
+        region_columns=(),
+        provider_columns=(),
+    ):
+        self.name = name
+        self.loader = loader
+        self.params = tuple(params)
+        self.keys = keys
+        self.region_columns = tuple(region_columns)
+        self.provider_columns = tuple(provider_columns)
+
+    def describe(self):
+        return {
+            "name": self.name,
+            "path": f"{API_PREFIX}/datasets/{self.name}",
+            "params": list(self.params),
+        }
+
+
+_GROWTH_REGIONS = ["North America", "Asia Pacific", "Europe"]
+_PRICED_PROVIDERS = performance_data.TCO_PROVIDERS
+
+DATASETS = {
+    dataset.name: dataset
+    for dataset in [
+        Dataset("market_share", market_data.get_market_share_data, ["role"]),
+        Dataset(
+            "growth_trends",
+            market_data.get_growth_trends_data,
+            ["role"],
+            region_columns=_GROWTH_REGIONS,
+        ),
+        Dataset(
+            "regional_metrics",
+            market_data.get_regional_metrics,
+            ["role"],
+            keys="region",
+        ),
+        Dataset("key_metrics", market_data.get_key_metrics, ["role"]),
+        Dataset("performance_metrics", performance_data.get_performance_metrics),
+        Dataset(
+            "performance_history",
+            performance_data.get_performance_history,
+            ["start", "end"],
+        ),
+        Dataset(
+            "sla_comparisons",
+            performance_data.get_sla_comparisons,
+            provider_columns=_PRICED_PROVIDERS,
+        ),
+        Dataset(
+            "cost_analysis",
+            performance_data.get_cost_analysis,
+            provider_columns=_PRICED_PROVIDERS,
+        ),
+        Dataset("compliance_matrix", compliance_data.get_compliance_matrix),
+        Dataset("security_certifications", compliance_data.get_security_certifications),
+        Dataset("audit_history", compliance_data.get_audit_history),
+        Dataset(
+            "data_residency", compliance_data.get_data_residency_map, keys="region"
+        ),
+        Dataset("region_coordinates", compliance_data.get_region_coordinates),
+    ]
+}
+FILTERS = ("region", "provider")
+COMMON_PARAMS = ("format",) + FILTERS
+
+
+def _split(value):
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _folded(values):
+    return {str(value).casefold() for value in values}
+
+
+def _filter_frame(frame, dataset, regions, providers):
+    rows = np.ones(len(frame), dtype=bool)
+    columns = list(frame.columns)
+    for wanted, column, wide in (
+        (regions, "Region", dataset.region_columns),
+        (providers, "Provider", dataset.provider_columns),
+    ):
+        if not wanted:
+            continue
+        if column in frame.columns:
+            rows &= frame[column].astype(str).str.casefold().isin(wanted).to_numpy()
+        elif wide:
+            columns = [
+                c for c in columns if c not in wide or str(c).casefold() in wanted
+            ]
+    return frame.loc[rows, columns].reset_index(drop=True)
+
+
+def filter_data(data, dataset, regions=(), providers=()):
+    """Apply region/provider filters to a loader's ``data`` value."""
+    regions, providers = _folded(regions), _folded(providers)
+    if isinstance(data, pd.DataFrame):
+        return _filter_frame(data, dataset, regions, providers)
+    wanted = {"region": regions, "provider": providers}.get(dataset.keys)
+    if isinstance(data, dict) and wanted:
+        # Residency is keyed by continent but also lists region codes
+        return {
+            key: value
+            for key, value in data.items()
+            if key.casefold() in wanted
+            or (isinstance(value, dict) and wanted & _folded(value.get("regions", ())))
+        }
+    return data
+
+
+def to_jsonable(value):
+    """Convert loader output to plain JSON types; callables are dropped."""
+    if isinstance(value, pd.DataFrame):
+        value = value.assign(
+            **{
+                str(column): to_float64(value[column])
+                for column in value.columns[value.dtypes == np.float32]
+            }
+        )
+        frame = value.astype(object).where(value.notna(), None)
+        return [
+            {str(k): to_jsonable(v) for k, v in row.items()}
+            for row in frame.to_dict(orient="records")
+        ]
+    if isinstance(value, pd.Series):
+        return to_jsonable(value.to_frame().T)
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items() if not callable(v)}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, (pd.Timestamp, datetime, date, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def encode(payload, frame, fmt):
+    """Serialize a response: ``payload`` as JSON, or ``frame`` as Arrow IPC."""
+    if fmt == "arrow":
+        if not isinstance(frame, pd.DataFrame):
+            raise APIError(406, "the arrow format needs a tabular dataset")
+        buffer = io.BytesIO()
+        write_export(frame, "arrow", buffer)
+        return buffer.getvalue()
+    return json.dumps(to_jsonable(payload), separators=(",", ":")).encode("utf-8")
+
+
+class _Entry:
+    __slots__ = ("etag", "body", "gzipped", "content_type", "version", "expires_at")
+
+    def __init__(self, body, content_type, version, expires_at):
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.body = body
+        # Compressed once when built, so every hit is a lookup
+        self.gzipped = (
+            gzip.compress(body, compresslevel=6)
+            if len(body) >= MIN_GZIP_BYTES
+            else None
+        )
+        self.content_type = content_type
+        self.version = version
+        self.expires_at = expires_at
+
+
+def _accepts_gzip(header):
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            q = params.strip()
+            if not q.startswith("q="):
+                return True
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def _etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.replace("-gzip", "") == etag:
+            return True
+    return False
+
+
+class DatasetAPI:
+    """Routes API requests and caches encoded responses.
+
+    Each response is built once per (path, query) and data version: the
+    body is serialized, hashed into an ETag and gzip-compressed up front,
+    so repeat requests are a dictionary lookup and an ``If-None-Match``
+    match returns 304 without touching the loaders. Entries are rebuilt
+    after ``ttl`` seconds or when the ingestion worker publishes a new
+    snapshot, and at most ``max_entries`` are kept.
+    """
+
+    def __init__(
+        self, datasets=None, ttl=DEFAULT_TTL, max_entries=MAX_ENTRIES, clock=None
+    ):
+        self.datasets = DATASETS if datasets is None else datasets
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock or time.monotonic
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def handle(self, method, target, headers=None):
+        """Answer one request; returns ``(status, headers, body)``."""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        if method not in ("GET", "HEAD"):
+            return self._error(405, f"method {method} not allowed")
+        parts = urlsplit(target)
+        try:
+            query = self._query(parts.query)
+            entry = self._entry(parts.path.rstrip("/") or "/", query)
+        except APIError as exc:
+            return self._error(exc.status, exc.message)
+        except Exception:
+            logger.exception("failed to build %s", target)
+            return self._error(500, "internal error")
+
+        response_headers = {
+            "ETag": entry.etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if _etag_matches(headers.get("if-none-match"), entry.etag):
+            return 304, response_headers, b""
+        body = entry.body
+        if entry.gzipped is not None and _accepts_gzip(headers.get("accept-encoding")):
+            body = entry.gzipped
+            response_headers["Content-Encoding"] = "gzip"
+            response_headers["ETag"] = entry.etag[:-1] + '-gzip"'
+        response_headers["Content-Type"] = entry.content_type
+        response_headers["Content-Length"] = str(len(body))
+        return 200, response_headers, b"" if method == "HEAD" else body
+
+    @staticmethod
+    def _error(status, message):
+        body = json.dumps({"error": message}).encode("utf-8")
+        return (
+            status,
+            {"Content-Type": "application/json", "Content-Length": str(len(body))},
+            body,
+        )
+
+    @staticmethod
+    def _query(raw):
+        query = {}
+        for key, values in parse_qs(raw, keep_blank_values=False).items():
+            query[key.lower()] = ",".join(values)
+        fmt = query.setdefault("format", "json")
+        if fmt not in FORMATS:
+            raise APIError(400, f"unknown format {fmt!r}; use one of {list(FORMATS)}")
+        role = query.get("role")
+        if role is not None and role not in ROLES:
+            raise APIError(400, f"unknown role {role!r}; use one of {ROLES}")
+        return query
+
+    def _entry(self, path, query):
+        key = (path, tuple(sorted(query.items())))
+        snapshot = latest_snapshot()
+        version = snapshot.version if snapshot is not None else None
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.version == version
+                and now < entry.expires_at
+            ):
+                self._entries.move_to_end(key)
+                return entry
+        payload, frame = self._build(path, query)
+        body = encode(dict(payload, version=version), frame, query["format"])
+        entry = _Entry(body, FORMATS[query["format"]], version, now + self.ttl)
+        with self._lock:
+            self.builds += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _build(self, path, query):
+        """Return ``(payload, frame)`` for a route; ``frame`` feeds Arrow output."""
+        if path in (API_PREFIX, API_PREFIX + "/datasets"):
+            self._check_params(query, ())
+            datasets = [dataset.describe() for dataset in self.datasets.values()]
+            tco = {"name": "tco", "path": f"{API_PREFIX}/tco"}
+            tco["params"] = list(performance_data.TCO_CATEGORIES)
+            return {"datasets": datasets + [tco], "filters": list(FILTERS)}, None
+        if path == API_PREFIX + "/tco":
+            return self._tco(query)
+        prefix = API_PREFIX + "/datasets/"
+        if path.startswith(prefix) and path[len(prefix) :] in self.datasets:
+            return self._dataset(self.datasets[path[len(prefix) :]], query)
+        raise APIError(404, f"no such endpoint: {path}")
+
+    @staticmethod
+    def _check_params(query, allowed):
+        unknown = sorted(set(query) - set(COMMON_PARAMS) - set(allowed))
+        if unknown:
+            raise APIError(400, f"unsupported parameters: {', '.join(unknown)}")
+
+    def _dataset(self, dataset, query):
+        self._check_params(query, dataset.params)
+        kwargs = {name: query[name] for name in dataset.params if name in query}
+        try:
+            value = dataset.loader(**kwargs)
+        except (TypeError, ValueError) as exc:
+            raise APIError(400, str(exc)) from exc
+        regions = _split(query.get("region", ""))
+        providers = _split(query.get("provider", ""))
+        if isinstance(value, dict) and "data" in value:
+            payload = dict(value)
+            payload["data"] = filter_data(value["data"], dataset, regions, providers)
+            frame = payload["data"]
+        else:
+            frame = filter_data(value, dataset, regions, providers)
+            payload = {"data": frame}
+        payload["dataset"] = dataset.name
+        payload["params"] = kwargs
+        return payload, frame
+
+    def _tco(self, query):
+        self._check_params(query, performance_data.TCO_CATEGORIES)
+        profile = {}
+        for category in performance_data.TCO_CATEGORIES:
+            try:
+                profile[category] = float(query.get(category, 1))
+            except ValueError:
+                raise APIError(400, f"{category} must be a number") from None
+        frame = performance_data.calculate_tco(profile)
+        providers = _folded(_split(query.get("provider", "")))
+        if providers:
+            frame = frame[frame["Provider"].str.casefold().isin(providers)]
+            frame = frame.reset_index(drop=True)
+        return {"profile": profile, "data": frame}, frame
+
+    def warm(self):
+        """Build the unfiltered responses up front; returns how many were built."""
+        targets = []
+        for dataset in self.datasets.values():
+            path = f"{API_PREFIX}/datasets/{dataset.name}"
+            if "role" in dataset.params:
+                targets += [f"{path}?role={role}" for role in ROLES]
+            elif not dataset.params:
+                targets.append(path)
+        built = 0
+        for target in targets:
+            status, _, _ = self.handle("GET", target)
+            built += status == 200
+        return built
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """``http.server`` adapter around a ``DatasetAPI``."""
+
+    api = None
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, method):
+        status, headers, body = self.api.handle(method, self.path, self.headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_HEAD(self):
+        self._respond("HEAD")
+
+    def log_message(self, format, *args):
+        logger.info("%s " + format, self.address_string(), *args)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, api=None):
+    """Return a threading HTTP server bound to ``host:port`` serving ``api``."""
+    handler = type(
+        "BoundAPIRequestHandler", (APIRequestHandler,), {"api": api or DatasetAPI()}
+    )
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST, help="interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="seconds before a cached response is rebuilt",
+    )
+    parser.add_argument(
+        "--no-warm", action="store_true", help="skip building responses at startup"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    api = DatasetAPI(ttl=args.ttl)
+    if not args.no_warm:
+        logger.info("prepared %d responses", api.warm())
+    server = make_server(args.host, args.port, api)
+    logger.info("serving on http://%s:%d%s", args.host, args.port, API_PREFIX)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,198 @@
+import sys
+import time
+import threading
+import functools
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_TTL = 300  # seconds
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def estimate_nbytes(value):
+    """Estimate the in-memory size of a loader result in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+def _freeze(value):
+    """Turn loader arguments into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "nbytes")
+
+    def __init__(self, value, expires_at, nbytes):
+        self.value = value
+        self.expires_at = expires_at
+        self.nbytes = nbytes
+
+
+class DataCache:
+    """Process-wide LRU cache for data loader results with per-loader TTLs.
+
+    Entries are keyed by loader name and call arguments. Once the estimated
+    size of all entries exceeds ``max_bytes`` the least recently used entries
+    are evicted. Cached values are shared between callers and must be treated
+    as read-only.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._ttls = {}
+        self._stats = {}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+    def _loader_stats(self, name):
+        return self._stats.setdefault(
+            name, {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        )
+
+    def register(self, name, ttl=DEFAULT_TTL):
+        """Register a loader name with its time-to-live in seconds."""
+        with self._lock:
+            self._ttls[name] = ttl
+            self._loader_stats(name)
+
+    def set_ttl(self, name, ttl):
+        """Change the TTL used for future entries of a loader."""
+        with self._lock:
+            self._ttls[name] = ttl
+
+    def get_or_load(self, name, args, kwargs, loader):
+        """Return the cached result for a call, running ``loader`` on a miss."""
+        key = (name, _freeze(args), _freeze(kwargs))
+        now = self._clock()
+        with self._lock:
+            stats = self._loader_stats(name)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at is None or entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    stats["hits"] += 1
+                    return entry.value
+                self._remove(key)
+                stats["expired"] += 1
+            stats["misses"] += 1
+
+        # Build outside the lock so slow loaders don't block other sessions
+        value = loader(*args, **kwargs)
+        self._store(key, name, value)
+        return value
+
+    def _store(self, key, name, value):
+        nbytes = estimate_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            ttl = self._ttls.get(name, DEFAULT_TTL)
+            expires_at = None if ttl is None else self._clock() + ttl
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, expires_at, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes and self._entries:
+                old_key = next(iter(self._entries))
+                self._remove(old_key)
+                self._loader_stats(old_key[0])["evictions"] += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
+
+    def invalidate(self, name=None):
+        """Drop cached entries for one loader, or for every loader."""
+        with self._lock:
+            keys = [k for k in self._entries if name is None or k[0] == name]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def stats(self):
+        """Return hit/miss counters, entry counts and bytes per loader."""
+        with self._lock:
+            report = {}
+            for name, counters in self._stats.items():
+                entries = [e for k, e in self._entries.items() if k[0] == name]
+                lookups = counters["hits"] + counters["misses"]
+                report[name] = {
+                    **counters,
+                    "ttl": self._ttls.get(name, DEFAULT_TTL),
+                    "entries": len(entries),
+                    "bytes": sum(e.nbytes for e in entries),
+                    "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+                }
+            return report
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def reset_stats(self):
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = {
+                    "hits": 0,
+                    "misses": 0,
+                    "evictions": 0,
+                    "expired": 0,
+                }
+
+
+data_cache = DataCache()
+
+
+def cached_loader(ttl=DEFAULT_TTL, name=None, cache=None):
+    """Decorator that routes a ``get_*`` loader through the shared data cache.
+
+    The undecorated loader stays reachable as ``loader.__wrapped__``.
+    """
+
+    def decorator(func):
+        loader_name = name or func.__name__
+        target = cache if cache is not None else data_cache
+        target.register(loader_name, ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return target.get_or_load(loader_name, args, kwargs, func)
+
+        wrapper.cache_name = loader_name
+        wrapper.invalidate = lambda: target.invalidate(loader_name)
+        return wrapper
+
+    return decorator
+
+
+def invalidate(name=None):
+    """Invalidate the shared data cache (all loaders when ``name`` is None)."""
+    return data_cache.invalidate(name)
+
+
+def cache_stats():
+    """Return statistics for the shared data cache."""
+    return data_cache.stats()
@@ -0,0 +1,37 @@
+"""Asynchronous collection of provider metrics into the performance dataset."""
+
+from .http import HTTPClient, HTTPError
+from .clients import (
+    CLIENT_TYPES,
+    HTTPProviderClient,
+    ProviderClient,
+    create_client,
+    register_client,
+)
+from .collector import (
+    BatchWriter,
+    DataCollector,
+    FrameSink,
+    RealTimeCollector,
+    StoreSink,
+    backoff_delay,
+)
+from .stub_server import StubMetricsServer, stub_metrics
+
+__all__ = [
+    "BatchWriter",
+    "CLIENT_TYPES",
+    "DataCollector",
+    "FrameSink",
+    "HTTPClient",
+    "HTTPError",
+    "HTTPProviderClient",
+    "ProviderClient",
+    "RealTimeCollector",
+    "StoreSink",
+    "StubMetricsServer",
+    "backoff_delay",
+    "create_client",
+    "register_client",
+    "stub_metrics",
+]
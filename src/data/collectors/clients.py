@@ -0,0 +1,90 @@
+from urllib.parse import quote
+
+from ..timeseries_store import METRIC_COLUMNS
+
+CLIENT_TYPES = {}
+
+
+def register_client(kind):
+    """Class decorator registering a ``ProviderClient`` under ``kind``."""
+
+    def decorator(cls):
+        CLIENT_TYPES[kind] = cls
+        return cls
+
+    return decorator
+
+
+def create_client(kind, **options):
+    """Instantiate the client registered as ``kind``."""
+    try:
+        cls = CLIENT_TYPES[kind]
+    except KeyError:
+        raise ValueError(f"unknown collector client type: {kind!r}") from None
+    return cls(**options)
+
+
+class ProviderClient:
+    """Interface between the collector and one provider's metrics API.
+
+    Subclasses list the endpoints to poll and turn each response into
+    sample dicts keyed by ``METRIC_COLUMNS``. The collector owns the HTTP
+    connections, concurrency, retries and batching; clients only describe
+    what to fetch and how to read it.
+    """
+
+    name = None
+
+    def endpoints(self):
+        """Return ``(region, url)`` pairs polled every collection round."""
+        raise NotImplementedError
+
+    def parse(self, region, payload):
+        """Return sample dicts for one decoded JSON response."""
+        raise NotImplementedError
+
+    async def fetch(self, http, region, url):
+        """Fetch and parse one endpoint using the collector's ``HTTPClient``."""
+        return self.parse(region, await http.get_json(url))
+
+
+@register_client("http")
+class HTTPProviderClient(ProviderClient):
+    """Client for JSON metrics served at ``{base_url}/metrics/{provider}/{region}``.
+
+    Responses look like ``{"metrics": {"Latency (ms)": 12.5, ...}}``, or
+    ``{"samples": [{...}, ...]}`` for endpoints reporting several hosts.
+    Samples missing any of ``METRIC_COLUMNS`` are dropped.
+    """
+
+    path = "/metrics/{provider}/{region}"
+
+    def __init__(self, name, base_url, regions):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.regions = list(regions)
+
+    def endpoints(self):
+        return [
+            (
+                region,
+                self.base_url
+                + self.path.format(
+                    provider=quote(self.name, safe=""), region=quote(region, safe="")
+                ),
+            )
+            for region in self.regions
+        ]
+
+    def parse(self, region, payload):
+        if "samples" in payload:
+            samples = payload["samples"]
+        else:
+            samples = [payload.get("metrics", {})]
+        rows = []
+        for sample in samples:
+            if all(sample.get(name) is not None for name in METRIC_COLUMNS):
+                row = {"Provider": self.name, "Region": region}
+                row.update((name, sample[name]) for name in METRIC_COLUMNS)
+                rows.append(row)
+        return rows
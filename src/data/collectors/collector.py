@@ -0,0 +1,227 @@
+import time
+import random
+import asyncio
+import logging
+
+import pandas as pd
+
+from .http import DEFAULT_TIMEOUT, HTTPClient, HTTPError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_CONNECTIONS_PER_HOST = 32
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.1
+MAX_BACKOFF = 5.0
+DEFAULT_BATCH_ROWS = 5000
+
+# Connection-level failures worth another attempt
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    asyncio.IncompleteReadError,
+    ConnectionError,
+    OSError,
+)
+
+
+def _retryable_status(status):
+    return status >= 500 or status == 429
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF, cap=MAX_BACKOFF):
+    """Exponential backoff with full jitter for retry number ``attempt`` (from 0)."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class FrameSink:
+    """Collects written batches in memory; ``frame()`` concatenates them."""
+
+    def __init__(self):
+        self.batches = []
+
+    def write(self, frame):
+        self.batches.append(frame)
+        return len(frame)
+
+    def frame(self):
+        if not self.batches:
+            return pd.DataFrame()
+        return pd.concat(self.batches, ignore_index=True)
+
+
+class StoreSink:
+    """Appends batches to a ``PerformanceStore``.
+
+    Batches are sorted by timestamp first; rows older than the end of the
+    store (e.g. a slow round finishing after a newer one) are dropped and
+    counted in ``dropped`` instead of failing the append.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.dropped = 0
+
+    def write(self, frame):
+        frame = frame.sort_values("Timestamp", kind="stable")
+        last = self.store.time_bounds()[1]
+        if last is not None:
+            late = frame["Timestamp"] < last
+            self.dropped += int(late.sum())
+            frame = frame[~late]
+        self.store.append(frame)
+        return len(frame)
+
+
+class BatchWriter:
+    """Buffers sample dicts and hands them to ``sink`` ``batch_rows`` at a time."""
+
+    def __init__(self, sink, batch_rows=DEFAULT_BATCH_ROWS):
+        self.sink = sink
+        self.batch_rows = batch_rows
+        self._rows = []
+        self.batches = 0
+        self.rows_written = 0
+
+    def add(self, rows):
+        self._rows.extend(rows)
+        if len(self._rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        self.rows_written += self.sink.write(pd.DataFrame(rows))
+        self.batches += 1
+
+
+class DataCollector:
+    """Polls every endpoint of every provider client once per round.
+
+    At most ``concurrency`` requests are in flight, each host gets a pool of
+    at most ``connections_per_host`` keep-alive connections, and every
+    request is bounded by ``timeout`` seconds. Timeouts, connection errors
+    and 5xx/429 responses are retried up to ``retries`` times with jittered
+    exponential backoff (the concurrency slot is released while waiting);
+    any other error (a bad payload, a failing ``parse``) fails just that
+    endpoint for this round. Samples are stamped with the round's timestamp
+    and written to ``sink`` in batches of ``batch_rows``.
+    """
+
+    def __init__(
+        self,
+        clients,
+        sink=None,
+        concurrency=DEFAULT_CONCURRENCY,
+        connections_per_host=DEFAULT_CONNECTIONS_PER_HOST,
+        timeout=DEFAULT_TIMEOUT,
+        retries=DEFAULT_RETRIES,
+        backoff=DEFAULT_BACKOFF,
+        batch_rows=DEFAULT_BATCH_ROWS,
+    ):
+        self.clients = list(clients)
+        self.sink = FrameSink() if sink is None else sink
+        self.concurrency = concurrency
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.batch_rows = batch_rows
+
+    @property
+    def providers(self):
+        return [client.name for client in self.clients]
+
+    async def _fetch(self, http, slots, client, region, url, stats):
+        for attempt in range(self.retries + 1):
+            async with slots:
+                stats["requests"] += 1
+                try:
+                    return await client.fetch(http, region, url)
+                except HTTPError as exc:
+                    error = exc
+                    if not _retryable_status(exc.status):
+                        break
+                except RETRYABLE_ERRORS as exc:
+                    error = exc
+                except Exception as exc:
+                    # Bad payloads or parse errors: not worth retrying
+                    error = exc
+                    break
+            if attempt < self.retries:
+                stats["retries"] += 1
+                await asyncio.sleep(backoff_delay(attempt, self.backoff))
+        stats["failures"] += 1
+        logger.warning("collecting %s failed: %s", url, error)
+        return []
+
+    async def collect(self, collected_at=None):
+        """Run one collection round and return a report dict."""
+        collected_at = pd.Timestamp(collected_at or pd.Timestamp.now()).as_unit("ns")
+        start = time.perf_counter()
+        stats = {"requests": 0, "retries": 0, "failures": 0}
+        writer = BatchWriter(self.sink, self.batch_rows)
+        slots = asyncio.Semaphore(self.concurrency)
+        endpoints = [
+            (client, region, url)
+            for client in self.clients
+            for region, url in client.endpoints()
+        ]
+        samples = 0
+        async with HTTPClient(self.connections_per_host, self.timeout) as http:
+            tasks = [
+                asyncio.ensure_future(
+                    self._fetch(http, slots, client, region, url, stats)
+                )
+                for client, region, url in endpoints
+            ]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    rows = await task
+                    for row in rows:
+                        row["Timestamp"] = collected_at
+                    samples += len(rows)
+                    writer.add(rows)
+            finally:
+                # Keep the rows collected so far even if the round is aborted
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                writer.flush()
+            connections = http.connections_opened
+        return {
+            "timestamp": collected_at,
+            "endpoints": len(endpoints),
+            "samples": samples,
+            "rows_written": writer.rows_written,
+            "batches": writer.batches,
+            "connections": connections,
+            "seconds": time.perf_counter() - start,
+            **stats,
+        }
+
+    def run(self, collected_at=None):
+        """Synchronous wrapper around ``collect`` for scripts and tests."""
+        return asyncio.run(self.collect(collected_at))
+
+
+class RealTimeCollector(DataCollector):
+    """Collects a round every ``interval`` seconds."""
+
+    def __init__(self, clients, interval=60, **options):
+        super().__init__(clients, **options)
+        self.interval = interval
+
+    async def run_forever(self, rounds=None):
+        """Collect until cancelled, or for ``rounds`` rounds; returns the last report."""
+        completed, report = 0, None
+        while rounds is None or completed < rounds:
+            started = time.monotonic()
+            report = await self.collect()
+            completed += 1
+            if completed != rounds:
+                await asyncio.sleep(
+                    max(0.0, self.interval - (time.monotonic() - started))
+                )
+        return report
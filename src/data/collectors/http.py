@@ -0,0 +1,169 @@
+import json
+import asyncio
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_CONNECTIONS_PER_HOST = 16
+
+
+class HTTPError(Exception):
+    """A response with a 4xx/5xx status."""
+
+    def __init__(self, status, url, body=b""):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+    async def wait_closed(self):
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class HostPool:
+    """Keep-alive connections to one host, at most ``limit`` open at a time."""
+
+    def __init__(self, host, port, limit=DEFAULT_CONNECTIONS_PER_HOST):
+        self.host = host
+        self.port = port
+        self._idle = []
+        self._slots = asyncio.Semaphore(limit)
+        self.opened = 0
+
+    async def acquire(self):
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            self._slots.release()
+            raise
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    def release(self, connection, reusable):
+        if reusable:
+            self._idle.append(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        for connection in idle:
+            await connection.wait_closed()
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed before the response")
+    status = int(status_line.split(b" ", 2)[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        raise ValueError("chunked responses are not supported")
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    keep_alive = headers.get("connection", "").lower() != "close"
+    return status, headers, body, keep_alive
+
+
+class HTTPClient:
+    """Minimal asyncio HTTP/1.1 client with per-host keep-alive pools.
+
+    Only what the collectors need: GET requests with Content-Length bodies
+    over plain TCP. Each request, including connecting, is bounded by
+    ``timeout`` seconds, and a connection that times out or errors is
+    discarded rather than reused.
+    """
+
+    def __init__(
+        self,
+        connections_per_host=DEFAULT_CONNECTIONS_PER_HOST,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self._pools = {}
+
+    def pool(self, host, port):
+        key = (host, port)
+        if key not in self._pools:
+            self._pools[key] = HostPool(host, port, self.connections_per_host)
+        return self._pools[key]
+
+    @property
+    def connections_opened(self):
+        return sum(pool.opened for pool in self._pools.values())
+
+    async def get(self, url):
+        """Return ``(status, body)``; raises ``HTTPError`` for 4xx/5xx."""
+        parts = urlsplit(url)
+        if parts.scheme != "http":
+            raise ValueError(f"unsupported URL scheme in {url!r}")
+        pool = self.pool(parts.hostname, parts.port or 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request = (
+            f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+            "Accept: application/json\r\nConnection: keep-alive\r\n\r\n"
+        ).encode("latin-1")
+
+        # One deadline covers waiting for a pool slot, connecting and the
+        # exchange, so an unreachable host cannot stall past ``timeout``
+        status, body = await asyncio.wait_for(
+            self._request(pool, request), self.timeout
+        )
+        if status >= 400:
+            raise HTTPError(status, url, body)
+        return status, body
+
+    @staticmethod
+    async def _request(pool, request):
+        connection = await pool.acquire()
+        reusable = False
+        try:
+            connection.writer.write(request)
+            await connection.writer.drain()
+            status, _, body, reusable = await _read_response(connection.reader)
+        finally:
+            # A cancelled or failed exchange closes the connection
+            pool.release(connection, reusable)
+        return status, body
+
+    async def get_json(self, url):
+        _, body = await self.get(url)
+        return json.loads(body)
+
+    async def close(self):
+        for pool in self._pools.values():
+            await pool.close()
+        self._pools.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
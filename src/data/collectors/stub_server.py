@@ -0,0 +1,132 @@
+import json
+import zlib
+import asyncio
+from urllib.parse import unquote
+
+from .clients import HTTPProviderClient
+
+_REASONS = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}
+
+
+def stub_metrics(provider, region, request_number=0):
+    """Deterministic metric values for one endpoint and request number."""
+    seed = zlib.crc32(f"{provider}/{region}/{request_number}".encode())
+    unit = (seed % 10_000) / 10_000
+    return {
+        "Latency (ms)": round(10 + 90 * unit, 3),
+        "Uptime (%)": round(99.0 + unit, 4),
+        "IOPS": 1000 + seed % 9000,
+        "Network Throughput (Gbps)": round(1 + 9 * (1 - unit), 3),
+    }
+
+
+class StubMetricsServer:
+    """Local keep-alive HTTP server imitating provider metrics APIs.
+
+    Serves ``GET /metrics/{provider}/{region}`` for any provider and region
+    with ``stub_metrics`` values, so collectors can be exercised offline
+    against hundreds of endpoints. ``fail_first`` makes the first N requests
+    to each endpoint return 503 and ``delay`` holds every response for that
+    many seconds. Regions listed in ``malformed`` answer 200 with a body
+    that is not JSON. Counters record connections, requests and the peak number
+    of requests in flight. Use as ``async with StubMetricsServer() as server``.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, fail_first=0, delay=0.0, malformed=()):
+        self.host = host
+        self.port = port
+        self.fail_first = fail_first
+        self.delay = delay
+        self.malformed = set(malformed)
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._hits = {}
+        self._handlers = set()
+        self._server = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def clients(self, providers, regions):
+        """Return an ``HTTPProviderClient`` per provider pointing at this server."""
+        return [HTTPProviderClient(name, self.base_url, regions) for name in providers]
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise outlive the server
+            for handler in list(self._handlers):
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                parts = request_line.decode("latin-1").split()
+                path = parts[1] if len(parts) > 1 else "/"
+                status, body = await self._respond(path)
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        "Connection: keep-alive\r\n\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _respond(self, path):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            segments = [unquote(s) for s in path.split("?")[0].split("/") if s]
+            if len(segments) != 3 or segments[0] != "metrics":
+                return 404, b'{"error": "not found"}'
+            hits = self._hits.get(path, 0)
+            self._hits[path] = hits + 1
+            if hits < self.fail_first:
+                return 503, b'{"error": "unavailable"}'
+            _, provider, region = segments
+            if region in self.malformed:
+                return 200, b'{"metrics": '
+            payload = {
+                "provider": provider,
+                "region": region,
+                "metrics": stub_metrics(provider, region, hits),
+            }
+            return 200, json.dumps(payload).encode()
+        finally:
+            self.in_flight -= 1
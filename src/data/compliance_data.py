@@ -1,28 +1,54 @@
 from datetime import datetime
+from pathlib import Path
+import numpy as np
 import pandas as pd
 
+from .cache import cached_loader
+from .snapshots import snapshot_dataset
+from .schema import compact_dtypes
+from .compliance_index import FULL, NONE, PARTIAL, ComplianceMatrix
+from .residency_index import ResidencyCatalog
 
+COMPLIANCE_REQUIREMENTS = [
+    "GDPR",
+    "HIPAA",
+    "FedRAMP",
+    "SOC 2",
+    "ISO 27001",
+    "CCPA",
+    "PCI DSS",
+    "NIST",
+]
+# Support per provider group, in COMPLIANCE_REQUIREMENTS order
+COMPLIANCE_SUPPORT = {
+    "US Providers": [FULL, FULL, FULL, FULL, FULL, FULL, FULL, FULL],
+    "EU Providers": [FULL, PARTIAL, NONE, FULL, FULL, FULL, FULL, PARTIAL],
+    "China Providers": [NONE, NONE, NONE, PARTIAL, FULL, NONE, PARTIAL, NONE],
+}
+
+
+@cached_loader(ttl=86400)
+@snapshot_dataset
+def get_compliance_index():
+    """Get provider compliance support as a bitmask-queryable matrix."""
+    return ComplianceMatrix(
+        list(COMPLIANCE_SUPPORT),
+        COMPLIANCE_REQUIREMENTS,
+        list(COMPLIANCE_SUPPORT.values()),
+    )
+
+
+@cached_loader(ttl=86400)
+@snapshot_dataset
+@compact_dtypes(categorical=list(COMPLIANCE_SUPPORT))
 def get_compliance_matrix():
     """Get compliance requirements matrix."""
-    return pd.DataFrame(
-        {
-            "Requirement": [
-                "GDPR",
-                "HIPAA",
-                "FedRAMP",
-                "SOC 2",
-                "ISO 27001",
-                "CCPA",
-                "PCI DSS",
-                "NIST",
-            ],
-            "US Providers": ["✅", "✅", "✅", "✅", "✅", "✅", "✅", "✅"],
-            "EU Providers": ["✅", "⚠️", "❌", "✅", "✅", "✅", "✅", "⚠️"],
-            "China Providers": ["❌", "❌", "❌", "⚠️", "✅", "❌", "⚠️", "❌"],
-        }
-    )
+    return get_compliance_index().to_frame()
 
 
+@cached_loader(ttl=86400)
+@snapshot_dataset
+@compact_dtypes
 def get_security_certifications():
     """Get security certification data."""
     return pd.DataFrame(
@@ -47,6 +73,30 @@ def get_security_certifications():
     )
 
 
+@cached_loader(ttl=86400)
+@snapshot_dataset
+@compact_dtypes
+def get_audit_history(audits_per_provider=12, seed=42):
+    """Get quarterly audit history ending at each provider's last audit."""
+    security = get_security_certifications()
+    rng = np.random.default_rng(seed)
+    quarters = np.arange(audits_per_provider - 1, -1, -1)
+    providers = np.repeat(security["Provider"].to_numpy(), audits_per_provider)
+    last_audit = np.repeat(security["Last Audit"].to_numpy(), audits_per_provider)
+    audit_dates = last_audit - np.tile(quarters, len(security)) * np.timedelta64(
+        91, "D"
+    )
+    latest_score = np.repeat(security["Risk Score"].to_numpy(), audits_per_provider)
+    # Scores drift up towards the latest audit
+    drift = np.tile(quarters, len(security)) * rng.uniform(0, 0.8, len(providers))
+    scores = np.clip(np.round(latest_score - drift), 0, 100).astype(int)
+    return pd.DataFrame(
+        {"Provider": providers, "Audit Date": audit_dates, "Risk Score": scores}
+    )
+
+
+@cached_loader(ttl=86400)
+@snapshot_dataset
 def get_data_residency_map():
     """Get data residency information."""
     return {
@@ -66,3 +116,25 @@ def get_data_residency_map():
             "compliance": ["ISO 27001", "APEC PRP"],
         },
     }
+
+
+# Packaged (lat, lon) of cloud regions, one row per region code
+REGION_COORDINATES_PATH = Path(__file__).with_name("region_coordinates.csv")
+
+
+@cached_loader(ttl=86400)
+@snapshot_dataset
+def get_region_coordinates():
+    """Get the packaged region coordinate table."""
+    return pd.read_csv(
+        REGION_COORDINATES_PATH, dtype={"lat": "float64", "lon": "float64"}
+    )
+
+
+@cached_loader(ttl=86400)
+@snapshot_dataset
+def get_residency_catalog():
+    """Get data residency as an index by region, provider and framework."""
+    return ResidencyCatalog.from_residency_map(
+        get_data_residency_map(), coordinates=get_region_coordinates()
+    )
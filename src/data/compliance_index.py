@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+# Support levels, ordered so that a higher level satisfies a lower one
+NONE, PARTIAL, FULL = 0, 1, 2
+SUPPORT_SYMBOLS = {FULL: "✅", PARTIAL: "⚠️", NONE: "❌"}
+SUPPORT_LABELS = {FULL: "Full", PARTIAL: "Partial", NONE: "None"}
+_SYMBOL_LEVELS = {symbol: level for level, symbol in SUPPORT_SYMBOLS.items()}
+_SYMBOL_TABLE = np.array([SUPPORT_SYMBOLS[level] for level in (NONE, PARTIAL, FULL)])
+
+_WORD_BITS = 64
+
+
+def _pack(flags):
+    """Pack a providers x requirements boolean matrix into uint64 words per row."""
+    providers, requirements = flags.shape
+    words = -(-requirements // _WORD_BITS)
+    padded = np.zeros((providers, words * _WORD_BITS), dtype=bool)
+    padded[:, :requirements] = flags
+    bits = padded.reshape(providers, words, _WORD_BITS)
+    weights = np.left_shift(np.uint64(1), np.arange(_WORD_BITS, dtype=np.uint64))
+    return (bits * weights).sum(axis=2, dtype=np.uint64)
+
+
+class ComplianceMatrix:
+    """Provider-by-requirement support levels with bitmask set queries.
+
+    ``levels`` is a providers x requirements ``uint8`` array of ``NONE``,
+    ``PARTIAL`` or ``FULL``. Each provider row is also packed into two
+    bitmasks of 64-bit words, one for full support and one for at least
+    partial support, so a requirement-set query is an AND and a compare per
+    word regardless of how many providers or frameworks there are.
+    """
+
+    def __init__(self, providers, requirements, levels):
+        self.providers = list(providers)
+        self.requirements = list(requirements)
+        self.levels = np.asarray(levels, dtype=np.uint8)
+        if self.levels.shape != (len(self.providers), len(self.requirements)):
+            raise ValueError("levels must be providers x requirements")
+        self._positions = {name: i for i, name in enumerate(self.requirements)}
+        self.full_bits = _pack(self.levels >= FULL)
+        self.covered_bits = _pack(self.levels >= PARTIAL)
+
+    @classmethod
+    def from_frame(cls, frame, requirement_column="Requirement"):
+        """Build from the symbol table returned by ``get_compliance_matrix``."""
+        providers = [c for c in frame.columns if c != requirement_column]
+        symbols = frame[providers].to_numpy().T
+        levels = np.vectorize(_SYMBOL_LEVELS.__getitem__, otypes=[np.uint8])(symbols)
+        return cls(providers, frame[requirement_column], levels)
+
+    def to_frame(self):
+        """Return the requirement-by-provider symbol table."""
+        frame = pd.DataFrame(_SYMBOL_TABLE[self.levels.T], columns=self.providers)
+        frame.insert(0, "Requirement", self.requirements)
+        return frame
+
+    @property
+    def nbytes(self):
+        return self.levels.nbytes + self.full_bits.nbytes + self.covered_bits.nbytes
+
+    def requirement_mask(self, requirements):
+        """Pack requirement names into query words; unknown names raise ``KeyError``."""
+        flags = np.zeros((1, len(self.requirements)), dtype=bool)
+        for name in requirements:
+            if name not in self._positions:
+                raise KeyError(f"unknown requirement {name!r}")
+            flags[0, self._positions[name]] = True
+        return _pack(flags)[0]
+
+    def satisfies(self, requirements, level=FULL):
+        """Return a boolean per provider: every requirement met at ``level`` or better."""
+        mask = self.requirement_mask(requirements)
+        bits = self.full_bits if level >= FULL else self.covered_bits
+        return ((bits & mask) == mask).all(axis=1)
+
+    def providers_satisfying(self, requirements, level=FULL):
+        """Return the providers meeting every requirement at ``level`` or better."""
+        met = self.satisfies(requirements, level)
+        return [p for p, ok in zip(self.providers, met) if ok]
+
+    def coverage(self, requirements):
+        """Return each provider's weakest support level across ``requirements``."""
+        full = self.satisfies(requirements, FULL)
+        covered = self.satisfies(requirements, PARTIAL)
+        levels = np.where(full, FULL, np.where(covered, PARTIAL, NONE))
+        return dict(zip(self.providers, levels.tolist()))
@@ -0,0 +1,128 @@
+import gzip
+import tempfile
+
+DEFAULT_CHUNK_ROWS = 50_000
+# Exports larger than this spill from memory to a temporary file
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+EXPORT_FORMATS = {
+    "csv": {"label": "CSV", "suffix": ".csv", "mime": "text/csv"},
+    "csv.gz": {"label": "CSV (gzip)", "suffix": ".csv.gz", "mime": "application/gzip"},
+    "parquet": {
+        "label": "Parquet",
+        "suffix": ".parquet",
+        "mime": "application/vnd.apache.parquet",
+    },
+    "arrow": {
+        "label": "Arrow IPC",
+        "suffix": ".arrow",
+        "mime": "application/vnd.apache.arrow.file",
+    },
+}
+
+
+def _resolve(frame):
+    """Accept a DataFrame or a zero-argument callable that builds one."""
+    return frame() if callable(frame) else frame
+
+
+def iter_csv_chunks(frame, chunk_rows=DEFAULT_CHUNK_ROWS, index=False):
+    """Yield a DataFrame as UTF-8 CSV bytes, ``chunk_rows`` rows at a time."""
+    frame = _resolve(frame)
+    if frame.empty:
+        yield frame.to_csv(index=index).encode("utf-8")
+        return
+    for start in range(0, len(frame), chunk_rows):
+        chunk = frame.iloc[start : start + chunk_rows]
+        yield chunk.to_csv(header=start == 0, index=index).encode("utf-8")
+
+
+def _iter_record_batches(frame, chunk_rows, index):
+    import pyarrow as pa
+
+    # Infer from the whole frame: a slice can type an object column as null
+    # (empty or all-None rows) and later batches would fail to convert
+    schema = pa.Schema.from_pandas(frame, preserve_index=index)
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        chunk = frame.iloc[start : start + chunk_rows]
+        yield schema, pa.RecordBatch.from_pandas(
+            chunk, schema=schema, preserve_index=index
+        )
+
+
+def write_export(frame, fmt, fileobj, chunk_rows=DEFAULT_CHUNK_ROWS, index=False):
+    """Stream a DataFrame into ``fileobj`` in one of ``EXPORT_FORMATS``.
+
+    Only one chunk of rows is serialized at a time, so peak memory is bounded
+    by ``chunk_rows`` rather than by the size of the export.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}")
+    frame = _resolve(frame)
+
+    if fmt in ("csv", "csv.gz"):
+        sink = gzip.GzipFile(fileobj=fileobj, mode="wb") if fmt == "csv.gz" else fileobj
+        for chunk in iter_csv_chunks(frame, chunk_rows, index):
+            sink.write(chunk)
+        if sink is not fileobj:
+            sink.close()
+        return
+
+    # Columnar formats; pyarrow ships with Streamlit
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for schema, batch in _iter_record_batches(frame, chunk_rows, index):
+            if writer is None:
+                writer = (
+                    pq.ParquetWriter(fileobj, schema)
+                    if fmt == "parquet"
+                    else ipc.new_file(fileobj, schema)
+                )
+            if fmt == "parquet":
+                writer.write_batch(batch, row_group_size=chunk_rows)
+            else:
+                writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export_file(frame, fmt="csv", chunk_rows=DEFAULT_CHUNK_ROWS, index=False):
+    """Write an export to a spooled temporary file and return it rewound."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    write_export(frame, fmt, spool, chunk_rows=chunk_rows, index=index)
+    spool.seek(0)
+    return spool
+
+
+class LazyExport:
+    """Zero-argument callable that builds an export when invoked.
+
+    A class rather than a closure so loader results holding one can be
+    pickled into data snapshots.
+    """
+
+    def __init__(self, frame, fmt="csv", index=False):
+        self.frame = frame
+        self.format = fmt
+        self.index = index
+
+    def __call__(self):
+        return export_file(self.frame, self.format, index=self.index)
+
+
+def lazy_export(frame, fmt="csv", index=False):
+    """Return a zero-argument callable that builds the export when invoked.
+
+    ``st.download_button`` accepts such a callable and only runs it when the
+    button is clicked, so reruns never pay for serialization.
+    """
+    return LazyExport(frame, fmt, index=index)
+
+
+def export_filename(stem, fmt):
+    """Return ``stem`` with the file suffix for ``fmt``."""
+    return stem + EXPORT_FORMATS[fmt]["suffix"]
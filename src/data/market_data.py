@@ -1,16 +1,31 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from functools import partial
 
+from .cache import cached_loader
+from .snapshots import snapshot_dataset
+from .schema import compact_dtypes
+from .exports import lazy_export
 
-def get_market_share_data(role="Executive"):
-    """Get market share data for cloud providers, role-based granularity and insights.
-    Returns a dict with keys:
-      - data: DataFrame
-      - top_opportunity/key_risk (Executive)
-      - regional_alert/provider_comparison (Manager)
-      - raw_data_export/advanced_insights (Analyst)
-    """
+
+def _metrics_frame(metrics):
+    """Tabulate a {region or metric: {field: value}} dict for export."""
+    return pd.DataFrame(metrics).T
+
+
+# Bump when the canonical tables below change; published with every view
+MARKET_DATA_VERSION = "2025.12.1"
+GROWTH_SEED = 2025
+GROWTH_REGIONS = ["North America", "Asia Pacific", "Europe"]
+# (mean, std) of the monthly growth increments per region
+GROWTH_DRIFT = {
+    "North America": (1, 0.2),
+    "Asia Pacific": (1.2, 0.3),
+    "Europe": (0.8, 0.2),
+}
+
+
+def _share_frame():
     df = pd.DataFrame(
         {
             "Provider": [
@@ -41,138 +56,222 @@ def get_market_share_data(role="Executive"):
             "YoY Growth (%)": [15, 21, 18, 25, 20, 17, 14, 10, 12, 8],
         }
     )
+    # Sorted by share so the top-N view is a leading slice
+    return df.sort_values(
+        "Market Share (%)", ascending=False, kind="stable"
+    ).reset_index(drop=True)
+
+
+def _growth_frame(seed=GROWTH_SEED):
+    dates = pd.date_range(start="2025-01-01", end="2025-12-31", freq="ME")
+    rng = np.random.default_rng(seed)
+    data = {"Date": dates}
+    for region in GROWTH_REGIONS:
+        mean, std = GROWTH_DRIFT[region]
+        data[region] = np.round(np.cumsum(rng.normal(mean, std, len(dates))), 3)
+    return pd.DataFrame(data)
+
+
+@cached_loader(ttl=3600)
+@snapshot_dataset
+@compact_dtypes(float32=GROWTH_REGIONS)
+def get_market_dataset(version=MARKET_DATA_VERSION, seed=GROWTH_SEED):
+    """Get the canonical market dataset that every role view projects from.
+
+    Built once per ``version``; growth trends are drawn from a seeded
+    generator so repeated builds are identical. Returns a dict of read-only
+    tables plus the aggregates the role views report.
+    """
+    share = _share_frame()
+    growth = _growth_frame(seed)
+    outlier = share.loc[share["YoY Growth (%)"].idxmax()]
+    regional = {
+        "North America": {
+            "value": "125.7B",
+            "growth": "18.2%",
+            "share": "45%",
+            "share_change": "-2%",
+        },
+        "Asia Pacific": {
+            "value": "89.3B",
+            "growth": "24.5%",
+            "share": "32%",
+            "share_change": "3%",
+        },
+        "Europe": {
+            "value": "64.1B",
+            "growth": "15.8%",
+            "share": "23%",
+            "share_change": "-1%",
+        },
+    }
+    key_metrics = {
+        "Global AI Market Size": {"value": "150.2B", "change": "34.3%"},
+        "Cloud Market Growth": {"value": "22.9%", "change": "2.1%"},
+        "Active Providers": {"value": "157", "change": "12"},
+        "Avg. Compliance Score": {"value": "89%", "change": "5%"},
+    }
+    return {
+        "version": version,
+        "share": share,
+        "share_by_region": share.groupby("Region", sort=True)["Market Share (%)"]
+        .sum()
+        .to_dict(),
+        "top_grower": (outlier["Provider"], outlier["YoY Growth (%)"]),
+        "growth": growth,
+        "growth_std": growth[GROWTH_REGIONS].std().to_dict(),
+        "regional": regional,
+        "key_metrics": key_metrics,
+    }
+
+
+def _pick(metrics, names):
+    """Project a metrics dict onto ``names``; the inner dicts are shared."""
+    return {name: metrics[name] for name in names}
+
+
+# Role views below slice the canonical dataset. Column selections and leading
+# row slices share the canonical arrays (copy-on-write, always on from pandas
+# 3, copies only if a caller writes to them), and dict views share the
+# per-entry dicts.
+
+
+@cached_loader(ttl=3600)
+def get_market_share_data(role="Executive"):
+    """Get market share data for cloud providers, role-based granularity and insights.
+    Returns a dict with keys:
+      - data: DataFrame
+      - top_opportunity/key_risk (Executive)
+      - regional_alert/provider_comparison (Manager)
+      - raw_data_export (deferred export callable)/advanced_insights (Analyst)
+    """
+    dataset = get_market_dataset()
+    df = dataset["share"]
+    view = {"dataset_version": dataset["version"]}
     if role == "Executive":
         return {
-            "data": df.nlargest(3, "Market Share (%)"),
+            **view,
+            "data": df.iloc[:3],
             "top_opportunity": "Asia Pacific cloud growth (25% YoY) is the #1 expansion opportunity.",
             "key_risk": "North America market share is declining by 2%.",
         }
     elif role == "Manager":
-        comparison = df.groupby("Region")["Market Share (%)"].sum().to_dict()
         return {
-            "data": df.groupby("Region").apply(lambda x: x).reset_index(drop=True),
+            **view,
+            "data": df,
             "regional_alert": "Europe's market share is shrinking. Monitor compliance changes.",
-            "provider_comparison": comparison,
+            "provider_comparison": dataset["share_by_region"],
         }
     else:  # Analyst
-        outlier = df.loc[df["YoY Growth (%)"].idxmax()]
+        provider, growth = dataset["top_grower"]
         return {
+            **view,
             "data": df,
-            "raw_data_export": df.to_csv(index=False),
-            "advanced_insights": f"Highest YoY growth: {outlier['Provider']} ({outlier['YoY Growth (%)']}%)",
+            "raw_data_export": lazy_export(df),
+            "advanced_insights": f"Highest YoY growth: {provider} ({growth}%)",
         }
 
 
+@cached_loader(ttl=3600)
 def get_growth_trends_data(role="Executive"):
     """Get historical growth trend data, role-based granularity and insights.
     Returns a dict with keys:
       - data: DataFrame
       - trend_summary (Executive/Manager)
-      - raw_data_export/advanced_insights (Analyst)
+      - raw_data_export (deferred export callable)/advanced_insights (Analyst)
     """
-    dates = pd.date_range(start="2025-01-01", end="2025-12-31", freq="ME")
-    data = {
-        "Date": dates,
-        "North America": np.cumsum(np.random.normal(1, 0.2, len(dates))),
-        "Asia Pacific": np.cumsum(np.random.normal(1.2, 0.3, len(dates))),
-        "Europe": np.cumsum(np.random.normal(0.8, 0.2, len(dates))),
-    }
-    df = pd.DataFrame(data)
+    dataset = get_market_dataset()
+    df = dataset["growth"]
+    view = {"dataset_version": dataset["version"]}
     if role == "Executive":
         return {
+            **view,
             "data": df[["Date", "North America"]],
             "trend_summary": "North America growth is steady but lagging APAC.",
         }
     elif role == "Manager":
         return {
+            **view,
             "data": df[["Date", "North America", "Asia Pacific"]],
             "trend_summary": "Asia Pacific is outpacing other regions in growth.",
         }
     else:  # Analyst
         return {
+            **view,
             "data": df,
-            "raw_data_export": df.to_csv(index=False),
-            "advanced_insights": f"Std Dev (APAC): {df['Asia Pacific'].std():.2f}",
+            "raw_data_export": lazy_export(df),
+            "advanced_insights": f"Std Dev (APAC): {dataset['growth_std']['Asia Pacific']:.2f}",
         }
 
 
+@cached_loader(ttl=3600)
 def get_regional_metrics(role="Executive"):
     """Get regional market metrics, role-based granularity and insights.
     Returns a dict with keys:
       - data: dict
       - summary (Executive)
       - regional_alert (Manager)
-      - raw_data_export/advanced_insights (Analyst)
+      - raw_data_export (deferred export callable)/advanced_insights (Analyst)
     """
-    metrics = {
-        "North America": {
-            "value": "125.7B",
-            "growth": "18.2%",
-            "share": "45%",
-            "share_change": "-2%",
-        },
-        "Asia Pacific": {
-            "value": "89.3B",
-            "growth": "24.5%",
-            "share": "32%",
-            "share_change": "3%",
-        },
-        "Europe": {
-            "value": "64.1B",
-            "growth": "15.8%",
-            "share": "23%",
-            "share_change": "-1%",
-        },
-    }
+    dataset = get_market_dataset()
+    metrics = dataset["regional"]
+    view = {"dataset_version": dataset["version"]}
     if role == "Executive":
         return {
-            "data": {"North America": metrics["North America"]},
+            **view,
+            "data": _pick(metrics, ["North America"]),
             "summary": "North America remains the largest market, but APAC is growing fastest.",
         }
     elif role == "Manager":
         return {
-            "data": {k: v for k, v in metrics.items() if k != "Europe"},
+            **view,
+            "data": _pick(metrics, ["North America", "Asia Pacific"]),
             "regional_alert": "Monitor APAC for new compliance requirements.",
         }
     else:  # Analyst
         return {
+            **view,
             "data": metrics,
-            "raw_data_export": pd.DataFrame(metrics).T.to_csv(),
+            "raw_data_export": lazy_export(
+                partial(_metrics_frame, metrics), index=True
+            ),
             "advanced_insights": "Europe's share change is negative; investigate causes.",
         }
 
 
+@cached_loader(ttl=3600)
 def get_key_metrics(role="Executive"):
     """Get key dashboard metrics, role-based granularity and insights.
     Returns a dict with keys:
       - data: dict
       - kpi_summary (Executive)
       - kpi_alert (Manager)
-      - raw_data_export/advanced_insights (Analyst)
+      - raw_data_export (deferred export callable)/advanced_insights (Analyst)
     """
-    metrics = {
-        "Global AI Market Size": {"value": "150.2B", "change": "34.3%"},
-        "Cloud Market Growth": {"value": "22.9%", "change": "2.1%"},
-        "Active Providers": {"value": "157", "change": "12"},
-        "Avg. Compliance Score": {"value": "89%", "change": "5%"},
-    }
+    dataset = get_market_dataset()
+    metrics = dataset["key_metrics"]
+    view = {"dataset_version": dataset["version"]}
     if role == "Executive":
         return {
-            "data": {
-                k: v
-                for k, v in metrics.items()
-                if k in ["Global AI Market Size", "Cloud Market Growth"]
-            },
+            **view,
+            "data": _pick(metrics, ["Global AI Market Size", "Cloud Market Growth"]),
             "kpi_summary": "AI and cloud markets are both growing rapidly.",
         }
     elif role == "Manager":
         return {
-            "data": {k: v for k, v in metrics.items() if k != "Avg. Compliance Score"},
+            **view,
+            "data": _pick(
+                metrics,
+                ["Global AI Market Size", "Cloud Market Growth", "Active Providers"],
+            ),
             "kpi_alert": "Active providers increased by 12 this year.",
         }
     else:  # Analyst
         return {
+            **view,
             "data": metrics,
-            "raw_data_export": pd.DataFrame(metrics).T.to_csv(),
+            "raw_data_export": lazy_export(
+                partial(_metrics_frame, metrics), index=True
+            ),
             "advanced_insights": "Compliance score change: 5%.",
         }
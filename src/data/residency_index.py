@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+
+
+def _indices(mask):
+    """Return the positions of the set bits in an integer bitmask."""
+    if not mask:
+        return np.empty(0, dtype=np.intp)
+    raw = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, "little"), np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little"))
+
+
+def _as_list(value):
+    return [value] if isinstance(value, str) else list(value)
+
+
+class ResidencyCatalog:
+    """Inverted index of where each provider hosts data and under which frameworks.
+
+    Regions are numbered in insertion order. Providers, frameworks and
+    continents each map to an integer bitmask over region numbers, so a
+    combined query is a handful of dictionary lookups and bitwise ANDs.
+    Per-region attributes (continent, coordinates) live in parallel arrays
+    that the map builder can slice without touching Python objects.
+    """
+
+    def __init__(self):
+        self.regions = []
+        self._region_ids = {}
+        self._continents = []
+        self._lat = []
+        self._lon = []
+        self._region_providers = []
+        self._region_frameworks = []
+        self._by_provider = {}
+        self._by_framework = {}
+        self._by_continent = {}
+
+    @classmethod
+    def from_residency_map(cls, residency_map, coordinates=None):
+        """Build from the continent-keyed dict returned by ``get_data_residency_map``.
+
+        Every provider and framework listed for a continent applies to each
+        of its regions. ``coordinates`` is a table with ``region``, ``lat``
+        and ``lon`` columns (see ``set_coordinates``).
+        """
+        catalog = cls()
+        for continent, data in residency_map.items():
+            for region in data["regions"]:
+                catalog.add_region(
+                    region, continent, data["providers"], data["compliance"]
+                )
+        if coordinates is not None:
+            catalog.set_coordinates(coordinates)
+        return catalog
+
+    def set_coordinates(self, coordinates):
+        """Fill region coordinates from a ``region``/``lat``/``lon`` table.
+
+        All regions are matched against the table in one vectorized join;
+        regions missing from it keep their current (possibly NaN) values.
+        """
+        rows = pd.Index(coordinates["region"]).get_indexer(self.regions)
+        found = rows >= 0
+        lat = np.asarray(self._lat, dtype=float)
+        lon = np.asarray(self._lon, dtype=float)
+        lat[found] = coordinates["lat"].to_numpy(dtype=float)[rows[found]]
+        lon[found] = coordinates["lon"].to_numpy(dtype=float)[rows[found]]
+        self._lat, self._lon = lat.tolist(), lon.tolist()
+        return int(found.sum())
+
+    def add_region(self, region, continent, providers, frameworks, lat=None, lon=None):
+        """Add a region, or extend an existing one with more providers/frameworks."""
+        if region in self._region_ids:
+            rid = self._region_ids[region]
+        else:
+            rid = len(self.regions)
+            self._region_ids[region] = rid
+            self.regions.append(region)
+            self._continents.append(continent)
+            self._lat.append(np.nan if lat is None else lat)
+            self._lon.append(np.nan if lon is None else lon)
+            self._region_providers.append(set())
+            self._region_frameworks.append(set())
+            self._by_continent[continent] = self._by_continent.get(continent, 0) | (
+                1 << rid
+            )
+        bit = 1 << rid
+        for provider in providers:
+            self._region_providers[rid].add(provider)
+            self._by_provider[provider] = self._by_provider.get(provider, 0) | bit
+        for framework in frameworks:
+            self._region_frameworks[rid].add(framework)
+            self._by_framework[framework] = self._by_framework.get(framework, 0) | bit
+
+    def __len__(self):
+        return len(self.regions)
+
+    @property
+    def providers(self):
+        return sorted(self._by_provider)
+
+    @property
+    def frameworks(self):
+        return sorted(self._by_framework)
+
+    @property
+    def continents(self):
+        return list(self._by_continent)
+
+    def region_mask(self, providers=(), frameworks=(), continents=()):
+        """Bitmask of regions hosting every provider and meeting every framework.
+
+        ``continents`` widens rather than narrows: a region in any of them
+        qualifies. Unknown names match no region.
+        """
+        mask = (1 << len(self.regions)) - 1
+        for provider in _as_list(providers):
+            mask &= self._by_provider.get(provider, 0)
+        for framework in _as_list(frameworks):
+            mask &= self._by_framework.get(framework, 0)
+        continents = _as_list(continents)
+        if continents:
+            mask &= self._union(self._by_continent, continents)
+        return mask
+
+    @staticmethod
+    def _union(index, names):
+        mask = 0
+        for name in names:
+            mask |= index.get(name, 0)
+        return mask
+
+    def regions_for(self, providers=(), frameworks=(), continents=()):
+        """Return the regions matching every provider and framework given."""
+        mask = self.region_mask(providers, frameworks, continents)
+        return [self.regions[i] for i in _indices(mask)]
+
+    def providers_in(self, region):
+        """Return the providers hosting data in ``region``."""
+        rid = self._region_ids.get(region)
+        return sorted(self._region_providers[rid]) if rid is not None else []
+
+    def frameworks_in(self, region):
+        """Return the frameworks ``region`` is certified for."""
+        rid = self._region_ids.get(region)
+        return sorted(self._region_frameworks[rid]) if rid is not None else []
+
+    def providers_for(self, frameworks=(), continents=()):
+        """Return providers with at least one region matching the filters."""
+        mask = self.region_mask(frameworks=frameworks, continents=continents)
+        return [p for p in self.providers if self._by_provider[p] & mask]
+
+    def region_table(self, providers=(), frameworks=(), continents=()):
+        """Return matching regions as parallel arrays.
+
+        Keys are ``region``, ``continent``, ``lat``, ``lon``, ``providers``
+        and ``frameworks`` (the last two are counts per region).
+        """
+        rows = _indices(self.region_mask(providers, frameworks, continents))
+        return {
+            "region": np.asarray(self.regions, dtype=object)[rows],
+            "continent": np.asarray(self._continents, dtype=object)[rows],
+            "lat": np.asarray(self._lat, dtype=float)[rows],
+            "lon": np.asarray(self._lon, dtype=float)[rows],
+            "providers": np.array(
+                [len(self._region_providers[i]) for i in rows], dtype=int
+            ),
+            "frameworks": np.array(
+                [len(self._region_frameworks[i]) for i in rows], dtype=int
+            ),
+        }
+
+    def grouped_coordinates(self, providers=(), frameworks=(), continents=()):
+        """Return ``region_table`` split by continent, in insertion order."""
+        table = self.region_table(providers, frameworks, continents)
+        groups = {}
+        for continent in self.continents:
+            rows = table["continent"] == continent
+            if rows.any():
+                groups[continent] = {
+                    key: values[rows]
+                    for key, values in table.items()
+                    if key != "continent"
+                }
+        return groups
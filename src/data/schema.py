@@ -0,0 +1,218 @@
+"""Compact column dtypes for the loader frames.
+
+Print the memory report with ``python scripts/memory_report.py``.
+
+Dimension columns (Provider, Region, ...) become categoricals, metrics that
+are rounded to a couple of decimals become float32 and integer metrics
+become the narrowest nullable integer that holds their values. Loaders opt
+in with ``@compact_dtypes``; ``memory_report`` compares the bytes of every
+dataset before and after.
+"""
+
+import inspect
+import argparse
+import functools
+
+import numpy as np
+import pandas as pd
+
+# Repeated labels stored once as categories plus small integer codes
+DIMENSION_COLUMNS = ("Provider", "Region", "Service", "Service Type", "Requirement")
+# Columns with more distinct labels per row than this stay strings: the
+# category dictionary would cost more than it saves
+MAX_CATEGORY_RATIO = 0.5
+# Metric column -> compact dtype. float32 keeps ~7 significant digits, plenty
+# for values rounded to 1-3 decimals. Uptime, SLAs and prices stay float64:
+# they differ in the 3rd-4th decimal, where float32 rounding would show up in
+# aggregates and exports.
+METRIC_DTYPES = {
+    "Latency (ms)": "float32",
+    "Network Throughput (Gbps)": "float32",
+    "IOPS": "Int32",
+    "Market Share (%)": "float32",
+    "YoY Growth (%)": "Int8",
+    "Risk Score": "Int8",
+}
+# Nullable integer dtypes from narrowest to widest
+INT_DTYPES = ["Int8", "Int16", "Int32", "Int64"]
+
+
+def _int_dtype(values, dtype):
+    """Widen nullable integer ``dtype`` until it holds every value."""
+    present = values.dropna()
+    low, high = (present.min(), present.max()) if len(present) else (0, 0)
+    for candidate in INT_DTYPES[INT_DTYPES.index(dtype) :]:
+        info = np.iinfo(candidate.lower())
+        if info.min <= low and high <= info.max:
+            return candidate
+    return "Int64"
+
+
+def column_dtypes(frame, categorical=(), float32=()):
+    """Return the compact dtype for each column of ``frame`` the schema covers.
+
+    ``categorical`` and ``float32`` add columns beyond ``DIMENSION_COLUMNS``
+    and ``METRIC_DTYPES`` (e.g. wide frames with one column per region).
+    """
+    dtypes = {}
+    for column in frame.columns:
+        values = frame[column]
+        if column in DIMENSION_COLUMNS or column in categorical:
+            if (
+                pd.api.types.is_string_dtype(values)
+                and not isinstance(values.dtype, pd.CategoricalDtype)
+                and values.nunique() <= len(values) * MAX_CATEGORY_RATIO
+            ):
+                dtypes[column] = "category"
+            continue
+        dtype = "float32" if column in float32 else METRIC_DTYPES.get(column)
+        if dtype is None or not pd.api.types.is_numeric_dtype(values):
+            continue
+        if dtype in INT_DTYPES:
+            if not pd.api.types.is_integer_dtype(values):
+                continue
+            dtype = _int_dtype(values, dtype)
+        if values.dtype != dtype:
+            dtypes[column] = dtype
+    return dtypes
+
+
+def compact_frame(frame, categorical=(), float32=()):
+    """Return ``frame`` with compact dtypes; untouched columns are not copied."""
+    dtypes = column_dtypes(frame, categorical, float32)
+    return frame.astype(dtypes) if dtypes else frame
+
+
+def compact_value(value, categorical=(), float32=()):
+    """Compact a loader result: a frame, or a dict holding frames."""
+    if isinstance(value, pd.DataFrame):
+        return compact_frame(value, categorical, float32)
+    if isinstance(value, dict):
+        return {
+            key: compact_value(item, categorical, float32)
+            for key, item in value.items()
+        }
+    return value
+
+
+def compact_dtypes(func=None, categorical=(), float32=()):
+    """Decorator applying ``compact_value`` to a loader's result.
+
+    Place it below ``@snapshot_dataset`` so published snapshots hold the
+    compact frames. The raw loader stays reachable as ``__wrapped__``.
+    """
+    if func is None:
+        return functools.partial(
+            compact_dtypes, categorical=tuple(categorical), float32=tuple(float32)
+        )
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return compact_value(func(*args, **kwargs), categorical, float32)
+
+    wrapper.compact_options = {"categorical": categorical, "float32": float32}
+    return wrapper
+
+
+def is_compacting(func):
+    """True for the ``@compact_dtypes`` wrapper itself.
+
+    ``functools.wraps`` copies ``compact_options`` onto the cache and
+    snapshot decorators stacked above it, so those are told apart by the
+    function they wrap not having it.
+    """
+    return "compact_options" in vars(func) and not hasattr(
+        getattr(func, "__wrapped__", None), "compact_options"
+    )
+
+
+def nbytes(value):
+    """Deep in-memory size of the frames in a loader result, in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, dict):
+        return sum(nbytes(item) for item in value.values())
+    return 0
+
+
+def _rows(value):
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_rows(item) for item in value.values())
+    return 0
+
+
+def memory_report(datasets):
+    """Measure each dataset with its original and its compact dtypes.
+
+    ``datasets`` is a list of (loader, argument tuples), as in
+    ``ingest.DATASETS``; loaders without ``@compact_dtypes`` report the same
+    size twice. Returns a DataFrame with one row per call.
+    """
+    rows = []
+    for loader, arg_sets in datasets:
+        compacting = inspect.unwrap(loader, stop=is_compacting)
+        raw_loader = inspect.unwrap(compacting)
+        options = getattr(compacting, "compact_options", None)
+        for args in arg_sets:
+            raw = raw_loader(*args)
+            compact = raw if options is None else compact_value(raw, **options)
+            before, after = nbytes(raw), nbytes(compact)
+            if not before:
+                continue
+            rows.append(
+                {
+                    "Dataset": loader.__name__
+                    + (f"({', '.join(map(repr, args))})" if args else ""),
+                    "Rows": _rows(raw),
+                    "Before (bytes)": before,
+                    "After (bytes)": after,
+                    "Saved (%)": round((before - after) / before * 100, 1),
+                }
+            )
+    return pd.DataFrame(
+        rows,
+        columns=["Dataset", "Rows", "Before (bytes)", "After (bytes)", "Saved (%)"],
+    )
+
+
+def to_float64(values):
+    """Widen float32 values to float64 without exposing binary rounding.
+
+    ``np.float32(52.37)`` widens to 52.369998931884766; going through the
+    shortest float32 repr gives back 52.37.
+    """
+    return pd.Series(values).astype(str).astype("float64").to_numpy()
+
+
+def main(argv=None):
+    from . import ingest, performance_data
+
+    parser = argparse.ArgumentParser(
+        description="Report dataset memory before and after dtype compaction."
+    )
+    parser.add_argument(
+        "--performance-hours",
+        type=int,
+        default=0,
+        help="also measure this many hours of performance samples",
+    )
+    args = parser.parse_args(argv)
+    datasets = list(ingest.DATASETS)
+    if args.performance_hours:
+
+        @compact_dtypes
+        def performance_history(hours):
+            return performance_data.generate_performance_metrics(
+                timestamps=hours, seed=0
+            )
+
+        datasets.append((performance_history, [(args.performance_hours,)]))
+    report = memory_report(datasets)
+    with pd.option_context("display.width", 120):
+        print(report.to_string(index=False))
+    before, after = report["Before (bytes)"].sum(), report["After (bytes)"].sum()
+    print(
+        f"\nTotal: {before:,} -> {after:,} bytes ({(before - after) / before:.1%} saved)"
+    )
@@ -0,0 +1,207 @@
+import os
+import json
+import pickle
+import shutil
+import inspect
+import logging
+import tempfile
+import functools
+from datetime import datetime, timezone
+
+SNAPSHOT_DIR = os.environ.get(
+    "DATA_SNAPSHOT_DIR",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        ".data",
+        "snapshots",
+    ),
+)
+MANIFEST = "manifest.json"
+LATEST = "LATEST"
+
+logger = logging.getLogger(__name__)
+
+_reading = {"enabled": True}
+_open_snapshots = {}
+
+
+def dataset_key(func, args=(), kwargs=None):
+    """Return the snapshot key for a loader call, with defaults filled in."""
+    bound = inspect.signature(func).bind(*args, **(kwargs or {}))
+    bound.apply_defaults()
+    params = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
+    return f"{func.__name__}({params})"
+
+
+def _is_arrow_safe(value):
+    import pandas as pd
+
+    # Object columns hold lists or mixed values that do not round-trip
+    return isinstance(value, pd.DataFrame) and not any(
+        dtype == object for dtype in value.dtypes
+    )
+
+
+class Snapshot:
+    """A published, read-only set of loader results.
+
+    DataFrames are stored as Arrow IPC files and memory-mapped on read;
+    anything else is pickled.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest["version"]
+        self._values = {}
+
+    def __contains__(self, key):
+        return key in self.manifest["datasets"]
+
+    @property
+    def keys(self):
+        return list(self.manifest["datasets"])
+
+    def load(self, key):
+        """Return the value stored under ``key``; raises ``KeyError`` if absent."""
+        if key in self._values:
+            return self._values[key]
+        entry = self.manifest["datasets"][key]
+        file_path = os.path.join(self.path, entry["file"])
+        if entry["format"] == "arrow":
+            import pyarrow as pa
+            import pyarrow.ipc as ipc
+
+            with pa.memory_map(file_path) as source:
+                value = ipc.open_file(source).read_all().to_pandas()
+        else:
+            with open(file_path, "rb") as f:
+                value = pickle.load(f)
+        self._values[key] = value
+        return value
+
+
+def _write_value(directory, index, value):
+    if _is_arrow_safe(value):
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+
+        name = f"{index:04d}.arrow"
+        table = pa.Table.from_pandas(value, preserve_index=True)
+        with ipc.new_file(os.path.join(directory, name), table.schema) as writer:
+            writer.write_table(table)
+        return name, "arrow"
+    name = f"{index:04d}.pkl"
+    with open(os.path.join(directory, name), "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return name, "pickle"
+
+
+def _versions(root):
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name
+        for name in os.listdir(root)
+        if name.startswith("v") and os.path.isfile(os.path.join(root, name, MANIFEST))
+    )
+
+
+def publish_snapshot(datasets, root=None, keep=3, metadata=None):
+    """Write ``datasets`` ({key: value}) as the next snapshot version.
+
+    The snapshot is assembled in a temporary directory, renamed into place
+    and then made current by atomically replacing the ``LATEST`` pointer, so
+    readers see either the previous snapshot or the complete new one. All
+    but the newest ``keep`` versions are removed afterwards.
+    """
+    root = root or SNAPSHOT_DIR
+    os.makedirs(root, exist_ok=True)
+    versions = _versions(root)
+    sequence = int(versions[-1][1:7]) + 1 if versions else 1
+    created = datetime.now(timezone.utc)
+    version = f"v{sequence:06d}-{created:%Y%m%dT%H%M%SZ}"
+
+    staging = tempfile.mkdtemp(prefix=".staging-", dir=root)
+    try:
+        manifest = {
+            "version": version,
+            "created": created.isoformat(),
+            "datasets": {},
+            **(metadata or {}),
+        }
+        for index, (key, value) in enumerate(datasets.items()):
+            name, fmt = _write_value(staging, index, value)
+            manifest["datasets"][key] = {"file": name, "format": fmt}
+        with open(os.path.join(staging, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.rename(staging, os.path.join(root, version))
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    pointer = os.path.join(root, f".{LATEST}.tmp")
+    with open(pointer, "w") as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(root, LATEST))
+
+    for old in _versions(root)[:-keep] if keep else []:
+        shutil.rmtree(os.path.join(root, old), ignore_errors=True)
+    return version
+
+
+def latest_snapshot(root=None):
+    """Return the current ``Snapshot`` under ``root``, or None if none is published."""
+    root = root or SNAPSHOT_DIR
+    try:
+        with open(os.path.join(root, LATEST)) as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    path = os.path.join(root, version)
+    snapshot = _open_snapshots.get(path)
+    if snapshot is None:
+        try:
+            snapshot = Snapshot(path)
+        except FileNotFoundError:
+            # Pruned between reading the pointer and opening the snapshot
+            return None
+        _open_snapshots.clear()
+        _open_snapshots[path] = snapshot
+    return snapshot
+
+
+def disable_snapshot_reads():
+    """Make ``snapshot_dataset`` loaders always compute (used by the ingest worker)."""
+    _reading["enabled"] = False
+
+
+def snapshot_dataset(func):
+    """Decorator serving a loader's result from the latest snapshot when present.
+
+    Falls back to running the loader when no snapshot has been published, it
+    lacks this call or the stored value cannot be read; read failures are
+    logged as warnings. The loader itself stays reachable as ``__wrapped__``.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _reading["enabled"]:
+            snapshot = latest_snapshot()
+            if snapshot is not None:
+                key = dataset_key(func, args, kwargs)
+                if key in snapshot:
+                    try:
+                        return snapshot.load(key)
+                    except Exception as exc:
+                        # An unreadable snapshot must never take a page down
+                        logger.warning(
+                            "failed to read %s from snapshot %s, computing it: %r",
+                            key,
+                            snapshot.version,
+                            exc,
+                        )
+        return func(*args, **kwargs)
+
+    return wrapper
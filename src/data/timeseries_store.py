@@ -0,0 +1,269 @@
+import os
+import json
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+# DataFrame column -> (file stem, on-disk dtype)
+STORE_COLUMNS = {
+    "Timestamp": ("timestamp", "int64"),
+    "Provider": ("provider", "int16"),
+    "Region": ("region", "int16"),
+    "Latency (ms)": ("latency", "float64"),
+    "Uptime (%)": ("uptime", "float64"),
+    "IOPS": ("iops", "int64"),
+    "Network Throughput (Gbps)": ("throughput", "float64"),
+}
+METRIC_COLUMNS = [
+    "Latency (ms)",
+    "Uptime (%)",
+    "IOPS",
+    "Network Throughput (Gbps)",
+]
+META_FILE = "meta.json"
+# Held exclusively by the process appending to the store
+LOCK_FILE = "append.lock"
+
+
+def _to_ns(value):
+    """Convert a datetime-like value to int64 nanoseconds since the epoch."""
+    return pd.Timestamp(value).as_unit("ns").value
+
+
+class PerformanceStore:
+    """Append-only columnar store of performance samples sorted by timestamp.
+
+    Each column lives in its own raw binary file and is memory-mapped on
+    read, so queries only touch the pages of the requested time window.
+    ``meta.json`` holds the committed row count and the provider/region
+    dictionaries for the int16 category codes; it is rewritten atomically
+    after every append, so readers never see a half-written chunk.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._maps = {}
+        self._meta = None
+        self.reload()
+
+    @classmethod
+    def create(cls, path, providers=(), regions=()):
+        """Create an empty store at ``path``."""
+        os.makedirs(path, exist_ok=True)
+        for stem, _ in STORE_COLUMNS.values():
+            open(os.path.join(path, f"{stem}.bin"), "wb").close()
+        cls._write_meta(
+            path, {"rows": 0, "providers": list(providers), "regions": list(regions)}
+        )
+        return cls(path)
+
+    @staticmethod
+    def exists(path):
+        return os.path.exists(os.path.join(path, META_FILE))
+
+    @staticmethod
+    def _write_meta(path, meta):
+        tmp = os.path.join(path, META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(path, META_FILE))
+
+    def reload(self):
+        """Re-read metadata, picking up rows appended by another process."""
+        with open(os.path.join(self.path, META_FILE)) as f:
+            meta = json.load(f)
+        if self._meta is None or meta["rows"] != self._meta["rows"]:
+            self._maps = {}
+        self._meta = meta
+
+    def __len__(self):
+        return self._meta["rows"]
+
+    @property
+    def providers(self):
+        return list(self._meta["providers"])
+
+    @property
+    def regions(self):
+        return list(self._meta["regions"])
+
+    def _codes(self, values, key):
+        """Map category labels to codes, extending the dictionary as needed."""
+        labels = self._meta[key]
+        inverse, uniques = pd.factorize(values)
+        lookup = {label: code for code, label in enumerate(labels)}
+        for label in uniques:
+            if label not in lookup:
+                lookup[label] = len(labels)
+                labels.append(label)
+        mapping = np.array([lookup[label] for label in uniques], dtype=np.int16)
+        return mapping[inverse]
+
+    @contextmanager
+    def _writer_lock(self):
+        """Serialize appends across threads and processes with ``flock``."""
+        with open(os.path.join(self.path, LOCK_FILE), "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def append(self, frame):
+        """Append a frame of samples; timestamps must not go backwards.
+
+        Writers hold the store's lock file. Each column file is first cut
+        back to the committed row count, so bytes left by an append that
+        died before committing ``meta.json`` are overwritten, not kept.
+        """
+        if frame.empty:
+            return
+        timestamps = frame["Timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        if np.any(np.diff(timestamps) < 0):
+            raise ValueError("samples must be sorted by Timestamp")
+
+        with self._writer_lock():
+            # Another writer may have committed rows since we last looked
+            self.reload()
+            last = self.time_bounds()[1]
+            if last is not None and timestamps[0] < _to_ns(last):
+                raise ValueError("samples must not precede the end of the store")
+
+            columns = {
+                "Timestamp": timestamps,
+                "Provider": self._codes(frame["Provider"], "providers"),
+                "Region": self._codes(frame["Region"], "regions"),
+            }
+            for name in METRIC_COLUMNS:
+                columns[name] = frame[name].to_numpy()
+            rows = self._meta["rows"]
+            for name, (stem, dtype) in STORE_COLUMNS.items():
+                with open(os.path.join(self.path, f"{stem}.bin"), "r+b") as f:
+                    f.truncate(rows * np.dtype(dtype).itemsize)
+                    f.seek(0, os.SEEK_END)
+                    f.write(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+
+            meta = dict(self._meta, rows=rows + len(frame))
+            self._write_meta(self.path, meta)
+            self.reload()
+
+    def column(self, name):
+        """Return the whole column as a read-only memory map."""
+        if name not in self._maps:
+            stem, dtype = STORE_COLUMNS[name]
+            if len(self) == 0:
+                self._maps[name] = np.empty(0, dtype=dtype)
+            else:
+                self._maps[name] = np.memmap(
+                    os.path.join(self.path, f"{stem}.bin"),
+                    dtype=dtype,
+                    mode="r",
+                    shape=(len(self),),
+                )
+        return self._maps[name]
+
+    def time_bounds(self):
+        """Return the first and last timestamp in the store (None if empty)."""
+        if len(self) == 0:
+            return None, None
+        ts = self.column("Timestamp")
+        return pd.Timestamp(int(ts[0])), pd.Timestamp(int(ts[-1]))
+
+    def row_range(self, start=None, end=None):
+        """Binary-search the timestamp column for rows in ``[start, end]``."""
+        ts = self.column("Timestamp")
+        lo = 0 if start is None else int(np.searchsorted(ts, _to_ns(start), "left"))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, _to_ns(end), "right"))
+        return lo, max(lo, hi)
+
+    def query(self, start=None, end=None, columns=None):
+        """Return zero-copy memory-mapped slices of each column for a window.
+
+        Provider and Region come back as int16 codes into ``providers`` and
+        ``regions``; Timestamp as int64 nanoseconds.
+        """
+        lo, hi = self.row_range(start, end)
+        return {name: self.column(name)[lo:hi] for name in columns or STORE_COLUMNS}
+
+    def to_frame(self, start=None, end=None):
+        """Materialize a window as a DataFrame (this copies the data)."""
+        window = self.query(start, end)
+        frame = {
+            "Timestamp": np.asarray(window["Timestamp"]).view("datetime64[ns]"),
+            "Provider": pd.Categorical.from_codes(
+                np.asarray(window["Provider"]), categories=self.providers
+            ),
+            "Region": pd.Categorical.from_codes(
+                np.asarray(window["Region"]), categories=self.regions
+            ),
+        }
+        for name in METRIC_COLUMNS:
+            frame[name] = np.asarray(window[name])
+        return pd.DataFrame(frame)
+
+    def summarize(self, start=None, end=None):
+        """Average each metric per provider and region over a window.
+
+        Uses ``np.bincount`` over the category codes so only the window's
+        pages are read and no per-row objects are created.
+        """
+        window = self.query(start, end)
+        n_regions = len(self.regions)
+        cells = len(self.providers) * n_regions
+        keys = window["Provider"].astype(np.int32) * n_regions + window["Region"]
+        counts = np.bincount(keys, minlength=cells)
+        present = np.flatnonzero(counts)
+        result = {
+            "Provider": pd.Categorical.from_codes(
+                present // n_regions, categories=self.providers
+            ),
+            "Region": pd.Categorical.from_codes(
+                present % n_regions, categories=self.regions
+            ),
+        }
+        for name in METRIC_COLUMNS:
+            sums = np.bincount(keys, weights=window[name], minlength=cells)
+            result[name] = sums[present] / counts[present]
+        result["Latency (ms)"] = np.round(result["Latency (ms)"], 2)
+        result["Uptime (%)"] = np.round(result["Uptime (%)"], 3)
+        result["IOPS"] = result["IOPS"].astype(np.int64)
+        result["Network Throughput (Gbps)"] = np.round(
+            result["Network Throughput (Gbps)"], 1
+        )
+        result["Samples"] = counts[present]
+        return pd.DataFrame(result)
+
+
+def build_store(path, frames):
+    """Build a store from an iterable of frames, publishing it atomically.
+
+    The store is written to a temporary sibling directory and renamed into
+    place, so concurrent readers either see no store or a complete one.
+    """
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".building-", dir=parent)
+    try:
+        store = PerformanceStore.create(tmp)
+        for frame in frames:
+            store.append(frame)
+        os.rename(tmp, path)
+    except OSError:
+        # Another process published the store first
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not PerformanceStore.exists(path):
+            raise
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return PerformanceStore(path)
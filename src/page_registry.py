@@ -0,0 +1,117 @@
+import sys
+import time
+import importlib
+from datetime import datetime
+
+
+class Page:
+    """A dashboard page: its render function and the modules it needs."""
+
+    def __init__(self, name, render, modules):
+        self.name = name
+        self.render = render
+        self.modules = tuple(modules)
+        self.loaded = False
+        self.import_seconds = None
+        self.new_modules = ()
+        self.first_opened = None
+        self.first_render_seconds = None
+
+
+class PageRegistry:
+    """Registry that imports a page's modules the first time it is opened."""
+
+    def __init__(self):
+        self.pages = {}
+        self.startup = {}
+
+    def page(self, name, modules=()):
+        """Decorator registering ``render`` as the page called ``name``.
+
+        Streamlit re-executes the app script on every rerun; registering a
+        page again only swaps in the new render function and keeps the load
+        stats gathered so far.
+        """
+
+        def decorator(render):
+            page = self.pages.get(name)
+            if page is None:
+                self.pages[name] = Page(name, render, modules)
+            else:
+                page.render = render
+                page.modules = tuple(modules)
+            return render
+
+        return decorator
+
+    @property
+    def names(self):
+        return list(self.pages)
+
+    def record_startup(self, label, seconds):
+        """Record a startup phase duration (e.g. importing the app module).
+
+        Only the first measurement per process is kept: later reruns find
+        the modules already imported and would report near-zero costs.
+        """
+        self.startup.setdefault(label, seconds)
+
+    def load(self, name):
+        """Import the modules of a page once and record what it cost."""
+        page = self.pages[name]
+        if page.loaded:
+            return page
+        before = set(sys.modules)
+        start = time.perf_counter()
+        for module in page.modules:
+            importlib.import_module(module)
+        page.import_seconds = time.perf_counter() - start
+        page.new_modules = tuple(sorted(set(sys.modules) - before))
+        page.first_opened = datetime.now()
+        page.loaded = True
+        return page
+
+    def render(self, name, *args, **kwargs):
+        """Load a page's modules if needed and render it."""
+        page = self.load(name)
+        if page.first_render_seconds is not None:
+            return page.render(*args, **kwargs)
+        start = time.perf_counter()
+        result = page.render(*args, **kwargs)
+        page.first_render_seconds = time.perf_counter() - start
+        return result
+
+    def report(self):
+        """Return startup phases and per-page import costs as a list of rows.
+
+        A page is only charged for modules that no earlier page had already
+        imported, so the order in which pages were opened matters.
+        """
+        rows = [
+            {
+                "Phase": label,
+                "Import (ms)": round(seconds * 1000, 1),
+                "First render (ms)": None,
+                "Modules": "",
+            }
+            for label, seconds in self.startup.items()
+        ]
+        for page in self.pages.values():
+            if not page.loaded:
+                continue
+            rows.append(
+                {
+                    "Phase": f"page: {page.name}",
+                    "Import (ms)": round(page.import_seconds * 1000, 1),
+                    "First render (ms)": (
+                        round(page.first_render_seconds * 1000, 1)
+                        if page.first_render_seconds is not None
+                        else None
+                    ),
+                    "Modules": f"{len(page.new_modules)} new",
+                }
+            )
+        return rows
+
+
+registry = PageRegistry()
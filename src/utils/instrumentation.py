@@ -0,0 +1,335 @@
+import os
+import json
+import time
+import inspect
+import threading
+import functools
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+
+# Function name prefix -> kind recorded by ``instrument_module``
+INSTRUMENTED_PREFIXES = {
+    "get_": "loader",
+    "calculate_": "compute",
+    "simulate_": "compute",
+    "create_": "builder",
+    "display_": "section",
+}
+DEFAULT_MAX_RUNS = 50
+DEFAULT_MAX_SAMPLES = 512
+QUANTILES = (0.5, 0.95)
+METRICS_FILE = os.environ.get("DASHBOARD_METRICS_FILE")
+PROMETHEUS_PREFIX = "dashboard"
+
+_current_run = contextvars.ContextVar("instrumentation_run", default=None)
+# Child-time accumulators of the timers open in this context, innermost last
+_open_timers = contextvars.ContextVar("instrumentation_timers", default=())
+
+
+def _quantiles(samples, quantiles=QUANTILES):
+    """Linearly interpolated quantiles of ``samples`` (zeros when empty)."""
+    if not samples:
+        return [0.0 for _ in quantiles]
+    ordered = sorted(samples)
+    values = []
+    for q in quantiles:
+        position = q * (len(ordered) - 1)
+        low = int(position)
+        high = min(low + 1, len(ordered) - 1)
+        values.append(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+    return values
+
+
+class _Series:
+    __slots__ = ("calls", "seconds", "self_seconds", "max", "samples")
+
+    def __init__(self, max_samples):
+        self.calls = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=max_samples)
+
+
+class MetricsStore:
+    """Bounded in-process store of call timings.
+
+    Every (kind, name) series keeps a call count, total and maximum plus the
+    last ``max_samples`` durations for quantiles. Calls made between
+    ``begin_run`` and ``end_run`` are also tallied per rerun; the last
+    ``max_runs`` reruns are kept. Runs are tracked per context, so
+    concurrent sessions do not mix their timings.
+
+    Totals are inclusive: a loader that calls another loader counts the
+    inner call's time too. Timers nested in the same context also record
+    self time, the total minus the time of the timers directly inside them,
+    so self times of one run add up to at most the run's duration.
+    """
+
+    def __init__(self, max_runs=DEFAULT_MAX_RUNS, max_samples=DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.runs = deque(maxlen=max_runs)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind, name, seconds, self_seconds=None):
+        """Add one call of ``seconds`` to the (kind, name) series.
+
+        ``self_seconds`` excludes time spent in nested timers; it defaults to
+        ``seconds``.
+        """
+        if self_seconds is None:
+            self_seconds = seconds
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = self._series[(kind, name)] = _Series(self.max_samples)
+            series.calls += 1
+            series.seconds += seconds
+            series.self_seconds += self_seconds
+            series.max = max(series.max, seconds)
+            series.samples.append(seconds)
+        run = _current_run.get()
+        if run is not None:
+            calls = run["calls"].setdefault((kind, name), [0, 0.0, 0.0])
+            calls[0] += 1
+            calls[1] += seconds
+            calls[2] += self_seconds
+
+    @contextmanager
+    def timer(self, name, kind="section"):
+        """Context manager timing the enclosed block."""
+        children = [0.0]
+        token = _open_timers.set(_open_timers.get() + (children,))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _open_timers.reset(token)
+            parents = _open_timers.get()
+            if parents:
+                parents[-1][0] += seconds
+            self.record(kind, name, seconds, seconds - children[0])
+
+    def timed(self, name=None, kind="function"):
+        """Decorator timing every call of a function."""
+
+        def decorator(func):
+            label = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(label, kind):
+                    return func(*args, **kwargs)
+
+            wrapper._instrumented = True
+            return wrapper
+
+        return decorator
+
+    def begin_run(self, label="rerun"):
+        """Start tallying calls for one script run; returns a token for ``end_run``."""
+        run = {"label": label, "started": time.time(), "calls": {}}
+        return _current_run.set(run), time.perf_counter()
+
+    def end_run(self, token, label=None):
+        """Finish the run started by ``begin_run`` and return its record."""
+        context_token, start = token
+        seconds = time.perf_counter() - start
+        run = _current_run.get()
+        _current_run.reset(context_token)
+        if label is not None:
+            run["label"] = label
+        run["seconds"] = seconds
+        self.record("rerun", run["label"], seconds)
+        with self._lock:
+            self.runs.append(run)
+        return run
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+            self.runs.clear()
+
+    def summary(self):
+        """Return one row per series, slowest total first."""
+        with self._lock:
+            items = [
+                (kind, name, s.calls, s.seconds, s.self_seconds, s.max, list(s.samples))
+                for (kind, name), s in self._series.items()
+            ]
+        rows = []
+        for kind, name, calls, seconds, self_seconds, longest, samples in items:
+            p50, p95 = _quantiles(samples)
+            rows.append(
+                {
+                    "Kind": kind,
+                    "Name": name,
+                    "Calls": calls,
+                    "Total (ms)": round(seconds * 1000, 2),
+                    "Self (ms)": round(self_seconds * 1000, 2),
+                    "Mean (ms)": round(seconds / calls * 1000, 2),
+                    "p50 (ms)": round(p50 * 1000, 2),
+                    "p95 (ms)": round(p95 * 1000, 2),
+                    "Max (ms)": round(longest * 1000, 2),
+                }
+            )
+        return sorted(rows, key=lambda row: row["Total (ms)"], reverse=True)
+
+    def run_breakdown(self, run=None):
+        """Return per-series rows for one rerun (the latest by default).
+
+        "Share of run" is the self time's share of the rerun, so nested
+        loaders are not counted twice and the shares add up to at most 1.
+        """
+        if run is None:
+            with self._lock:
+                run = self.runs[-1] if self.runs else None
+        if run is None:
+            return []
+        rows = [
+            {
+                "Kind": kind,
+                "Name": name,
+                "Calls": calls,
+                "Total (ms)": round(seconds * 1000, 2),
+                "Self (ms)": round(self_seconds * 1000, 2),
+                "Share of run": (
+                    self_seconds / run["seconds"] if run["seconds"] else 0.0
+                ),
+            }
+            for (kind, name), (calls, seconds, self_seconds) in run["calls"].items()
+        ]
+        return sorted(rows, key=lambda row: row["Total (ms)"], reverse=True)
+
+    def to_json(self):
+        """Serialize the aggregate series and recent reruns as JSON."""
+        with self._lock:
+            runs = [
+                {
+                    "label": run["label"],
+                    "started": run["started"],
+                    "seconds": run["seconds"],
+                    "calls": [
+                        {
+                            "kind": k,
+                            "name": n,
+                            "calls": c,
+                            "seconds": s,
+                            "self_seconds": own,
+                        }
+                        for (k, n), (c, s, own) in run["calls"].items()
+                    ],
+                }
+                for run in self.runs
+            ]
+        return json.dumps({"series": self.summary(), "runs": runs}, indent=2)
+
+    def to_prometheus(self, prefix=PROMETHEUS_PREFIX):
+        """Render the series in the Prometheus text exposition format."""
+        metric = f"{prefix}_call_seconds"
+        lines = [
+            f"# HELP {metric} Time spent in instrumented dashboard calls.",
+            f"# TYPE {metric} summary",
+        ]
+        maxima = [
+            f"# HELP {metric}_max Longest single call.",
+            f"# TYPE {metric}_max gauge",
+        ]
+        with self._lock:
+            items = sorted(
+                (kind, name, s.calls, s.seconds, s.max, list(s.samples))
+                for (kind, name), s in self._series.items()
+            )
+        for kind, name, calls, seconds, longest, samples in items:
+            labels = f'kind="{_escape(kind)}",name="{_escape(name)}"'
+            if samples:
+                for q, value in zip(QUANTILES, _quantiles(samples)):
+                    lines.append(f'{metric}{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f"{metric}_sum{{{labels}}} {seconds:.6f}")
+            lines.append(f"{metric}_count{{{labels}}} {calls}")
+            maxima.append(f"{metric}_max{{{labels}}} {longest:.6f}")
+        return "\n".join(lines + maxima) + "\n"
+
+    def write(self, path, fmt=None):
+        """Atomically write a Prometheus (``.prom``) or JSON snapshot to ``path``."""
+        fmt = fmt or ("json" if path.endswith(".json") else "prometheus")
+        text = self.to_json() if fmt == "json" else self.to_prometheus()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        return path
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsStore()
+
+
+def instrument_module(module, prefixes=None, store=None):
+    """Wrap the module's own ``get_*``/``create_*``/... functions with timers.
+
+    Functions are replaced on the module, so callers that look them up at
+    call time (including other functions in the module) are timed. The
+    original stays reachable through ``__wrapped__`` and attributes such as
+    ``invalidate`` are kept. Safe to call repeatedly. Returns the names
+    wrapped by this call.
+    """
+    prefixes = INSTRUMENTED_PREFIXES if prefixes is None else prefixes
+    store = metrics if store is None else store
+    wrapped = []
+    for attr, value in list(vars(module).items()):
+        if not inspect.isfunction(value) or getattr(value, "_instrumented", False):
+            continue
+        if value.__module__ != module.__name__:
+            continue
+        kind = next((k for p, k in prefixes.items() if attr.startswith(p)), None)
+        if kind is None:
+            continue
+        setattr(module, attr, store.timed(attr, kind)(value))
+        wrapped.append(attr)
+    return wrapped
+
+
+class MetricsFileWriter:
+    """Writes ``store`` to ``path`` at most once every ``interval`` seconds."""
+
+    def __init__(self, path, store=None, interval=15.0):
+        self.path = path
+        self.store = metrics if store is None else store
+        self.interval = interval
+        self._last = None
+        self._lock = threading.Lock()
+
+    def maybe_write(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self._last is not None and now - self._last < self.interval:
+                return False
+            self._last = now
+        self.store.write(self.path)
+        return True
+
+
+_file_writers = {}
+
+
+def write_metrics_file(path=None, interval=15.0):
+    """Export ``metrics`` to ``path`` (default ``DASHBOARD_METRICS_FILE``), throttled.
+
+    Returns True when the file was written. Does nothing without a path.
+    """
+    path = path or METRICS_FILE
+    if not path:
+        return False
+    writer = _file_writers.get(path)
+    if writer is None:
+        writer = _file_writers[path] = MetricsFileWriter(path, interval=interval)
+    return writer.maybe_write()
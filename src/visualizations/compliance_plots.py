@@ -1,43 +1,56 @@
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 
+from .figure_cache import cached_figure
+from .geo import MAX_MAP_POINTS, cluster_marker_sizes, cluster_points
+from .heatmaps import annotated_heatmap
 
+
+@cached_figure
 def create_compliance_heatmap(compliance_data):
-    """Create heatmap visualization for compliance matrix."""
-    # Convert checkmarks to numeric values for heatmap
-    value_map = {"✅": 1, "⚠️": 0.5, "❌": 0}
-    numeric_data = compliance_data.copy()
-
-    for col in ["US Providers", "EU Providers", "China Providers"]:
-        numeric_data[col] = numeric_data[col].map(value_map)
-
-    fig = px.imshow(
-        numeric_data.set_index("Requirement")[
-            ["US Providers", "EU Providers", "China Providers"]
-        ],
-        color_continuous_scale=["red", "yellow", "green"],
+    """Create heatmap visualization for compliance matrix.
+
+    Accepts a ``ComplianceMatrix`` (see ``data.compliance_index``), whose
+    integer support levels are used directly, or the legacy symbol table.
+    """
+    if hasattr(compliance_data, "levels"):
+        # Levels are 0 (none), 1 (partial) or 2 (full)
+        levels = compliance_data.levels.T
+        columns = compliance_data.providers
+        requirements = compliance_data.requirements
+        symbols = np.array(["❌", "⚠️", "✅"])[levels]
+        z = levels / 2
+    else:
+        value_map = {"✅": 1, "⚠️": 0.5, "❌": 0}
+        columns = [c for c in compliance_data.columns if c != "Requirement"]
+        requirements = compliance_data["Requirement"]
+        symbols = compliance_data[columns].to_numpy()
+        z = np.vectorize(value_map.__getitem__, otypes=[float])(symbols)
+
+    fig = annotated_heatmap(
+        z=z,
+        x=columns,
+        y=requirements,
+        text=symbols,
+        colorscale=["red", "yellow", "green"],
+        zmin=0,
+        zmax=1,
+        colorbar=dict(title="Compliance Level"),
+        hovertemplate="%{y} / %{x}: %{text}<extra></extra>",
+    )
+    fig.update_layout(
         title="Compliance Requirements Coverage",
-        labels={"color": "Compliance Level"},
         meta={
             "aria-label": "Heatmap showing compliance requirements coverage for US, EU, and China cloud providers in 2025."
         },
     )
 
-    # Add text annotations
-    for i, req in enumerate(compliance_data["Requirement"]):
-        for j, col in enumerate(["US Providers", "EU Providers", "China Providers"]):
-            fig.add_annotation(
-                text=compliance_data.iloc[i][col],
-                x=j,
-                y=i,
-                showarrow=False,
-                font=dict(size=16),
-            )
-
     return fig
 
 
+@cached_figure
 def create_security_score_gauge(security_data):
     """Create gauge chart for security scores."""
     avg_risk_score = security_data["Risk Score"].mean()
@@ -63,41 +76,71 @@ def create_security_score_gauge(security_data):
     return fig
 
 
-def create_data_residency_map(residency_data):
-    """Create choropleth map for data residency."""
-    # Convert residency data to format suitable for choropleth
-    regions = []
-    for continent, data in residency_data.items():
-        for region in data["regions"]:
-            regions.append(
-                {
-                    "Region": region,
-                    "Continent": continent,
-                    "Providers": len(data["providers"]),
-                    "Compliance": len(data["compliance"]),
-                }
+@cached_figure
+def create_data_residency_map(residency_data, max_points=MAX_MAP_POINTS):
+    """Create a map of data residency regions, one trace per continent.
+
+    ``residency_data`` is a ``ResidencyCatalog`` (see
+    ``data.residency_index``) or the result of its ``grouped_coordinates``.
+    Beyond ``max_points`` locations, nearby regions of the same continent
+    merge into sized cluster markers so the payload stays bounded.
+    """
+    if hasattr(residency_data, "grouped_coordinates"):
+        residency_data = residency_data.grouped_coordinates()
+
+    continents = list(residency_data)
+    columns = ["region", "lat", "lon", "providers", "frameworks"]
+    points = {
+        key: (
+            np.concatenate(
+                [np.asarray(group[key]) for group in residency_data.values()]
             )
+            if continents
+            else np.empty(0)
+        )
+        for key in columns
+    }
+    codes = np.repeat(
+        np.arange(len(continents)),
+        [len(group["region"]) for group in residency_data.values()],
+    )
+    clusters = cluster_points(points["lat"], points["lon"], codes, max_points)
 
-    df = pd.DataFrame(regions)
+    first = clusters["first"]
+    counts = clusters["count"]
+    max_providers = np.zeros(len(counts), dtype=int)
+    valid = clusters["labels"] >= 0
+    np.maximum.at(max_providers, clusters["labels"][valid], points["providers"][valid])
+    names = pd.Series(points["region"][first], dtype=object)
+    single = (
+        names
+        + "<br>Providers: "
+        + pd.Series(points["providers"][first]).astype(str)
+        + "<br>Compliance: "
+        + pd.Series(points["frameworks"][first]).astype(str)
+    )
+    merged = (
+        pd.Series(counts).astype(str)
+        + " regions near "
+        + names
+        + "<br>Providers: up to "
+        + pd.Series(max_providers).astype(str)
+    )
+    hover = np.where(counts == 1, single, merged)
+    sizes = cluster_marker_sizes(counts)
 
     fig = go.Figure()
-
-    # Add traces for each continent
-    for continent in residency_data.keys():
-        continent_data = df[df["Continent"] == continent]
+    for code, continent in enumerate(continents):
+        rows = clusters["group"] == code
         fig.add_trace(
             go.Scattergeo(
-                lon=[0],  # Placeholder, would need actual coordinates
-                lat=[0],  # Placeholder, would need actual coordinates
-                text=continent_data.apply(
-                    lambda x: f"{x['Region']}<br>"
-                    f"Providers: {x['Providers']}<br>"
-                    f"Compliance: {x['Compliance']}",
-                    axis=1,
-                ),
+                lon=clusters["lon"][rows],
+                lat=clusters["lat"][rows],
+                text=hover[rows],
+                hoverinfo="text",
                 mode="markers",
                 name=continent,
-                marker=dict(size=10),
+                marker=dict(size=sizes[rows]),
             )
         )
 
@@ -117,35 +160,92 @@ def create_data_residency_map(residency_data):
     return fig
 
 
-def create_certification_timeline(security_data):
-    """Create timeline visualization for security certifications."""
-    fig = go.Figure()
+# Above this many providers the latest-audit markers drop their text labels
+MAX_TIMELINE_LABELS = 40
 
-    for idx, row in security_data.iterrows():
+
+def _audit_history_lines(audit_history):
+    """Return x/y arrays joining each provider's audits, split by gaps."""
+    ordered = audit_history.sort_values(["Provider", "Audit Date"], kind="stable")
+    x = ordered["Audit Date"].to_numpy(dtype="datetime64[ns]")
+    y = ordered["Provider"].to_numpy(dtype=object)
+    # A gap after each provider's last audit breaks the line
+    breaks = np.flatnonzero(y[1:] != y[:-1]) + 1
+    return np.insert(x, breaks, np.datetime64("NaT")), np.insert(y, breaks, None)
+
+
+@cached_figure
+def create_certification_timeline(security_data, audit_history=None):
+    """Create timeline visualization for security certifications.
+
+    All providers share one marker trace styled from arrays, so the figure
+    size grows with the number of audits rather than with one trace per
+    provider. ``audit_history`` (``Provider``, ``Audit Date`` and
+    ``Risk Score`` columns) adds every past audit as two more traces.
+    """
+    providers = security_data["Provider"].to_numpy(dtype=object)
+    scores = security_data["Risk Score"].to_numpy()
+    labelled = len(security_data) <= MAX_TIMELINE_LABELS
+    cmin = float(scores.min()) if len(scores) else 0
+    cmax = float(scores.max()) if len(scores) else 100
+    marker_colors = dict(colorscale="Viridis", cmin=cmin, cmax=cmax)
+
+    fig = go.Figure()
+    if audit_history is not None and not audit_history.empty:
+        line_x, line_y = _audit_history_lines(audit_history)
+        fig.add_trace(
+            go.Scatter(
+                x=line_x,
+                y=line_y,
+                mode="lines",
+                line=dict(color="lightgray", width=1),
+                hoverinfo="skip",
+                name="Audit history",
+            )
+        )
         fig.add_trace(
             go.Scatter(
-                x=[row["Last Audit"]],
-                y=[row["Provider"]],
-                mode="markers+text",
-                name=row["Provider"],
-                text=f"Score: {row['Risk Score']}",
-                textposition="middle right",
-                hovertext=f"Certifications: {', '.join(row['Certifications'])}",
-                marker=dict(
-                    size=20,
-                    color=row["Risk Score"],
-                    colorscale="Viridis",
-                    showscale=True,
-                ),
+                x=audit_history["Audit Date"],
+                y=audit_history["Provider"],
+                mode="markers",
+                marker=dict(size=7, color=audit_history["Risk Score"], **marker_colors),
+                customdata=audit_history["Risk Score"],
+                hovertemplate="%{y}<br>Audit: %{x|%Y-%m-%d}<br>"
+                "Score: %{customdata}<extra></extra>",
+                name="Past audits",
             )
         )
 
+    hover = "Certifications: " + security_data["Certifications"].str.join(", ")
+    fig.add_trace(
+        go.Scatter(
+            x=security_data["Last Audit"],
+            y=providers,
+            mode="markers+text" if labelled else "markers",
+            text=("Score: " + pd.Series(scores).astype(str)).to_numpy(),
+            textposition="middle right",
+            hovertext=hover.to_numpy(),
+            marker=dict(
+                size=20 if labelled else 10,
+                color=scores,
+                showscale=True,
+                colorbar=dict(title="Risk Score"),
+                **marker_colors,
+            ),
+            name="Last audit",
+        )
+    )
+
     fig.update_layout(
         title="Security Certification Timeline",
         xaxis_title="Last Audit Date",
         yaxis_title="Provider",
         showlegend=False,
     )
+    fig.update_yaxes(type="category", categoryorder="array", categoryarray=providers)
+    if not labelled:
+        # Keep one row per provider readable on large fleets
+        fig.update_layout(height=min(max(450, 14 * len(providers)), 6000))
 
     return fig
 
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+# Plotly charts render at roughly this width inside the Streamlit layout
+DEFAULT_CHART_WIDTH = 1000
+# One point per two pixels keeps lines visually identical to the full series
+DEFAULT_POINTS_PER_PIXEL = 0.5
+
+
+def target_points(width_px=DEFAULT_CHART_WIDTH, points_per_pixel=None):
+    """Return the number of points worth sending for a chart ``width_px`` wide."""
+    if points_per_pixel is None:
+        points_per_pixel = DEFAULT_POINTS_PER_PIXEL
+    return max(3, int(width_px * points_per_pixel))
+
+
+def _bucket_edges(n, buckets):
+    """Split points 1..n-2 into ``buckets`` contiguous ranges."""
+    return np.linspace(1, n - 1, buckets + 1).astype(np.intp)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets over every column of ``y`` at once.
+
+    ``x`` has shape (N,) and ``y`` shape (N, C). Returns an (n_out, C) array
+    of row indices: the first and last rows plus, per bucket and column, the
+    row forming the largest triangle with the previously kept point and the
+    average of the next bucket. Buckets are walked in order because each
+    choice depends on the last, but every step is vectorized across columns.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 1:
+        y = y[:, None]
+    n, columns = y.shape
+    if n_out >= n or n_out < 3:
+        return np.repeat(np.arange(n)[:, None], columns, axis=1)
+
+    edges = _bucket_edges(n, n_out - 2)
+    # Average of each bucket, with the last point as the final "next bucket"
+    sums = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1, axis=0)
+    sizes = np.diff(edges)[:, None]
+    next_y = np.vstack([sums / sizes, y[-1:]])[1:]
+    x_sums = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1)
+    next_x = np.append(x_sums / sizes[:, 0], x[-1])[1:]
+
+    selected = np.empty((n_out, columns), dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    cols = np.arange(columns)
+    prev = np.zeros(columns, dtype=np.intp)
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        ax, ay = x[prev], y[prev, cols]
+        bx, by = x[start:stop, None], y[start:stop]
+        # Twice the triangle area; the constant factor does not change argmax
+        area = np.abs((ax - next_x[b]) * (by - ay) - (ax - bx) * (next_y[b] - ay))
+        prev = start + area.argmax(axis=0)
+        selected[b + 1] = prev
+    return selected
+
+
+def minmax_envelope(y, buckets):
+    """Return per-bucket (start row, min, max) arrays for every column of ``y``."""
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 1:
+        y = y[:, None]
+    starts = np.linspace(0, len(y), min(buckets, len(y)) + 1).astype(np.intp)[:-1]
+    starts = np.unique(starts)
+    return (
+        starts,
+        np.fmin.reduceat(y, starts, axis=0),
+        np.fmax.reduceat(y, starts, axis=0),
+    )
+
+
+def downsample_long(frame, x_column, value_columns, n_out, var_name, value_name):
+    """LTTB-downsample wide ``frame`` into long (x, var, value) rows."""
+    x = frame[x_column].to_numpy()
+    x_numeric = x.astype("datetime64[ns]").astype(np.int64) if _is_time(x) else x
+    values = frame[value_columns].to_numpy(dtype=float)
+    rows = lttb_indices(x_numeric, values, n_out)
+    cols = np.broadcast_to(np.arange(len(value_columns)), rows.shape)
+    # Column-major so each variable's points stay together and in order
+    rows, cols = rows.T.ravel(), cols.T.ravel()
+    return pd.DataFrame(
+        {
+            x_column: x[rows],
+            var_name: np.asarray(value_columns, dtype=object)[cols],
+            value_name: values[rows, cols],
+        }
+    )
+
+
+def _is_time(values):
+    return np.issubdtype(np.asarray(values).dtype, np.datetime64)
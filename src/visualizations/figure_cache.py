@@ -0,0 +1,167 @@
+import json
+import pickle
+import hashlib
+import threading
+import functools
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _update_fingerprint(hasher, value):
+    """Feed a builder argument into ``hasher`` by content."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        hasher.update(type(value).__name__.encode())
+        hasher.update(repr(value.shape).encode())
+        if isinstance(value, pd.DataFrame):
+            hasher.update(repr(list(value.columns)).encode())
+            hasher.update(repr(list(value.dtypes.astype(str))).encode())
+        else:
+            hasher.update(repr((value.name, str(value.dtype))).encode())
+        try:
+            hashes = pd.util.hash_pandas_object(value, index=True)
+            hasher.update(hashes.to_numpy().tobytes())
+        except TypeError:
+            # Unhashable cells (e.g. lists of certifications)
+            hasher.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    elif isinstance(value, np.ndarray):
+        hasher.update(repr((value.dtype.str, value.shape)).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        hasher.update(b"{")
+        for key in sorted(value, key=repr):
+            _update_fingerprint(hasher, key)
+            _update_fingerprint(hasher, value[key])
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for item in value:
+            _update_fingerprint(hasher, item)
+        hasher.update(b"]")
+    elif hasattr(value, "__dict__") and not callable(value):
+        # Plain data objects (e.g. a ComplianceMatrix) hash by their attributes
+        hasher.update(type(value).__qualname__.encode())
+        _update_fingerprint(hasher, vars(value))
+    else:
+        hasher.update(repr(value).encode())
+        hasher.update(b"\x00")
+
+
+def fingerprint(*values):
+    """Return a short content hash of DataFrames, arrays and plain values."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update_fingerprint(hasher, value)
+    return hasher.hexdigest()
+
+
+class FigureCache:
+    """LRU cache of serialized Plotly figures under a byte budget.
+
+    Entries are keyed by builder name and a content hash of the builder's
+    arguments and hold the figure's JSON. A hit rebuilds a fresh
+    ``go.Figure`` from that JSON without re-running validation, so callers
+    can still modify the figure they get back.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._stats = {}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+    def _builder_stats(self, name):
+        return self._stats.setdefault(name, {"hits": 0, "misses": 0, "evictions": 0})
+
+    def get_or_build(self, name, args, kwargs, builder):
+        """Return the cached figure for these arguments, building it on a miss."""
+        key = (name, fingerprint(args, kwargs))
+        with self._lock:
+            stats = self._builder_stats(name)
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                stats["hits"] += 1
+            else:
+                stats["misses"] += 1
+        if payload is not None:
+            return go.Figure(json.loads(payload), _validate=False)
+
+        fig = builder(*args, **kwargs)
+        self._store(key, fig.to_json())
+        return fig
+
+    def _store(self, key, payload):
+        nbytes = len(payload)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                old_key, old = self._entries.popitem(last=False)
+                self._nbytes -= len(old)
+                self._builder_stats(old_key[0])["evictions"] += 1
+
+    def clear(self, name=None):
+        """Drop cached figures for one builder, or for every builder."""
+        with self._lock:
+            keys = [k for k in self._entries if name is None or k[0] == name]
+            for key in keys:
+                self._nbytes -= len(self._entries.pop(key))
+            return len(keys)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def stats(self):
+        """Return hits, misses, evictions, hit rate and bytes per builder."""
+        with self._lock:
+            report = {}
+            for name, counters in self._stats.items():
+                payloads = [p for k, p in self._entries.items() if k[0] == name]
+                lookups = counters["hits"] + counters["misses"]
+                report[name] = {
+                    **counters,
+                    "entries": len(payloads),
+                    "bytes": sum(len(p) for p in payloads),
+                    "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+                }
+            return report
+
+
+figure_cache = FigureCache()
+
+
+def cached_figure(func=None, *, cache=None):
+    """Decorator caching a ``create_*`` builder's figure by input content.
+
+    The uncached builder stays reachable as ``builder.__wrapped__``.
+    """
+
+    def decorator(func):
+        target = cache if cache is not None else figure_cache
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return target.get_or_build(name, args, kwargs, func)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def figure_cache_stats():
+    """Return statistics for the shared figure cache."""
+    return figure_cache.stats()
@@ -0,0 +1,65 @@
+import numpy as np
+
+# Upper bound on markers sent to the browser for one map
+MAX_MAP_POINTS = 1500
+# Finest clustering grid, in degrees; coarsened by doubling until points fit
+MIN_CELL_DEGREES = 0.25
+
+
+def cluster_points(lat, lon, groups=None, max_points=MAX_MAP_POINTS):
+    """Snap points to the finest lat/lon grid that leaves at most ``max_points``.
+
+    Points in the same cell (and the same ``groups`` code, if given) merge
+    into one cluster at their centroid. Returns a dict of arrays with one
+    entry per cluster: ``lat``, ``lon``, ``count``, ``first`` (index of a
+    representative input point) and ``group``; ``labels`` maps every input
+    point to its cluster. Points with missing coordinates are dropped.
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    groups = np.zeros(len(lat), dtype=np.int64) if groups is None else groups
+    groups = np.asarray(groups, dtype=np.int64)
+    valid = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+    labels = np.full(len(lat), -1, dtype=np.int64)
+
+    if len(valid) <= max_points:
+        labels[valid] = np.arange(len(valid))
+        return {
+            "lat": lat[valid],
+            "lon": lon[valid],
+            "count": np.ones(len(valid), dtype=np.int64),
+            "first": valid,
+            "group": groups[valid],
+            "labels": labels,
+            "cell_degrees": 0.0,
+        }
+
+    cell = MIN_CELL_DEGREES
+    while True:
+        lat_bin = np.floor((lat[valid] + 90) / cell).astype(np.int64)
+        lon_bin = np.floor((lon[valid] + 180) / cell).astype(np.int64)
+        columns = int(360 / cell) + 1
+        rows = int(180 / cell) + 1
+        keys = (groups[valid] * rows + lat_bin) * columns + lon_bin
+        _, first, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        if len(counts) <= max_points or cell >= 180:
+            break
+        cell *= 2
+
+    labels[valid] = inverse
+    return {
+        "lat": np.bincount(inverse, weights=lat[valid]) / counts,
+        "lon": np.bincount(inverse, weights=lon[valid]) / counts,
+        "count": counts,
+        "first": valid[first],
+        "group": groups[valid][first],
+        "labels": labels,
+        "cell_degrees": cell,
+    }
+
+
+def cluster_marker_sizes(counts, base=10, max_size=40):
+    """Grow marker size with the log of the cluster size."""
+    return np.minimum(base + 4 * np.log2(np.asarray(counts, dtype=float)), max_size)
@@ -1,23 +1,83 @@
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 
+from .figure_cache import cached_figure
+from .heatmaps import annotated_heatmap
 
+RADAR_METRICS = [
+    "Latency (ms)",
+    "Uptime (%)",
+    "IOPS",
+    "Network Throughput (Gbps)",
+]
+
+
+def _codes(values):
+    """Return (integer codes, labels) for a grouping column.
+
+    Categorical columns reuse their own codes, so no per-row labels are
+    hashed; other columns are factorized in sorted order like ``groupby``.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    codes, labels = pd.factorize(values, sort=True)
+    return codes, pd.Index(labels)
+
+
+def _group_means(frame, keys, columns):
+    """Mean of ``columns`` per observed combination of ``keys``.
+
+    Sums and counts come from ``np.bincount`` over the combined key codes;
+    missing keys and missing values are skipped, as in ``groupby().mean()``.
+    Returns a frame indexed by ``keys`` (a MultiIndex for several keys).
+    """
+    group = np.zeros(len(frame), dtype=np.int32)
+    valid = np.ones(len(frame), dtype=bool)
+    levels = []
+    for key in keys:
+        codes, labels = _codes(frame[key])
+        group = group * len(labels) + codes
+        valid &= codes >= 0
+        levels.append(labels)
+    cells = int(np.prod([len(labels) for labels in levels]))
+    if not valid.all():
+        frame, group = frame[valid], group[valid]
+    counts = np.bincount(group, minlength=cells)
+    present = np.flatnonzero(counts)
+    result = {}
+    for column in columns:
+        values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        seen = ~np.isnan(values)
+        if seen.all():
+            sums, n = np.bincount(group, weights=values, minlength=cells), counts
+        else:
+            sums = np.bincount(group[seen], weights=values[seen], minlength=cells)
+            n = np.bincount(group[seen], minlength=cells)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[column] = sums[present] / n[present]
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.Categorical.from_codes(position, categories=labels)
+            for labels, position in zip(
+                levels, np.unravel_index(present, [len(lv) for lv in levels])
+            )
+        ],
+        names=keys,
+    )
+    if len(keys) == 1:
+        index = index.get_level_values(0)
+    return pd.DataFrame(result, index=index)
+
+
+@cached_figure
 def create_performance_radar(performance_data):
     """Create radar chart for performance metrics by provider."""
     # Calculate average metrics per provider
-    avg_metrics = (
-        performance_data.groupby("Provider")
-        .agg(
-            {
-                "Latency (ms)": "mean",
-                "Uptime (%)": "mean",
-                "IOPS": "mean",
-                "Network Throughput (Gbps)": "mean",
-            }
-        )
-        .reset_index()
-    )
+    avg_metrics = _group_means(
+        performance_data, ["Provider"], RADAR_METRICS
+    ).reset_index()
 
     fig = go.Figure()
 
@@ -50,32 +110,28 @@ def create_performance_radar(performance_data):
     return fig
 
 
+@cached_figure
 def create_latency_heatmap(performance_data):
     """Create heatmap of latency across regions and providers."""
-    latency_pivot = performance_data.pivot(
-        index="Provider", columns="Region", values="Latency (ms)"
-    )
+    latency_pivot = _group_means(
+        performance_data, ["Provider", "Region"], ["Latency (ms)"]
+    )["Latency (ms)"].unstack("Region")
 
-    fig = px.imshow(
-        latency_pivot,
-        title="Latency by Region and Provider (ms)",
-        color_continuous_scale="RdYlGn_r",  # Reverse scale: red=high latency, green=low latency
+    fig = annotated_heatmap(
+        z=latency_pivot.to_numpy(),
+        x=latency_pivot.columns.astype(str),
+        y=latency_pivot.index.astype(str),
+        texttemplate="%{z:.1f}",
+        font_color="white",
+        colorscale="RdYlGn_r",  # Reverse scale: red=high latency, green=low latency
+        hovertemplate="%{y} / %{x}: %{z:.1f} ms<extra></extra>",
     )
-
-    # Add text annotations
-    for i in range(len(latency_pivot.index)):
-        for j in range(len(latency_pivot.columns)):
-            fig.add_annotation(
-                text=f"{latency_pivot.iloc[i, j]:.1f}",
-                x=j,
-                y=i,
-                showarrow=False,
-                font=dict(color="white"),
-            )
+    fig.update_layout(title="Latency by Region and Provider (ms)")
 
     return fig
 
 
+@cached_figure
 def create_sla_comparison(sla_data):
     """Create bar chart comparing SLAs across providers."""
     fig = go.Figure()
@@ -100,6 +156,7 @@ def create_sla_comparison(sla_data):
     return fig
 
 
+@cached_figure
 def create_cost_comparison(cost_data):
     """Create grouped bar chart for cost comparison."""
     # Melt the dataframe for easier plotting
@@ -124,40 +181,59 @@ def create_cost_comparison(cost_data):
     return fig
 
 
-def create_tco_analysis(tco_data):
-    """Create visualization for TCO analysis."""
-    fig = go.Figure()
-
-    # Add bars for different time periods
-    fig.add_trace(
-        go.Bar(
-            name="Monthly Cost",
-            x=tco_data["Provider"],
-            y=tco_data["Monthly Cost"],
-            text=tco_data["Monthly Cost"].apply(lambda x: f"${x:,.2f}"),
-            textposition="auto",
-        )
+def _band_error(values, bands, label):
+    """Asymmetric error bars spanning ``bands``' P10-P90 around ``values``."""
+    return dict(
+        type="data",
+        symmetric=False,
+        array=(bands[f"{label} P90"] - values).clip(lower=0).to_numpy(),
+        arrayminus=(values - bands[f"{label} P10"]).clip(lower=0).to_numpy(),
+        color="black",
+        thickness=1.5,
     )
 
-    fig.add_trace(
-        go.Bar(
-            name="Yearly Cost",
-            x=tco_data["Provider"],
-            y=tco_data["Yearly Cost"],
-            text=tco_data["Yearly Cost"].apply(lambda x: f"${x:,.2f}"),
-            textposition="auto",
+
+@cached_figure
+def create_tco_analysis(tco_data, bands=None):
+    """Create visualization for TCO analysis.
+
+    ``bands`` is an optional ``simulate_tco`` result; its P10-P90 ranges are
+    drawn as error bars on the monthly and 3-year bars.
+    """
+    fig = go.Figure()
+    if bands is not None:
+        bands = (
+            bands.set_index("Provider")
+            .reindex(tco_data["Provider"])
+            .reset_index(drop=True)
         )
-    )
 
-    fig.add_trace(
-        go.Bar(
-            name="3-Year TCO",
+    # Add bars for different time periods
+    for column, label in [
+        ("Monthly Cost", "Monthly"),
+        ("Yearly Cost", None),
+        ("3-Year TCO", "3-Year"),
+    ]:
+        values = tco_data[column].reset_index(drop=True)
+        bar = dict(
+            name=column,
             x=tco_data["Provider"],
-            y=tco_data["3-Year TCO"],
-            text=tco_data["3-Year TCO"].apply(lambda x: f"${x:,.2f}"),
+            y=values,
+            text=values.apply(lambda x: f"${x:,.2f}"),
             textposition="auto",
         )
-    )
+        if bands is not None and label is not None:
+            bar["error_y"] = _band_error(values, bands, label)
+            bar["customdata"] = bands[
+                [f"{label} P10", f"{label} P50", f"{label} P90", "Cheapest (%)"]
+            ].to_numpy()
+            bar["hovertemplate"] = (
+                "%{x}: $%{y:,.2f}<br>P10 $%{customdata[0]:,.2f}"
+                " · P50 $%{customdata[1]:,.2f} · P90 $%{customdata[2]:,.2f}"
+                "<br>Cheapest in %{customdata[3]:.1f}% of scenarios"
+                f"<extra>{column}</extra>"
+            )
+        fig.add_trace(go.Bar(**bar))
 
     # Add savings as a line
     fig.add_trace(
@@ -174,7 +250,8 @@ def create_tco_analysis(tco_data):
     )
 
     fig.update_layout(
-        title="Total Cost of Ownership Analysis",
+        title="Total Cost of Ownership Analysis"
+        + (" (P10-P90 bands)" if bands is not None else ""),
         barmode="group",
         yaxis=dict(title="Cost (USD)"),
         yaxis2=dict(title="Savings (%)", overlaying="y", side="right", range=[0, 100]),
@@ -2,17 +2,29 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 
+from .downsample import (
+    DEFAULT_CHART_WIDTH,
+    downsample_long,
+    minmax_envelope,
+    target_points,
+)
+from .figure_cache import cached_figure
 
+
+@cached_figure
 def create_market_share_treemap(market_data):
     """Create treemap visualization for market share data (colorblind-friendly, accessible)."""
     # Add total market size for better visualization
     total_market = market_data["Market Share (%)"].sum()
 
-    # Create hover text with both market share and growth
-    market_data["Hover_Text"] = market_data.apply(
-        lambda x: f"Market Share: {x['Market Share (%)']}%<br>"
-        f"YoY Growth: {x['YoY Growth (%)']}%",
-        axis=1,
+    # Create hover text with both market share and growth (on a copy, the
+    # input may be a cached loader result shared between reruns)
+    market_data = market_data.assign(
+        Hover_Text=market_data.apply(
+            lambda x: f"Market Share: {x['Market Share (%)']}%<br>"
+            f"YoY Growth: {x['YoY Growth (%)']}%",
+            axis=1,
+        )
     )
 
     # Use colorblind-friendly palette (e.g., 'Viridis')
@@ -56,20 +68,65 @@ def create_market_share_treemap(market_data):
     return fig
 
 
-def create_growth_trends_line(growth_data):
-    """Create line plot for growth trends (colorblind-friendly)."""
-    return px.line(
-        growth_data.melt(id_vars=["Date"], var_name="Region", value_name="Growth"),
+@cached_figure
+def create_growth_trends_line(
+    growth_data, width_px=DEFAULT_CHART_WIDTH, points_per_pixel=None
+):
+    """Create line plot for growth trends (colorblind-friendly).
+
+    Series longer than the chart can show (``width_px`` times
+    ``points_per_pixel``) are reduced with LTTB, and a shaded min/max band
+    per region keeps the spikes that fall between the kept points visible.
+    """
+    regions = [c for c in growth_data.columns if c != "Date"]
+    max_points = target_points(width_px, points_per_pixel)
+    labels = {"Growth": "Growth Rate (%)", "Date": "Year"}
+    palette = px.colors.qualitative.Safe  # Colorblind-friendly
+
+    if len(growth_data) <= max_points:
+        return px.line(
+            growth_data.melt(id_vars=["Date"], var_name="Region", value_name="Growth"),
+            x="Date",
+            y="Growth",
+            color="Region",
+            color_discrete_sequence=palette,
+            title="Regional Market Growth Trends",
+            labels=labels,
+            markers=True,
+        )
+
+    fig = px.line(
+        downsample_long(growth_data, "Date", regions, max_points, "Region", "Growth"),
         x="Date",
         y="Growth",
         color="Region",
-        color_discrete_sequence=px.colors.qualitative.Safe,  # Colorblind-friendly
+        color_discrete_sequence=palette,
         title="Regional Market Growth Trends",
-        labels={"Growth": "Growth Rate (%)", "Date": "Year"},
-        markers=True,
+        labels=labels,
+    )
+    starts, lows, highs = minmax_envelope(
+        growth_data[regions].to_numpy(dtype=float), max_points // 2
     )
+    dates = growth_data["Date"].to_numpy()[starts]
+    band_x = np.concatenate([dates, dates[::-1]])
+    for i, region in enumerate(regions):
+        fig.add_trace(
+            go.Scatter(
+                x=band_x,
+                y=np.concatenate([highs[:, i], lows[::-1, i]]),
+                fill="toself",
+                fillcolor=palette[i % len(palette)],
+                opacity=0.2,
+                line=dict(width=0),
+                hoverinfo="skip",
+                showlegend=False,
+                name=f"{region} range",
+            )
+        )
+    return fig
 
 
+@cached_figure
 def create_provider_comparison_radar(market_data):
     """Create radar chart for provider comparison (colorblind-friendly)."""
     categories = ["Market Share", "Growth Rate", "Performance", "Security"]
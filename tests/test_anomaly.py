@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+from src.analytics.anomaly import (
+    CUSUMDetector,
+    EWMADetector,
+    RollingZScoreDetector,
+    StreamingAnomalyMonitor,
+)
+from src.data import market_data
+
+
+def feed(detector, values):
+    return [detector.update(np.asarray(row, dtype=float)) for row in values]
+
+
+def test_ewma_flags_spike_only_in_affected_series():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 1, (50, 3))
+    values[40, 1] += 12
+    results = feed(EWMADetector(3), values)
+    flagged = {
+        (t, s) for t, (_, flags) in enumerate(results) for s in np.flatnonzero(flags)
+    }
+    assert (40, 1) in flagged
+    assert all(s == 1 for t, s in flagged if t == 40)
+
+
+def test_rolling_zscore_matches_brute_force():
+    rng = np.random.default_rng(1)
+    values = rng.normal(5, 2, (30, 2))
+    values[3, 0] = np.nan
+    detector = RollingZScoreDetector(2, window=5)
+    results = feed(detector, values)
+    for t in (10, 20, 29):
+        for s in range(2):
+            history = values[:t, s]
+            history = history[np.isfinite(history)][-5:]
+            expected = (values[t, s] - history.mean()) / history.std()
+            assert np.isclose(results[t][0][s], expected)
+
+
+def test_cusum_detects_sustained_shift():
+    rng = np.random.default_rng(2)
+    values = rng.normal(0, 1, (60, 1))
+    values[30:] += 2.5
+    results = feed(CUSUMDetector(1), values)
+    alarms = [t for t, (_, flags) in enumerate(results) if flags[0]]
+    assert any(30 <= t < 40 for t in alarms)
+    assert not any(10 <= t < 30 for t in alarms)
+
+
+def test_monitor_consumes_only_new_rows():
+    dates = pd.date_range("2025-01-31", periods=24, freq="ME")
+    frame = pd.DataFrame(
+        {"Date": dates, "A": np.arange(24.0), "B": np.arange(24.0) * 2}
+    )
+    frame.loc[20, "A"] += 30
+    monitor = StreamingAnomalyMonitor(["A", "B"])
+    monitor.consume(frame.iloc[:16])
+    assert monitor.points == 16
+    events = monitor.consume(frame)
+    assert monitor.points == 24
+    assert events and events[0]["series"] == "A"
+    assert events[0]["timestamp"] == dates[20]
+    assert monitor.consume(frame) == []
+
+
+def test_smooth_noisy_series_raise_no_flags():
+    # Steady growth with noise far below the level: the relative spread floor
+    # keeps rounding-sized wiggles from scoring as anomalies
+    rng = np.random.default_rng(3)
+    values = np.cumsum(1 + rng.normal(0, 1e-5, (48, 3)), axis=0)
+    monitor = StreamingAnomalyMonitor(["A", "B", "C"])
+    for row in values:
+        monitor.update(row)
+    assert list(monitor.events) == []
+
+    # The 12-month Home growth series is shorter than the warmup
+    for seed in range(20):
+        growth = market_data.get_market_dataset.__wrapped__(seed=seed)["growth"]
+        monitor = StreamingAnomalyMonitor(market_data.GROWTH_REGIONS)
+        assert monitor.consume(growth) == []
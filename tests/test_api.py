@@ -0,0 +1,108 @@
+import gzip
+import json
+import threading
+import urllib.request
+from urllib.error import HTTPError
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from src.data.api import DatasetAPI, make_server
+
+
+def get_json(api, target, headers=None):
+    status, response_headers, body = api.handle("GET", target, headers)
+    return status, response_headers, json.loads(body) if body else None
+
+
+def test_conditional_requests_and_precomputed_etags():
+    now = [0.0]
+    api = DatasetAPI(ttl=60, clock=lambda: now[0])
+    status, headers, body = get_json(api, "/api/v1/datasets/sla_comparisons")
+    assert status == 200 and headers["Content-Type"] == "application/json"
+    assert body["dataset"] == "sla_comparisons" and len(body["data"]) == 6
+
+    etag = headers["ETag"]
+    status, headers, body = get_json(
+        api, "/api/v1/datasets/sla_comparisons", {"If-None-Match": etag}
+    )
+    assert status == 304 and body is None and headers["ETag"] == etag
+    assert api.builds == 1
+
+    # Expired entries are rebuilt; unchanged data keeps the same ETag
+    now[0] = 61
+    status, headers, _ = get_json(
+        api, "/api/v1/datasets/sla_comparisons", {"If-None-Match": "W/" + etag}
+    )
+    assert status == 304 and api.builds == 2
+
+
+def test_region_provider_and_role_filters():
+    api = DatasetAPI()
+    _, _, body = get_json(api, "/api/v1/datasets/cost_analysis?provider=aws,GCP")
+    assert set(body["data"][0]) == {"Service", "AWS", "GCP"}
+
+    _, _, body = get_json(
+        api, "/api/v1/datasets/market_share?role=Analyst&region=Asia%20Pacific"
+    )
+    assert {row["Region"] for row in body["data"]} == {"Asia Pacific"}
+    assert "raw_data_export" not in body and "advanced_insights" in body
+
+    _, _, body = get_json(api, "/api/v1/datasets/data_residency?region=eu-west")
+    assert list(body["data"]) == ["Europe"]
+
+    _, _, body = get_json(api, "/api/v1/tco?compute=2&provider=Tencent")
+    assert [row["Provider"] for row in body["data"]] == ["Tencent"]
+    assert body["data"][0]["Monthly Cost"] == 82 * 2 + 43 + 23 + 12
+
+
+def test_errors():
+    api = DatasetAPI()
+    assert api.handle("GET", "/api/v1/datasets/missing")[0] == 404
+    assert api.handle("GET", "/api/v1/datasets/key_metrics?role=CEO")[0] == 400
+    assert api.handle("GET", "/api/v1/datasets/key_metrics?colour=red")[0] == 400
+    assert api.handle("GET", "/api/v1/tco?compute=lots")[0] == 400
+    assert api.handle("GET", "/api/v1/datasets/key_metrics?format=arrow")[0] == 406
+    assert api.handle("DELETE", "/api/v1/datasets/key_metrics")[0] == 405
+
+
+def test_http_server_serves_gzip_json_and_arrow():
+    server = make_server(port=0, api=DatasetAPI())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+    try:
+        request = urllib.request.Request(
+            base + "/datasets/region_coordinates", headers={"Accept-Encoding": "gzip"}
+        )
+        with urllib.request.urlopen(request) as response:
+            assert response.headers["Content-Encoding"] == "gzip"
+            etag = response.headers["ETag"]
+            rows = json.loads(gzip.decompress(response.read()))["data"]
+        assert len(rows) > 30 and {"region", "lat", "lon"} <= set(rows[0])
+
+        request.add_header("If-None-Match", etag)
+        try:
+            urllib.request.urlopen(request)
+            raise AssertionError("expected 304")
+        except HTTPError as exc:
+            assert exc.code == 304
+
+        with urllib.request.urlopen(
+            base + "/datasets/security_certifications?format=arrow&provider=AWS"
+        ) as response:
+            table = ipc.open_file(pa.BufferReader(response.read())).read_all()
+        assert table.column("Provider").to_pylist() == ["AWS"]
+        assert "ISO 27001" in table.column("Certifications").to_pylist()[0]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_warm_builds_default_responses():
+    api = DatasetAPI()
+    built = api.warm()
+    assert built >= 10 and api.builds >= built
+    before = api.builds
+    api.handle("GET", "/api/v1/datasets/audit_history", {})
+    assert api.builds == before
@@ -0,0 +1,62 @@
+from benchmarks.run_benchmarks import CASES, compare
+
+
+def result(seconds, peak_bytes=1024):
+    return {"seconds": seconds, "peak_bytes": peak_bytes}
+
+
+def test_every_builder_and_loader_is_registered():
+    names = {case["name"] for case in CASES}
+    assert {"calculate_tco", "get_performance_metrics"} <= names
+    assert "calculate_recommendation_score" in names
+    assert {n for n in names if n.startswith("create_")} >= {
+        "create_market_share_treemap",
+        "create_latency_heatmap",
+        "create_tco_analysis",
+    }
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {
+        "results": {
+            "slow[1]": result(0.100),
+            "noise[1]": result(0.0001),
+            "memory[1]": result(0.010, peak_bytes=1_000_000),
+        }
+    }
+    current = {
+        "results": {
+            "slow[1]": result(0.200),
+            "noise[1]": result(0.0005),
+            "memory[1]": result(0.010, peak_bytes=3_000_000),
+            "new[1]": result(5.0),
+        }
+    }
+    regressions = compare(current, baseline, threshold=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow[1]")
+    assert "peak memory" in regressions[1]
+
+
+def test_loader_cases_bypass_published_snapshots(monkeypatch):
+    from benchmarks.run_benchmarks import unwrap
+    from data import performance_data, snapshots
+
+    def no_snapshots():
+        raise AssertionError("benchmarks must not read snapshots")
+
+    monkeypatch.setattr(snapshots, "latest_snapshot", no_snapshots)
+    frame = unwrap(performance_data.get_performance_metrics)()
+    assert str(frame["IOPS"].dtype) == "Int32"
+
+
+def test_gate_uses_fastest_run_and_can_require_a_baseline(tmp_path):
+    from benchmarks.run_benchmarks import main
+
+    noisy = {"results": {"x": dict(result(0.05), min_seconds=0.010)}}
+    base = {"results": {"x": dict(result(0.02), min_seconds=0.009)}}
+    assert compare(noisy, base) == []
+    args = ["--quick", "--filter", "calculate_tco_batch"]
+    missing = str(tmp_path / "missing.json")
+    assert main(args + ["--baseline", missing]) == 0
+    assert main(args + ["--baseline", missing, "--require-baseline"]) == 2
@@ -0,0 +1,125 @@
+import asyncio
+
+import pandas as pd
+
+from src.data.collectors import (
+    DataCollector,
+    FrameSink,
+    HTTPProviderClient,
+    StoreSink,
+    StubMetricsServer,
+    create_client,
+    stub_metrics,
+)
+from src.data.timeseries_store import METRIC_COLUMNS, PerformanceStore
+
+PROVIDERS = ["AWS", "Azure", "GCP", "Alibaba", "Tencent"]
+REGIONS = [f"region-{i}" for i in range(80)]
+
+
+def collect(server_options, **collector_options):
+    async def go():
+        async with StubMetricsServer(**server_options) as server:
+            collector = DataCollector(
+                server.clients(PROVIDERS, REGIONS), **collector_options
+            )
+            report = await collector.collect(pd.Timestamp("2024-01-01 12:00"))
+            return report, server, collector
+
+    return asyncio.run(go())
+
+
+def test_collects_hundreds_of_endpoints_over_pooled_connections():
+    report, server, collector = collect(
+        {"delay": 0.002}, concurrency=100, connections_per_host=8, batch_rows=150
+    )
+    assert report["endpoints"] == len(PROVIDERS) * len(REGIONS) == 400
+    assert report["samples"] == report["rows_written"] == 400
+    assert report["failures"] == 0 and report["retries"] == 0
+    assert report["batches"] == 3
+    # Keep-alive reuse: requests share at most ``connections_per_host`` sockets
+    assert server.connections == report["connections"] <= 8
+    assert server.max_in_flight <= 8
+
+    frame = collector.sink.frame()
+    assert set(frame.columns) >= {"Timestamp", "Provider", "Region", *METRIC_COLUMNS}
+    assert (frame["Timestamp"] == pd.Timestamp("2024-01-01 12:00")).all()
+    row = frame[(frame["Provider"] == "GCP") & (frame["Region"] == "region-7")]
+    assert row.iloc[0]["IOPS"] == stub_metrics("GCP", "region-7")["IOPS"]
+
+
+def test_retries_transient_errors_and_gives_up_after_the_limit():
+    report, server, _ = collect({"fail_first": 2}, retries=3, backoff=0.001)
+    assert report["failures"] == 0
+    assert report["retries"] == 2 * 400
+    assert server.requests == report["requests"] == 3 * 400
+
+    report, _, collector = collect({"fail_first": 5}, retries=1, backoff=0.001)
+    assert report["failures"] == 400 and report["samples"] == 0
+    assert collector.sink.frame().empty
+
+
+def test_client_errors_are_not_retried():
+    async def go():
+        async with StubMetricsServer() as server:
+            client = HTTPProviderClient("AWS", server.base_url + "/missing", ["EU"])
+            return await DataCollector([client], retries=3).collect()
+
+    report = asyncio.run(go())
+    assert report["requests"] == 1 and report["failures"] == 1
+
+
+def test_store_sink_appends_and_drops_late_rows(tmp_path):
+    store = PerformanceStore.create(str(tmp_path / "store"))
+
+    async def go(server, at):
+        collector = DataCollector(
+            server.clients(PROVIDERS[:2], REGIONS[:5]), sink=StoreSink(store)
+        )
+        return collector, await collector.collect(pd.Timestamp(at))
+
+    async def rounds():
+        async with StubMetricsServer() as server:
+            await go(server, "2024-01-01 01:00")
+            return await go(server, "2024-01-01 00:00")
+
+    late, report = asyncio.run(rounds())
+    assert len(store) == 10
+    assert report["rows_written"] == 0 and late.sink.dropped == 10
+    assert store.providers == ["AWS", "Azure"]
+
+
+def test_clients_are_registered_by_type():
+    client = create_client("http", name="GCP", base_url="http://x/", regions=["EU"])
+    assert client.endpoints() == [("EU", "http://x/metrics/GCP/EU")]
+    assert isinstance(DataCollector([client]).sink, FrameSink)
+
+
+def test_bad_payload_fails_only_its_endpoint():
+    report, _, collector = collect({"malformed": ["region-3"]}, retries=2)
+    assert report["failures"] == len(PROVIDERS)
+    assert report["retries"] == 0
+    assert report["rows_written"] == 400 - len(PROVIDERS)
+    assert "region-3" not in set(collector.sink.frame()["Region"])
+
+
+def test_connect_is_bounded_by_the_timeout(monkeypatch):
+    from src.data.collectors import http
+
+    async def blackhole(host, port):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(http.asyncio, "open_connection", blackhole)
+
+    async def go():
+        async with http.HTTPClient(connections_per_host=1, timeout=0.05) as client:
+            for _ in range(2):
+                try:
+                    await client.get("http://198.51.100.1/metrics")
+                    raise AssertionError("expected a timeout")
+                except asyncio.TimeoutError:
+                    pass
+            # The pool slot was handed back after each timeout
+            return client.pool("198.51.100.1", 80)._slots.locked()
+
+    assert asyncio.run(go()) is False
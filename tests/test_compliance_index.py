@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.data import compliance_data
+from src.data.compliance_index import FULL, NONE, PARTIAL, ComplianceMatrix
+from src.visualizations.compliance_plots import create_compliance_heatmap
+
+
+def test_matrix_round_trips_the_symbol_table():
+    index = compliance_data.get_compliance_index()
+    frame = compliance_data.get_compliance_matrix()
+    assert frame.loc[frame["Requirement"] == "HIPAA", "EU Providers"].item() == "⚠️"
+    rebuilt = ComplianceMatrix.from_frame(frame)
+    assert rebuilt.providers == index.providers
+    assert np.array_equal(rebuilt.levels, index.levels)
+
+
+def test_requirement_set_queries():
+    index = compliance_data.get_compliance_index()
+    assert index.providers_satisfying(["GDPR", "HIPAA", "FedRAMP"]) == ["US Providers"]
+    assert index.providers_satisfying(["GDPR", "HIPAA"], level=PARTIAL) == [
+        "US Providers",
+        "EU Providers",
+    ]
+    assert index.coverage(["ISO 27001", "PCI DSS"]) == {
+        "US Providers": FULL,
+        "EU Providers": FULL,
+        "China Providers": PARTIAL,
+    }
+    with pytest.raises(KeyError):
+        index.satisfies(["SOX"])
+
+
+def test_bitmask_queries_match_brute_force_on_wide_matrices():
+    rng = np.random.default_rng(0)
+    levels = rng.choice([NONE, PARTIAL, FULL], size=(3000, 90), p=[0.1, 0.2, 0.7])
+    index = ComplianceMatrix(
+        [f"P{i}" for i in range(3000)], [f"F{j}" for j in range(90)], levels
+    )
+    for columns in ([0, 5], [63, 64, 89], list(range(0, 90, 17))):
+        names = [f"F{j}" for j in columns]
+        assert np.array_equal(
+            index.satisfies(names), (levels[:, columns] == FULL).all(axis=1)
+        )
+        assert np.array_equal(
+            index.satisfies(names, PARTIAL), (levels[:, columns] >= PARTIAL).all(axis=1)
+        )
+
+
+def test_heatmap_reads_levels_directly():
+    index = compliance_data.get_compliance_index()
+    fig = create_compliance_heatmap.__wrapped__(index)
+    legacy = create_compliance_heatmap.__wrapped__(
+        compliance_data.get_compliance_matrix()
+    )
+    assert np.array_equal(fig.data[0].z, legacy.data[0].z)
+    assert fig.data[0].text[1][1] == "⚠️"
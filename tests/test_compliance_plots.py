@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from src.data import compliance_data
+from src.visualizations.compliance_plots import (
+    MAX_TIMELINE_LABELS,
+    create_certification_timeline,
+)
+
+
+def fleet(providers):
+    return pd.DataFrame(
+        {
+            "Provider": [f"Vendor {i}" for i in range(providers)],
+            "Certifications": [["ISO 27001", "SOC 2"]] * providers,
+            "Risk Score": np.arange(providers) % 40 + 60,
+            "Last Audit": pd.date_range("2024-01-01", periods=providers, freq="D"),
+        }
+    )
+
+
+def test_timeline_uses_one_trace_for_any_fleet_size():
+    small = create_certification_timeline.__wrapped__(
+        compliance_data.get_security_certifications()
+    )
+    assert len(small.data) == 1
+    assert small.data[0].mode == "markers+text"
+    assert small.data[0].hovertext[3] == "Certifications: ISO 27001, SOC 2"
+
+    large = create_certification_timeline.__wrapped__(fleet(MAX_TIMELINE_LABELS + 1))
+    assert len(large.data) == 1
+    assert large.data[0].mode == "markers"
+    assert len(large.data[0].x) == MAX_TIMELINE_LABELS + 1
+
+
+def test_audit_history_adds_two_traces_with_gaps_between_providers():
+    history = compliance_data.get_audit_history(audits_per_provider=4)
+    fig = create_certification_timeline.__wrapped__(
+        compliance_data.get_security_certifications(), history
+    )
+    lines, past, latest = fig.data
+    assert len(past.x) == 5 * 4
+    # Five providers, four audits each, separated by four gaps
+    assert len(lines.y) == 5 * 4 + 4
+    assert sum(y is None for y in lines.y) == 4
+    assert latest.name == "Last audit"
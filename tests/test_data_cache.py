@@ -0,0 +1,59 @@
+import pandas as pd
+from src.data import market_data
+from src.data.cache import DataCache, cached_loader
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hits_misses_and_ttl_expiry():
+    clock = FakeClock()
+    cache = DataCache(clock=clock)
+    calls = []
+
+    @cached_loader(ttl=10, cache=cache)
+    def get_numbers(role="Executive"):
+        calls.append(role)
+        return pd.DataFrame({"x": [1, 2, 3]})
+
+    first = get_numbers("Analyst")
+    assert get_numbers("Analyst") is first
+    get_numbers("Manager")
+    assert calls == ["Analyst", "Manager"]
+
+    clock.now = 11
+    assert get_numbers("Analyst") is not first
+    stats = cache.stats()["get_numbers"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["expired"] == 1
+
+
+def test_lru_eviction_under_byte_budget():
+    cache = DataCache(max_bytes=3000)
+
+    @cached_loader(cache=cache)
+    def get_block(n):
+        return pd.DataFrame({"x": range(100)})
+
+    for n in range(5):
+        get_block(n)
+    assert cache.nbytes <= 3000
+    assert cache.stats()["get_block"]["evictions"] > 0
+    # Most recent entry survives
+    get_block(4)
+    assert cache.stats()["get_block"]["hits"] == 1
+
+
+def test_invalidate_and_real_loaders():
+    market_data.get_market_share_data.invalidate()
+    first = market_data.get_market_share_data("Analyst")
+    assert market_data.get_market_share_data("Analyst") is first
+    market_data.get_market_share_data.invalidate()
+    assert market_data.get_market_share_data("Analyst") is not first
+    assert "raw_data_export" in first
@@ -0,0 +1,100 @@
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from src.components.decision_helper import (
+    BUDGET_LEVELS,
+    COMPLIANCE_FLAGS,
+    INDUSTRIES,
+    RECOMMENDATION_GROUPS,
+    REGIONS,
+    SOVEREIGNTY_OPTIONS,
+    TECH_FLAGS,
+    calculate_recommendation_score,
+    score_profiles,
+)
+
+
+def reference_score(inputs):
+    """The original if-chain implementation of the score model."""
+    weights = {
+        "Tech": (1.0, 0.9, 0.8),
+        "Finance": (1.0, 1.0, 0.6),
+        "Healthcare": (1.0, 0.9, 0.5),
+        "Manufacturing": (0.9, 0.8, 1.0),
+        "AI Research": (1.0, 0.9, 0.9),
+        "Government": (1.0, 0.8, 0.4),
+    }.get(inputs["industry"], (1.0, 0.9, 0.7))
+    us, eu, cn = (w * 100 for w in weights)
+    if inputs["budget_constraint"] == "High":
+        cn, eu = cn + 20, eu + 10
+    elif inputs["budget_constraint"] == "Low":
+        us += 20
+    if inputs["data_sovereignty"] == "Must stay in country":
+        us, cn = us - 20, cn - 40
+        if inputs["region"] == "Europe":
+            eu += 30
+    needs, tech = inputs["compliance_needs"], inputs["tech_requirements"]
+    if needs["GDPR"]:
+        us, eu, cn = us + 20, eu + 30, cn - 20
+    if needs["HIPAA"]:
+        us, eu, cn = us + 30, eu + 10, cn - 20
+    if needs["FedRAMP"]:
+        us, eu, cn = us + 40, eu - 10, cn - 30
+    if tech["AI/ML"]:
+        us, cn = us + 20, cn + 20
+    if tech["Edge Computing"]:
+        us, eu = us + 15, eu + 15
+    if tech["IoT"]:
+        eu, cn = eu + 15, cn + 20
+    top = max(us, eu, cn)
+    scores = [us, eu, cn] if top <= 100 else [v / top * 100 for v in (us, eu, cn)]
+    return dict(zip(RECOMMENDATION_GROUPS, scores))
+
+
+def random_profiles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "industry": rng.choice(INDUSTRIES + ["Retail"], count),
+            "region": rng.choice(REGIONS, count),
+            "budget_constraint": rng.choice(BUDGET_LEVELS, count),
+            "data_sovereignty": rng.choice(SOVEREIGNTY_OPTIONS, count),
+        }
+    )
+    for flag in COMPLIANCE_FLAGS + TECH_FLAGS:
+        frame[flag] = rng.random(count) < 0.5
+    return frame
+
+
+def as_inputs(row):
+    return {
+        "industry": row["industry"],
+        "region": row["region"],
+        "budget_constraint": row["budget_constraint"],
+        "data_sovereignty": row["data_sovereignty"],
+        "compliance_needs": {f: bool(row[f]) for f in COMPLIANCE_FLAGS},
+        "tech_requirements": {f: bool(row[f]) for f in TECH_FLAGS},
+    }
+
+
+def test_batch_and_single_scores_match_reference_model():
+    profiles = random_profiles(2000)
+    batch = score_profiles(profiles)
+    for i, row in profiles.iterrows():
+        expected = reference_score(as_inputs(row))
+        single = calculate_recommendation_score(as_inputs(row))
+        for group in RECOMMENDATION_GROUPS:
+            assert np.isclose(single[group], expected[group])
+            assert np.isclose(batch.at[i, group], expected[group])
+
+
+def test_score_profiles_reads_csv_uploads():
+    csv = (
+        "industry,region,budget_constraint,data_sovereignty,GDPR,FedRAMP\n"
+        "Finance,Europe,Medium,Must stay in country,yes,0\n"
+        "Government,North America,Low,No specific requirements,no,1\n"
+    )
+    scores = score_profiles(pd.read_csv(StringIO(csv)))
+    assert list(scores.idxmax(axis=1)) == ["EU Providers", "US Providers"]
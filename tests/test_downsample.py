@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from src.visualizations.downsample import (
+    downsample_long,
+    lttb_indices,
+    minmax_envelope,
+    target_points,
+)
+from src.visualizations.plots import create_growth_trends_line
+
+
+def reference_lttb(x, y, n_out):
+    """Scalar LTTB over one series using the same bucket edges."""
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    kept = [0]
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            nxt = slice(edges[b + 1], edges[b + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        ax, ay = x[kept[-1]], y[kept[-1]]
+        best, best_area = start, -1.0
+        for i in range(start, stop):
+            area = abs((ax - cx) * (y[i] - ay) - (ax - x[i]) * (cy - ay))
+            if area > best_area:
+                best, best_area = i, area
+        kept.append(best)
+    return kept + [n - 1]
+
+
+def test_lttb_matches_scalar_reference_for_every_column():
+    rng = np.random.default_rng(0)
+    x = np.arange(2000, dtype=float)
+    y = np.cumsum(rng.normal(size=(2000, 3)), axis=0)
+    selected = lttb_indices(x, y, 150)
+    assert selected.shape == (150, 3)
+    for column in range(3):
+        assert selected[:, column].tolist() == reference_lttb(x, y[:, column], 150)
+
+
+def test_short_series_pass_through():
+    assert lttb_indices(np.arange(5), np.arange(5), 10)[:, 0].tolist() == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert target_points(1000, 0.5) == 500
+
+
+def test_envelope_keeps_extremes():
+    y = np.zeros((1000, 2))
+    y[437, 1] = 50
+    starts, lows, highs = minmax_envelope(y, 10)
+    assert len(starts) == 10
+    assert highs[:, 1].max() == 50 and highs[:, 0].max() == 0
+
+
+def test_growth_trend_payload_tracks_chart_width():
+    dates = pd.date_range("2015-01-01", periods=3650, freq="D")
+    rng = np.random.default_rng(1)
+    frame = pd.DataFrame({"Date": dates})
+    for region in ["North America", "Asia Pacific", "Europe"]:
+        frame[region] = np.cumsum(rng.normal(1, 0.2, len(dates)))
+    long = downsample_long(frame, "Date", ["Europe"], 100, "Region", "Growth")
+    assert len(long) == 100 and long["Date"].is_monotonic_increasing
+
+    fig = create_growth_trends_line.__wrapped__(frame, width_px=400)
+    lines = [trace for trace in fig.data if trace.fill is None]
+    bands = [trace for trace in fig.data if trace.fill == "toself"]
+    assert [len(trace.x) for trace in lines] == [200, 200, 200]
+    assert len(bands) == 3
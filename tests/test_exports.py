@@ -0,0 +1,65 @@
+import gzip
+import io
+
+import pandas as pd
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from src.data.exports import export_file, iter_csv_chunks, lazy_export
+from src.data.performance_data import generate_performance_metrics
+
+
+def test_chunked_csv_matches_to_csv():
+    df = generate_performance_metrics(seed=0)
+    chunks = list(iter_csv_chunks(df, chunk_rows=7))
+    assert len(chunks) == 3
+    assert b"".join(chunks).decode() == df.to_csv(index=False)
+    gz = export_file(df, "csv.gz", chunk_rows=7).read()
+    assert gzip.decompress(gz).decode() == df.to_csv(index=False)
+
+
+def test_columnar_exports_round_trip():
+    df = generate_performance_metrics(timestamps=3, seed=1)
+    parquet = pq.read_table(export_file(df, "parquet", chunk_rows=25))
+    assert parquet.num_rows == len(df)
+    pd.testing.assert_frame_equal(parquet.to_pandas(), df)
+    arrow = ipc.open_file(io.BytesIO(export_file(df, "arrow", chunk_rows=25).read()))
+    assert arrow.num_record_batches == 3
+    pd.testing.assert_frame_equal(arrow.read_pandas(), df)
+
+
+def test_lazy_export_defers_building_the_frame():
+    built = []
+
+    def frame():
+        built.append(True)
+        return pd.DataFrame({"Region": ["EU"], "Share": [23]})
+
+    export = lazy_export(frame, index=True)
+    assert built == []
+    assert export().read().decode().splitlines()[1] == "0,EU,23"
+    assert built == [True]
+
+
+def test_columnar_exports_handle_string_list_and_sparse_columns():
+    df = pd.DataFrame(
+        {
+            "Provider": pd.Series(["AWS", "GCP", "Azure", "OVH"], dtype=object),
+            "Certifications": [["ISO 27001"], ["SOC 2", "HIPAA"], [], ["GDPR"]],
+            # All-None in the first chunk, strings later
+            "Notes": pd.Series([None, None, "renewal due", "audited"], dtype=object),
+            "Score": [1.0, 2.0, float("nan"), 4.0],
+        }
+    )
+    for fmt in ["parquet", "arrow"]:
+        data = io.BytesIO(export_file(df, fmt, chunk_rows=2).read())
+        table = (
+            pq.read_table(data) if fmt == "parquet" else ipc.open_file(data).read_all()
+        )
+        assert table.column("Provider").to_pylist() == list(df["Provider"])
+        assert table.column("Certifications").to_pylist()[1] == ["SOC 2", "HIPAA"]
+        assert table.column("Notes").to_pylist() == [
+            None,
+            None,
+            "renewal due",
+            "audited",
+        ]
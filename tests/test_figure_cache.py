@@ -0,0 +1,49 @@
+import json
+import pandas as pd
+import plotly.graph_objects as go
+from src.visualizations.figure_cache import FigureCache, cached_figure, fingerprint
+
+
+def test_fingerprint_tracks_content_not_identity():
+    df = pd.DataFrame({"Provider": ["AWS", "Azure"], "Score": [1.0, 2.0]})
+    assert fingerprint(df) == fingerprint(df.copy())
+    changed = df.copy()
+    changed.loc[1, "Score"] = 2.5
+    assert fingerprint(df) != fingerprint(changed)
+    lists = pd.DataFrame({"Certifications": [["ISO 27001"], ["SOC 2"]]})
+    assert fingerprint(lists) == fingerprint(lists.copy())
+
+
+def test_cached_builder_rebuilds_only_on_new_content():
+    cache = FigureCache()
+    builds = []
+
+    @cached_figure(cache=cache)
+    def create_bars(data, title="Bars"):
+        builds.append(title)
+        return go.Figure(go.Bar(x=data["x"], y=data["y"]), layout={"title": title})
+
+    data = pd.DataFrame({"x": ["a", "b"], "y": [1, 2]})
+    first = create_bars(data)
+    second = create_bars(data.copy())
+    assert builds == ["Bars"]
+    assert json.loads(second.to_json()) == json.loads(first.to_json())
+    # Returned figures are independent copies
+    second.update_layout(title="Changed")
+    assert create_bars(data).layout.title.text == "Bars"
+    create_bars(data, title="Other")
+    stats = cache.stats()["create_bars"]
+    assert stats["hits"] == 2 and stats["misses"] == 2
+
+
+def test_byte_budget_evicts_oldest_figures():
+    cache = FigureCache(max_bytes=4000)
+
+    @cached_figure(cache=cache)
+    def create_line(n):
+        return go.Figure(go.Scatter(y=list(range(100))), layout={"title": str(n)})
+
+    for n in range(10):
+        create_line(n)
+    assert cache.nbytes <= 4000
+    assert cache.stats()["create_line"]["evictions"] > 0
@@ -0,0 +1,51 @@
+import numpy as np
+
+from src.data import compliance_data
+from src.data.residency_index import ResidencyCatalog
+from src.visualizations.compliance_plots import create_data_residency_map
+from src.visualizations.geo import cluster_points
+
+
+def test_small_inputs_are_not_clustered():
+    clusters = cluster_points([1.0, np.nan, 3.0], [4.0, 5.0, 6.0], max_points=10)
+    assert clusters["count"].tolist() == [1, 1]
+    assert clusters["labels"].tolist() == [0, -1, 1]
+
+
+def test_clusters_respect_the_point_budget_and_groups():
+    rng = np.random.default_rng(0)
+    lat, lon = rng.uniform(-60, 70, 50_000), rng.uniform(-180, 180, 50_000)
+    groups = rng.integers(0, 3, 50_000)
+    clusters = cluster_points(lat, lon, groups, max_points=500)
+    assert len(clusters["count"]) <= 500
+    assert clusters["count"].sum() == 50_000
+    # Every point lands in a cluster of its own group
+    assert np.array_equal(clusters["group"][clusters["labels"]], groups)
+
+
+def test_region_coordinates_come_from_the_packaged_table():
+    table = compliance_data.get_region_coordinates()
+    catalog = compliance_data.get_residency_catalog()
+    regions = catalog.region_table()
+    expected = table.set_index("region").loc[regions["region"], "lat"].to_numpy()
+    assert np.array_equal(regions["lat"], expected)
+    assert not np.isnan(regions["lat"]).any()
+
+
+def test_map_payload_is_bounded():
+    rng = np.random.default_rng(1)
+    catalog = ResidencyCatalog()
+    for i in range(5000):
+        catalog.add_region(
+            f"edge-{i}",
+            ["Americas", "EMEA"][i % 2],
+            ["CDN"],
+            ["ISO 27001"],
+            lat=rng.uniform(-50, 60),
+            lon=rng.uniform(-170, 170),
+        )
+    fig = create_data_residency_map.__wrapped__(catalog, max_points=300)
+    markers = sum(len(trace.lat) for trace in fig.data)
+    assert 0 < markers <= 300
+    assert [trace.name for trace in fig.data] == ["Americas", "EMEA"]
+    assert any(" regions near " in text for text in fig.data[0].text)
@@ -0,0 +1,24 @@
+import numpy as np
+from src.data import compliance_data, performance_data
+from src.visualizations.compliance_plots import create_compliance_heatmap
+from src.visualizations.heatmaps import MAX_LABELLED_CELLS, annotated_heatmap
+from src.visualizations.performance_plots import create_latency_heatmap
+
+
+def test_cell_labels_live_on_the_trace():
+    fig = create_latency_heatmap(performance_data.generate_performance_metrics(seed=0))
+    assert len(fig.data) == 1
+    assert not fig.layout.annotations
+    assert fig.data[0].texttemplate == "%{z:.1f}"
+
+    fig = create_compliance_heatmap(compliance_data.get_compliance_matrix())
+    assert not fig.layout.annotations
+    assert fig.data[0].text[0][0] == "✅"
+
+
+def test_large_grids_switch_to_hover_only_values():
+    side = int(np.sqrt(MAX_LABELLED_CELLS)) + 1
+    fig = annotated_heatmap(np.zeros((side, side)), range(side), range(side))
+    assert fig.data[0].texttemplate is None
+    small = annotated_heatmap(np.zeros((3, 3)), range(3), range(3))
+    assert small.data[0].texttemplate == "%{z}"
@@ -0,0 +1,112 @@
+import json
+import types
+import inspect
+
+from src.utils.instrumentation import MetricsStore, instrument_module
+
+
+def make_module():
+    module = types.ModuleType("fake_loaders")
+
+    def get_rows(n=3):
+        return list(range(n))
+
+    def get_total(n=3):
+        return sum(module.get_rows(n))
+
+    def create_chart(rows):
+        return {"points": len(rows)}
+
+    def helper():
+        return None
+
+    for func in (get_rows, get_total, create_chart, helper):
+        func.__module__ = module.__name__
+        setattr(module, func.__name__, func)
+    get_rows.invalidate = lambda: "invalidated"
+    return module
+
+
+def test_instrument_module_times_prefixed_functions_once():
+    store = MetricsStore()
+    module = make_module()
+    original = module.get_rows
+    assert sorted(instrument_module(module, store=store)) == [
+        "create_chart",
+        "get_rows",
+        "get_total",
+    ]
+    assert instrument_module(module, store=store) == []
+    assert inspect.unwrap(module.get_rows) is original
+    assert module.get_rows.invalidate() == "invalidated"
+
+    assert module.get_total(4) == 6
+    rows = {(r["Kind"], r["Name"]): r for r in store.summary()}
+    # Nested calls through the module global are timed too
+    assert rows[("loader", "get_total")]["Calls"] == 1
+    assert rows[("loader", "get_rows")]["Calls"] == 1
+    assert ("section", "helper") not in rows
+
+
+def test_runs_are_bounded_and_broken_down():
+    store = MetricsStore(max_runs=2, max_samples=4)
+    for page in ["Home", "Cost Analysis", "Home"]:
+        token = store.begin_run()
+        with store.timer("sidebar"):
+            pass
+        for _ in range(3):
+            store.record("loader", "get_x", 0.01)
+        store.end_run(token, label=page)
+    store.record("loader", "get_x", 0.5)  # outside any run
+
+    assert [run["label"] for run in store.runs] == ["Cost Analysis", "Home"]
+    breakdown = {row["Name"]: row for row in store.run_breakdown()}
+    assert breakdown["get_x"]["Calls"] == 3
+    assert abs(breakdown["get_x"]["Total (ms)"] - 30) < 1e-6
+
+    summary = {row["Name"]: row for row in store.summary()}
+    assert summary["get_x"]["Calls"] == 10 and summary["get_x"]["Max (ms)"] == 500
+    assert summary["Home"]["Calls"] == 2
+    assert json.loads(store.to_json())["runs"][-1]["label"] == "Home"
+
+
+def test_prometheus_export(tmp_path):
+    store = MetricsStore()
+    for seconds in (0.1, 0.2, 0.3):
+        store.record("builder", 'create_"quoted"', seconds)
+    text = store.to_prometheus()
+    assert "# TYPE dashboard_call_seconds summary" in text
+    labels = 'kind="builder",name="create_\\"quoted\\""'
+    assert f'dashboard_call_seconds{{{labels},quantile="0.5"}} 0.200000' in text
+    assert f"dashboard_call_seconds_count{{{labels}}} 3" in text
+    assert f"dashboard_call_seconds_max{{{labels}}} 0.300000" in text
+
+    path = store.write(str(tmp_path / "metrics.prom"))
+    assert open(path).read() == text
+    store.write(str(tmp_path / "metrics.json"))
+    assert json.load(open(tmp_path / "metrics.json"))["series"][0]["Calls"] == 3
+
+
+def test_nested_calls_record_self_time(monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(
+        "src.utils.instrumentation.time.perf_counter", lambda: next(clock)
+    )
+    store = MetricsStore()
+    module = make_module()
+    instrument_module(module, store=store)
+
+    token = store.begin_run()  # clock 0
+    with store.timer("page"):  # 1
+        module.get_total(2)  # 2, get_rows 3-4, returns at 5
+    store.end_run(token)  # page ends at 6, run at 7
+
+    breakdown = {row["Name"]: row for row in store.run_breakdown()}
+    assert breakdown["page"]["Total (ms)"] == 5000
+    assert breakdown["page"]["Self (ms)"] == 2000
+    assert breakdown["get_total"]["Total (ms)"] == 3000
+    assert breakdown["get_total"]["Self (ms)"] == 2000
+    assert breakdown["get_rows"]["Self (ms)"] == 1000
+    assert abs(sum(r["Share of run"] for r in breakdown.values()) - 5 / 7) < 1e-9
+    summary = {row["Name"]: row for row in store.summary()}
+    assert summary["get_total"]["Self (ms)"] == 2000
@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.data import market_data
+
+
+def test_role_views_project_the_canonical_arrays():
+    dataset = market_data.get_market_dataset()
+    share = dataset["share"]["Market Share (%)"].to_numpy()
+    growth = dataset["growth"]["North America"].to_numpy()
+    for role in ["Executive", "Manager", "Analyst"]:
+        view = market_data.get_market_share_data.__wrapped__(role)
+        assert view["dataset_version"] == market_data.MARKET_DATA_VERSION
+        assert np.shares_memory(view["data"]["Market Share (%)"].to_numpy(), share)
+        trends = market_data.get_growth_trends_data.__wrapped__(role)["data"]
+        assert np.shares_memory(trends["North America"].to_numpy(), growth)
+
+    executive = market_data.get_market_share_data.__wrapped__("Executive")["data"]
+    assert list(executive["Provider"]) == ["AWS", "Azure", "Google Cloud"]
+    manager = market_data.get_market_share_data.__wrapped__("Manager")
+    assert "Region" in manager["data"] and len(manager["data"]) == 10
+    assert (
+        manager["provider_comparison"]["North America"] == 32 + 22 + 11 + 2.5 + 2 + 1.5
+    )
+
+    regional = market_data.get_regional_metrics.__wrapped__("Manager")["data"]
+    assert list(regional) == ["North America", "Asia Pacific"]
+    assert regional["Asia Pacific"] is dataset["regional"]["Asia Pacific"]
+
+
+def test_growth_trends_are_reproducible():
+    first = market_data.get_market_dataset.__wrapped__()["growth"]
+    second = market_data.get_market_dataset.__wrapped__()["growth"]
+    assert first.equals(second)
+    other = market_data.get_market_dataset.__wrapped__(seed=7)["growth"]
+    assert not first.equals(other)
+    assert list(first.columns) == ["Date", *market_data.GROWTH_REGIONS]
+
+
+def test_writes_to_a_role_view_leave_the_dataset_untouched():
+    dataset = market_data.get_market_dataset()
+    before = dataset["share"]["Market Share (%)"].copy()
+    view = market_data.get_market_share_data.__wrapped__("Executive")["data"]
+    view.loc[view.index[0], "Market Share (%)"] = 99.0
+    assert dataset["share"]["Market Share (%)"].equals(before)
@@ -0,0 +1,49 @@
+import sys
+from src.page_registry import PageRegistry
+
+
+def test_page_modules_load_once_on_first_render():
+    registry = PageRegistry()
+    sys.modules.pop("colorsys", None)
+    calls = []
+
+    @registry.page("Colors", modules=["colorsys"])
+    def render_colors(value):
+        calls.append(value)
+        return value * 2
+
+    assert "colorsys" not in sys.modules
+    assert registry.render("Colors", 2) == 4
+    assert "colorsys" in sys.modules
+    page = registry.pages["Colors"]
+    assert page.loaded and "colorsys" in page.new_modules
+    first_import = page.import_seconds
+    registry.render("Colors", 3)
+    assert page.import_seconds == first_import
+    assert calls == [2, 3]
+
+
+def test_report_lists_startup_and_opened_pages():
+    registry = PageRegistry()
+    registry.page("Opened", modules=["json"])(lambda: None)
+    registry.page("Unopened", modules=["csv"])(lambda: None)
+    registry.record_startup("app imports", 0.25)
+    registry.render("Opened")
+    phases = [row["Phase"] for row in registry.report()]
+    assert phases == ["app imports", "page: Opened"]
+
+
+def test_reregistering_keeps_load_stats_and_first_startup():
+    registry = PageRegistry()
+    registry.page("Home", modules=["json"])(lambda: "old")
+    registry.render("Home")
+    page = registry.pages["Home"]
+    registry.record_startup("app imports", 0.4)
+
+    # What a Streamlit rerun of the app script does
+    registry.page("Home", modules=["json"])(lambda: "new")
+    registry.record_startup("app imports", 0.0004)
+    assert registry.pages["Home"] is page and page.loaded
+    assert registry.render("Home") == "new"
+    assert registry.startup["app imports"] == 0.4
+    assert [row["Phase"] for row in registry.report()] == ["app imports", "page: Home"]
@@ -1,4 +1,10 @@
+import threading
 import unittest
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
 from src.data import performance_data
 
 def test_get_performance_metrics():
@@ -12,3 +18,154 @@ def test_calculate_tco():
     assert not df.empty
     assert "Provider" in df.columns
     assert "3-Year TCO" in df.columns
+
+
+def reference_tco(workload_profile):
+    """The original per-provider loop of ``calculate_tco``."""
+    base_costs = {
+        "AWS": {"compute": 100, "storage": 50, "network": 30, "support": 20},
+        "Azure": {"compute": 98, "storage": 52, "network": 28, "support": 22},
+        "GCP": {"compute": 95, "storage": 48, "network": 32, "support": 25},
+        "Alibaba": {"compute": 85, "storage": 45, "network": 25, "support": 15},
+        "Tencent": {"compute": 82, "storage": 43, "network": 23, "support": 12},
+    }
+    tco_data = []
+    for provider, costs in base_costs.items():
+        monthly_cost = sum(
+            cost * workload_profile.get(category, 1) for category, cost in costs.items()
+        )
+        tco_data.append(
+            {
+                "Provider": provider,
+                "Monthly Cost": monthly_cost,
+                "Yearly Cost": monthly_cost * 12,
+                "3-Year TCO": monthly_cost * 12 * 3,
+            }
+        )
+    df = pd.DataFrame(tco_data)
+    max_tco = df["3-Year TCO"].max()
+    df["Savings vs. Highest"] = ((max_tco - df["3-Year TCO"]) / max_tco * 100).round(2)
+    return df
+
+
+def test_calculate_tco_batch_matches_reference_loop():
+    profiles = [
+        {},
+        {"compute": 2, "storage": 3},
+        {"compute": 2.5, "storage": 0.5, "network": 3, "support": 1.5},
+        {"compute": 5, "storage": 5, "network": 0.5, "support": 0.5},
+    ]
+    batch = performance_data.calculate_tco_batch(
+        [[p.get(c, 1) for c in performance_data.TCO_CATEGORIES] for p in profiles]
+    )
+    assert batch.shape == (len(profiles), len(performance_data.TCO_PROVIDERS), 4)
+    for row, profile in zip(batch, profiles):
+        expected = reference_tco(profile)
+        assert list(expected["Provider"]) == performance_data.TCO_PROVIDERS
+        np.testing.assert_allclose(
+            row, expected[performance_data.TCO_COLUMNS].to_numpy(dtype=float)
+        )
+        # Dtypes too: integer factors keep the original int64 cost columns
+        pd.testing.assert_frame_equal(performance_data.calculate_tco(profile), expected)
+    # Cheapest provider saves the most versus the most expensive one
+    assert batch[0, :, 3].max() > 0 and batch[0, :, 3].min() == 0
+
+
+def test_generate_performance_metrics_is_seeded_and_sized():
+    df = performance_data.generate_performance_metrics(8, 6, 24, seed=7)
+    assert len(df) == 8 * 6 * 24
+    assert df["Provider"].nunique() == 8 and df["Region"].nunique() == 6
+    assert df["Timestamp"].is_monotonic_increasing
+    again = performance_data.generate_performance_metrics(8, 6, 24, seed=7)
+    assert df.equals(again)
+    assert not df.equals(performance_data.generate_performance_metrics(8, 6, 24, seed=8))
+
+
+def test_iter_performance_metrics_chunks_whole_timestamps():
+    chunks = list(
+        performance_data.iter_performance_metrics(5, 4, 100, seed=1, chunk_rows=200)
+    )
+    assert len(chunks) == 10
+    assert all(len(chunk) == 200 for chunk in chunks)
+    assert chunks[0]["Timestamp"].nunique() == 10
+
+
+def test_simulate_tco_bands_and_cheapest_share():
+    from src.visualizations.performance_plots import create_tco_analysis
+
+    profile = {"compute": 2, "storage": 1, "network": 1, "support": 0.5}
+    bands = performance_data.simulate_tco(profile, 100_000, seed=3, chunk_size=30_000)
+    assert list(bands["Provider"]) == performance_data.TCO_PROVIDERS
+    for label in ["Monthly", "3-Year"]:
+        assert (bands[f"{label} P10"] < bands[f"{label} P50"]).all()
+        assert (bands[f"{label} P50"] < bands[f"{label} P90"]).all()
+    assert abs(bands["Cheapest (%)"].sum() - 100) < 0.5
+    # Medians sit near the deterministic monthly cost
+    tco = performance_data.calculate_tco(profile)
+    np.testing.assert_allclose(bands["Monthly P50"], tco["Monthly Cost"], rtol=0.03)
+
+    again = performance_data.simulate_tco(profile, 100_000, seed=3, chunk_size=30_000)
+    assert bands.equals(again)
+
+    fig = create_tco_analysis(tco, bands)
+    monthly = fig.data[0]
+    assert monthly.error_y.array[0] > 0 and monthly.error_y.arrayminus[0] > 0
+    assert fig.data[1].error_y.array is None
+    assert create_tco_analysis(tco).data[0].error_y.array is None
+
+
+def test_simulate_tco_streams_scenarios_in_bounded_memory():
+    profile = {"compute": 2, "storage": 1, "network": 1, "support": 0.5}
+    factors = np.array([profile[c] for c in performance_data.TCO_CATEGORIES], float)
+    # Exact percentiles of the very draws the streamed run folds in
+    chunks = list(performance_data._iter_tco_chunks(factors, 200_000, 5, 4_000))
+    streamed = performance_data.simulate_tco(profile, 200_000, seed=5, chunk_size=4_000)
+    for label, values in zip(["Monthly", "3-Year"], zip(*chunks)):
+        exact = np.percentile(np.concatenate(values), (10, 50, 90), axis=0)
+        columns = [f"{label} P{p}" for p in (10, 50, 90)]
+        np.testing.assert_allclose(streamed[columns].to_numpy().T, exact, rtol=1e-4)
+    cheapest = np.bincount(
+        np.concatenate([tco for _, tco in chunks]).argmin(axis=1), minlength=5
+    )
+    np.testing.assert_allclose(streamed["Cheapest (%)"], cheapest / 2_000, atol=0.05)
+
+    # Fitting in one chunk takes the exact path
+    single = performance_data.simulate_tco(profile, 4_000, seed=5, chunk_size=4_000)
+    exact = np.percentile(chunks[0][0], (10, 50, 90), axis=0)
+    np.testing.assert_allclose(
+        single[["Monthly P10", "Monthly P50", "Monthly P90"]].to_numpy().T,
+        exact,
+        atol=0.005,
+    )
+
+    tracemalloc.start()
+    try:
+        performance_data.simulate_tco(profile, 2_000_000, seed=0, chunk_size=10_000)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # Keeping every scenario would take 2 x 5 x 2M float32 = 80 MB
+    assert peak < 16 * 1024 * 1024
+
+
+def test_performance_history_seeds_in_the_background(tmp_path, monkeypatch):
+    path = str(tmp_path / "performance")
+    release = threading.Event()
+    build_store = performance_data.build_store
+
+    def held_build_store(*args):
+        release.wait(timeout=60)
+        return build_store(*args)
+
+    monkeypatch.setattr(performance_data, "build_store", held_build_store)
+    thread = performance_data.seed_performance_store(path, history_years=1)
+    # Pages get an empty frame instead of waiting for the seed
+    empty = performance_data.get_performance_history(path=path)
+    assert empty.empty and "Samples" in empty.columns
+    assert performance_data.seed_performance_store(path) is thread
+    release.set()
+    thread.join(timeout=60)
+    assert performance_data.seed_performance_store(path) is None
+
+    history = performance_data.get_performance_history(path=path)
+    assert len(history) == 20 and history["Samples"].min() >= 24 * 365
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.components.decision_helper import (
+    COMPLIANCE_FLAGS,
+    RECOMMENDATION_GROUPS,
+    TECH_FLAGS,
+    calculate_recommendation_score,
+)
+from src.components.recommendation_index import (
+    INDEX_SIZE,
+    _RADICES,
+    decode_keys,
+    profile_key,
+    recommendation_index,
+)
+
+
+def inputs(industry="Finance", region="Europe", checked=(), **fields):
+    return {
+        "industry": industry,
+        "region": region,
+        "budget_constraint": fields.get("budget_constraint", "Medium"),
+        "data_sovereignty": fields.get("data_sovereignty", "Must stay in country"),
+        "compliance_needs": {f: f in checked for f in COMPLIANCE_FLAGS},
+        "tech_requirements": {f: f in checked for f in TECH_FLAGS},
+    }
+
+
+def test_index_covers_input_space_and_keys_round_trip():
+    assert INDEX_SIZE == 7 * 4 * 3 * 3 * 2**12
+    key = profile_key(inputs(checked=("GDPR", "IoT")))
+    codes, flags = decode_keys([key])
+    assert codes["industry"][0] == 1 and codes["region"][0] == 1
+    assert flags[0].nonzero()[0].tolist() == [0, 10]
+    with pytest.raises(KeyError):
+        profile_key(inputs(region="Antarctica"))
+
+
+def test_lookup_matches_scoring_model():
+    index = recommendation_index()
+    rng = np.random.default_rng(1)
+    for key in rng.integers(0, INDEX_SIZE, 200):
+        codes, flags = decode_keys([key])
+        assert profile_key(_inputs_for(codes, flags[0])) == key
+        expected = calculate_recommendation_score(_inputs_for(codes, flags[0]))
+        looked_up = index.lookup(_inputs_for(codes, flags[0]))
+        for group in RECOMMENDATION_GROUPS:
+            assert looked_up[group] == pytest.approx(expected[group], rel=1e-6)
+    # Labels outside the form still score through the model
+    assert index.lookup(inputs(region="Antarctica"))["EU Providers"] > 0
+
+
+def _inputs_for(codes, flags):
+    profile = {field: values[codes[field][0]] for field, values in _RADICES}
+    checked = [name for name, on in zip(COMPLIANCE_FLAGS + TECH_FLAGS, flags) if on]
+    return inputs(checked=checked, **profile)
+
+
+def test_win_fractions_count_top_groups():
+    index = recommendation_index()
+    overall = index.win_fractions()
+    assert sum(overall.values()) == pytest.approx(1.0)
+    # FedRAMP strongly favours US providers
+    fedramp = index.win_fractions(requirements={"FedRAMP": True})
+    assert fedramp["US Providers"] > overall["US Providers"]
+    finance_gdpr = index.win_fractions(industry="Finance", requirements={"GDPR": True})
+    keys = np.arange(INDEX_SIZE)
+    # Industry is the most significant digit (4 * 3 * 3 = 36) and GDPR is bit 0
+    subset = index.winners[((keys >> 12) // 36 == 1) & (keys & 1 == 1)]
+    expected = np.bincount(subset, minlength=3) / len(subset)
+    assert list(finance_gdpr.values()) == pytest.approx(expected.tolist())
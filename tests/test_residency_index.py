@@ -0,0 +1,57 @@
+import numpy as np
+
+from src.data import compliance_data
+from src.data.residency_index import ResidencyCatalog
+from src.visualizations.compliance_plots import create_data_residency_map
+
+
+def test_catalog_answers_lookups_in_every_direction():
+    catalog = compliance_data.get_residency_catalog()
+    assert catalog.providers_in("eu-west") == ["AWS", "Azure", "GCP", "OVHcloud"]
+    assert catalog.frameworks_in("ap-east") == ["APEC PRP", "ISO 27001"]
+    assert catalog.regions_for(providers="OVHcloud") == [
+        "eu-west",
+        "eu-central",
+        "eu-north",
+    ]
+    assert catalog.regions_for(frameworks="HIPAA", providers=["AWS", "GCP"]) == [
+        "us-east",
+        "us-west",
+        "ca-central",
+    ]
+    assert catalog.regions_for(providers="Alibaba", frameworks="GDPR") == []
+    assert catalog.providers_for(frameworks="GDPR") == [
+        "AWS",
+        "Azure",
+        "GCP",
+        "OVHcloud",
+    ]
+    assert catalog.regions_for(providers="Unknown") == []
+
+
+def test_queries_match_brute_force_on_large_catalogs():
+    rng = np.random.default_rng(0)
+    catalog = ResidencyCatalog()
+    placements = {}
+    for r in range(3000):
+        providers = set(rng.choice(20, rng.integers(1, 6), replace=False))
+        frameworks = set(rng.choice(5, rng.integers(1, 3), replace=False))
+        placements[f"r{r}"] = (providers, frameworks)
+        catalog.add_region(f"r{r}", f"c{r % 4}", providers, frameworks)
+    expected = [
+        name
+        for name, (providers, frameworks) in placements.items()
+        if {3, 7} <= providers and 2 in frameworks
+    ]
+    assert catalog.regions_for(providers=[3, 7], frameworks=[2]) == expected
+
+
+def test_map_builder_uses_grouped_coordinates():
+    catalog = compliance_data.get_residency_catalog()
+    groups = catalog.grouped_coordinates(frameworks="ISO 27001")
+    assert list(groups) == ["Europe", "Asia"]
+    fig = create_data_residency_map(catalog)
+    assert [trace.name for trace in fig.data] == list(catalog.continents)
+    europe = fig.data[1]
+    assert list(europe.lat) == [53.3, 50.1, 59.3]
+    assert europe.text[0] == "eu-west<br>Providers: 4<br>Compliance: 2"
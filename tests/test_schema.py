@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from src.data import ingest, performance_data, schema
+from src.visualizations.performance_plots import _group_means
+
+
+def test_compact_frame_assigns_schema_dtypes():
+    frame = pd.DataFrame(
+        {
+            "Provider": ["AWS", "GCP"] * 3,
+            "Service": [f"svc-{i}" for i in range(6)],
+            "Latency (ms)": np.linspace(10, 60, 6).round(2),
+            "IOPS": [9000, 70000, 10, 11, 12, 13],
+            "Risk Score": [95, 94, 93, 85, 84, 90],
+            "Uptime (%)": [99.95] * 6,
+        }
+    )
+    compact = schema.compact_frame(frame)
+    assert isinstance(compact["Provider"].dtype, pd.CategoricalDtype)
+    # Unique labels are cheaper as plain strings
+    assert compact["Service"].dtype == frame["Service"].dtype
+    assert compact["Latency (ms)"].dtype == np.float32
+    assert str(compact["IOPS"].dtype) == "Int32"
+    assert str(compact["Risk Score"].dtype) == "Int8"
+    assert compact["Uptime (%)"].dtype == np.float64
+    assert schema.column_dtypes(compact) == {}
+
+    # Integer columns widen to hold their values
+    wide = schema.compact_frame(pd.DataFrame({"Risk Score": [1, 300]}))
+    assert str(wide["Risk Score"].dtype) == "Int16"
+    assert list(schema.to_float64(compact["Latency (ms)"])) == list(
+        frame["Latency (ms)"]
+    )
+
+
+def test_memory_report_and_loaders():
+    report = schema.memory_report(ingest.DATASETS).set_index("Dataset")
+    assert (report["After (bytes)"] <= report["Before (bytes)"]).all()
+    assert report.loc["get_audit_history", "Saved (%)"] > 30
+
+    metrics = performance_data.get_performance_metrics.__wrapped__()
+    assert metrics["Latency (ms)"].dtype == np.float32
+    assert str(metrics["IOPS"].dtype) == "Int32"
+
+
+def test_group_means_match_groupby():
+    frame = performance_data.generate_performance_metrics(6, 5, 20, seed=1)
+    frame.loc[3, "Latency (ms)"] = np.nan
+    for data in (frame, schema.compact_frame(frame)):
+        expected = data.groupby(["Provider", "Region"], observed=True)[
+            ["Latency (ms)", "IOPS"]
+        ].mean()
+        result = _group_means(data, ["Provider", "Region"], ["Latency (ms)", "IOPS"])
+        assert list(result.index) == list(expected.index)
+        assert np.allclose(result.to_numpy(), expected.to_numpy(dtype=float))
+
+
+def test_unwrap_stops_at_the_compaction_layer():
+    import inspect
+
+    loader = performance_data.get_cost_analysis
+    assert not schema.is_compacting(loader)
+    compacting = inspect.unwrap(loader, stop=schema.is_compacting)
+    assert schema.is_compacting(compacting)
+    assert not hasattr(compacting, "invalidate")
+    assert not hasattr(compacting.__wrapped__, "compact_options")
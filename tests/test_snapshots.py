@@ -0,0 +1,91 @@
+import os
+
+import pandas as pd
+
+from src.data import compliance_data, ingest, performance_data, snapshots
+from src.data.snapshots import latest_snapshot, publish_snapshot
+
+
+def test_publish_is_versioned_and_prunes_old_snapshots(tmp_path):
+    frame = pd.DataFrame({"a": [1.5, 2.5], "b": ["x", "y"]})
+    with_lists = pd.DataFrame({"certs": [["ISO"], ["SOC 2", "ISO"]]})
+    first = publish_snapshot({"frame": frame}, root=str(tmp_path), keep=2)
+    publish_snapshot({"frame": frame}, root=str(tmp_path), keep=2)
+    third = publish_snapshot(
+        {"frame": frame, "lists": with_lists, "dict": {"k": 1}},
+        root=str(tmp_path),
+        keep=2,
+    )
+    assert first.startswith("v000001-") and third.startswith("v000003-")
+    assert sorted(p for p in os.listdir(tmp_path) if p.startswith("v"))[0][:7] == (
+        "v000002"
+    )
+
+    snapshot = latest_snapshot(str(tmp_path))
+    assert snapshot.version == third
+    assert snapshot.manifest["datasets"]["frame"]["format"] == "arrow"
+    assert snapshot.manifest["datasets"]["lists"]["format"] == "pickle"
+    pd.testing.assert_frame_equal(snapshot.load("frame"), frame)
+    assert snapshot.load("lists")["certs"][1] == ["SOC 2", "ISO"]
+    assert snapshot.load("dict") == {"k": 1}
+
+
+def test_loaders_read_the_latest_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", str(tmp_path))
+    loader = performance_data.get_sla_comparisons
+    loader.invalidate()
+    assert latest_snapshot() is None
+    computed = loader()
+
+    stale = computed.assign(AWS=0.0)
+    publish_snapshot({"get_sla_comparisons()": stale}, root=str(tmp_path))
+    loader.invalidate()
+    try:
+        assert loader()["AWS"].eq(0.0).all()
+    finally:
+        loader.invalidate()
+
+
+def test_unreadable_snapshot_falls_back_with_a_warning(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", str(tmp_path))
+    loader = performance_data.get_sla_comparisons
+    version = publish_snapshot(
+        {"get_sla_comparisons()": loader.__wrapped__().assign(AWS=0.0)},
+        root=str(tmp_path),
+    )
+    entry = latest_snapshot().manifest["datasets"]["get_sla_comparisons()"]
+    with open(tmp_path / version / entry["file"], "wb") as f:
+        f.write(b"not an arrow file")
+    loader.invalidate()
+    try:
+        with caplog.at_level("WARNING", logger=snapshots.logger.name):
+            assert not loader()["AWS"].eq(0.0).all()
+    finally:
+        loader.invalidate()
+    assert (
+        f"failed to read get_sla_comparisons() from snapshot {version}" in caplog.text
+    )
+
+
+def test_refresh_builds_datasets_in_a_process_pool(tmp_path):
+    version = ingest.refresh(
+        root=str(tmp_path),
+        workers=2,
+        datasets=[
+            (compliance_data.get_compliance_index, [()]),
+            (compliance_data.get_audit_history, [(), (4,)]),
+        ],
+        refresh_store=False,
+    )
+    snapshot = latest_snapshot(str(tmp_path))
+    assert snapshot.version == version
+    assert snapshot.keys == [
+        "get_compliance_index()",
+        "get_audit_history(audits_per_provider=12, seed=42)",
+        "get_audit_history(audits_per_provider=4, seed=42)",
+    ]
+    history = snapshot.load("get_audit_history(audits_per_provider=4, seed=42)")
+    assert len(history) == 5 * 4
+    index = snapshot.load("get_compliance_index()")
+    assert index.providers_satisfying(["FedRAMP"]) == ["US Providers"]
+    assert snapshot.manifest["errors"] == {}
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data.performance_data import (
+    iter_performance_metrics,
+    refresh_performance_store,
+)
+from src.data.timeseries_store import PerformanceStore, build_store
+
+
+def make_store(path, hours=48):
+    return build_store(
+        str(path / "perf"),
+        iter_performance_metrics(timestamps=hours, seed=3, chunk_rows=200),
+    )
+
+
+def test_query_binary_searches_time_window(tmp_path):
+    store = make_store(tmp_path)
+    assert len(store) == 48 * 20
+    window = store.query("2025-01-01 10:00", "2025-01-01 11:00")
+    assert isinstance(window["Latency (ms)"], np.memmap)
+    assert len(window["Timestamp"]) == 2 * 20
+    frame = store.to_frame("2025-01-01 10:00", "2025-01-01 11:00")
+    assert frame["Timestamp"].min() == pd.Timestamp("2025-01-01 10:00")
+    assert list(frame["Provider"].cat.categories) == store.providers
+
+
+def test_summarize_matches_pandas_groupby(tmp_path):
+    store = make_store(tmp_path)
+    summary = store.summarize("2025-01-01", "2025-01-01 23:00")
+    expected = (
+        store.to_frame("2025-01-01", "2025-01-01 23:00")
+        .groupby(["Provider", "Region"], observed=True)["Latency (ms)"]
+        .mean()
+        .to_numpy()
+    )
+    np.testing.assert_allclose(summary["Latency (ms)"], expected, atol=0.01)
+    assert (summary["Samples"] == 24).all()
+
+
+def test_append_rejects_out_of_order_samples(tmp_path):
+    store = make_store(tmp_path)
+    early = next(iter_performance_metrics(timestamps=1, start="2024-01-01"))
+    with pytest.raises(ValueError):
+        store.append(early)
+    late = next(iter_performance_metrics(timestamps=1, start="2025-02-01"))
+    store.append(late)
+    assert PerformanceStore(store.path).time_bounds()[1] == pd.Timestamp("2025-02-01")
+
+
+def test_refresh_appends_hours_since_the_end_of_the_store(tmp_path):
+    store = make_store(tmp_path)
+    path = str(tmp_path / "perf")
+    added = refresh_performance_store(path, now="2025-01-03 05:30")
+    assert added == 6 * 20
+    store.reload()
+    assert store.time_bounds()[1] == pd.Timestamp("2025-01-03 05:00")
+    assert refresh_performance_store(path, now="2025-01-03 05:59") == 0
+
+
+def test_append_discards_uncommitted_bytes_and_serializes_writers(tmp_path):
+    import os
+    import threading
+
+    store = make_store(tmp_path, hours=2)
+    # An append that died after writing one column but before committing
+    with open(os.path.join(store.path, "latency.bin"), "ab") as f:
+        f.write(np.zeros(7).tobytes())
+    chunk = next(iter_performance_metrics(timestamps=1, start="2025-02-01", seed=5))
+    store.append(chunk)
+    tail = PerformanceStore(store.path).to_frame("2025-02-01")
+    np.testing.assert_array_equal(tail["Latency (ms)"], chunk["Latency (ms)"])
+
+    # Writers sharing the directory must not interleave their columns
+    stores = [PerformanceStore(store.path) for _ in range(4)]
+    threads = [
+        threading.Thread(target=lambda s=s: [s.append(chunk) for _ in range(5)])
+        for s in stores
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result = PerformanceStore(store.path)
+    assert len(result) == 2 * 20 + 21 * len(chunk)
+    latest = result.to_frame("2025-02-01")
+    np.testing.assert_array_equal(
+        latest["Latency (ms)"], np.tile(chunk["Latency (ms)"], 21)
+    )